@@ -0,0 +1,84 @@
+-- Per-stream rollups for the data lake
+-- Maintains object/record/byte totals per (source, stream) so lake and
+-- usage summaries read one row per stream instead of re-scanning
+-- every archived object.
+
+--------------------------------------------------------------------------------
+-- ELT: STREAM ROLLUPS
+--------------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS elt_stream_rollups (
+    source_connection_id TEXT NOT NULL REFERENCES elt_source_connections(id) ON DELETE CASCADE,
+    stream_name TEXT NOT NULL,
+    object_count INTEGER NOT NULL DEFAULT 0,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    earliest_at TEXT,
+    latest_at TEXT,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (source_connection_id, stream_name)
+);
+
+-- Backfill from existing objects
+INSERT OR IGNORE INTO elt_stream_rollups
+    (source_connection_id, stream_name, object_count, record_count, size_bytes, earliest_at, latest_at)
+SELECT
+    source_connection_id,
+    stream_name,
+    COUNT(*),
+    COALESCE(SUM(record_count), 0),
+    COALESCE(SUM(size_bytes), 0),
+    MIN(min_timestamp),
+    MAX(max_timestamp)
+FROM elt_stream_objects
+GROUP BY source_connection_id, stream_name;
+
+-- New objects only ever widen a stream, so inserts fold in incrementally
+CREATE TRIGGER IF NOT EXISTS elt_stream_objects_rollup_insert
+    AFTER INSERT ON elt_stream_objects
+    FOR EACH ROW
+BEGIN
+    INSERT INTO elt_stream_rollups
+        (source_connection_id, stream_name, object_count, record_count, size_bytes, earliest_at, latest_at)
+    VALUES
+        (NEW.source_connection_id, NEW.stream_name, 1, NEW.record_count, NEW.size_bytes, NEW.min_timestamp, NEW.max_timestamp)
+    ON CONFLICT (source_connection_id, stream_name) DO UPDATE SET
+        object_count = object_count + 1,
+        record_count = record_count + excluded.record_count,
+        size_bytes = size_bytes + excluded.size_bytes,
+        earliest_at = CASE
+            WHEN earliest_at IS NULL OR excluded.earliest_at < earliest_at THEN COALESCE(excluded.earliest_at, earliest_at)
+            ELSE earliest_at
+        END,
+        latest_at = CASE
+            WHEN latest_at IS NULL OR excluded.latest_at > latest_at THEN COALESCE(excluded.latest_at, latest_at)
+            ELSE latest_at
+        END,
+        updated_at = datetime('now');
+END;
+
+-- Deletes can shrink the time range, so recompute the affected stream
+-- (cheap: served by idx_elt_stream_objects_timestamp_range)
+CREATE TRIGGER IF NOT EXISTS elt_stream_objects_rollup_delete
+    AFTER DELETE ON elt_stream_objects
+    FOR EACH ROW
+BEGIN
+    UPDATE elt_stream_rollups SET
+        object_count = (SELECT COUNT(*) FROM elt_stream_objects
+            WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name),
+        record_count = (SELECT COALESCE(SUM(record_count), 0) FROM elt_stream_objects
+            WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name),
+        size_bytes = (SELECT COALESCE(SUM(size_bytes), 0) FROM elt_stream_objects
+            WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name),
+        earliest_at = (SELECT MIN(min_timestamp) FROM elt_stream_objects
+            WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name),
+        latest_at = (SELECT MAX(max_timestamp) FROM elt_stream_objects
+            WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name),
+        updated_at = datetime('now')
+    WHERE source_connection_id = OLD.source_connection_id AND stream_name = OLD.stream_name;
+
+    DELETE FROM elt_stream_rollups
+    WHERE source_connection_id = OLD.source_connection_id
+      AND stream_name = OLD.stream_name
+      AND object_count = 0;
+END;
@@ -0,0 +1,16 @@
+-- Covering indexes for hot job lookups
+-- SQLite has no INCLUDE clause; trailing key columns let these lookups
+-- be answered from the index alone without visiting elt_jobs rows.
+
+--------------------------------------------------------------------------------
+-- ELT: JOBS
+--------------------------------------------------------------------------------
+
+-- has_active_sync_job: checked before every scheduled and manual sync
+CREATE INDEX IF NOT EXISTS idx_elt_jobs_active_sync
+    ON elt_jobs(source_connection_id, stream_name, job_type, status)
+    WHERE status IN ('pending', 'running');
+
+-- Source status: latest job status/duration and last successful completion
+CREATE INDEX IF NOT EXISTS idx_elt_jobs_source_started
+    ON elt_jobs(source_connection_id, started_at DESC, status, completed_at, job_type);
@@ -0,0 +1,24 @@
+-- Time-ordered indexes for append-only ELT tables
+-- Stream objects and jobs are only ever appended in created_at order, and
+-- their listings read the newest N rows. Without an index each listing
+-- sorts the whole table; with one it walks the tail of the index.
+
+--------------------------------------------------------------------------------
+-- ELT: STREAM OBJECTS
+--------------------------------------------------------------------------------
+
+CREATE INDEX IF NOT EXISTS idx_elt_stream_objects_created
+    ON elt_stream_objects(created_at DESC);
+
+--------------------------------------------------------------------------------
+-- ELT: JOBS
+--------------------------------------------------------------------------------
+
+CREATE INDEX IF NOT EXISTS idx_elt_jobs_created
+    ON elt_jobs(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_elt_jobs_stream_history
+    ON elt_jobs(source_connection_id, stream_name, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_elt_jobs_failed_completed
+    ON elt_jobs(completed_at DESC) WHERE status = 'failed';
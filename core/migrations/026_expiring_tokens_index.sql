@@ -0,0 +1,13 @@
+-- Partial index for the proactive OAuth token refresh
+-- The scheduler looks for refreshable tokens that expire soon every minute.
+-- Only active OAuth connections with a refresh token qualify, so the index
+-- holds just those rows, ordered by expiry, and each pass reads the due
+-- prefix instead of scanning every source connection.
+
+--------------------------------------------------------------------------------
+-- ELT: SOURCE CONNECTIONS
+--------------------------------------------------------------------------------
+
+CREATE INDEX IF NOT EXISTS idx_elt_source_connections_token_expiry
+    ON elt_source_connections(token_expires_at)
+    WHERE is_active = true AND refresh_token IS NOT NULL;
@@ -0,0 +1,16 @@
+-- Record which process owns each job
+-- Jobs run as in-process tasks in either the server or a CLI invocation.
+-- The server recovers jobs left active by a previous server process at
+-- startup, and needs to tell those apart from jobs a CLI is running now.
+
+--------------------------------------------------------------------------------
+-- ELT: JOBS
+--------------------------------------------------------------------------------
+
+ALTER TABLE elt_jobs ADD COLUMN runner_id TEXT;
+
+-- Jobs active at upgrade time predate runner tracking; attribute them to a
+-- previous server so the next startup still recovers them
+UPDATE elt_jobs
+SET runner_id = 'server-legacy'
+WHERE status IN ('pending', 'running');
@@ -0,0 +1,14 @@
+-- Keep sources awaiting re-authentication out of the token expiry index
+-- A source whose refresh token was rejected keeps an expiry in the past and
+-- is marked with error_at. The proactive refresh skips it, so the index
+-- leaves it out too; otherwise such rows would sort first on every scan.
+
+--------------------------------------------------------------------------------
+-- ELT: SOURCE CONNECTIONS
+--------------------------------------------------------------------------------
+
+DROP INDEX IF EXISTS idx_elt_source_connections_token_expiry;
+
+CREATE INDEX IF NOT EXISTS idx_elt_source_connections_token_expiry
+    ON elt_source_connections(token_expires_at)
+    WHERE is_active = true AND refresh_token IS NOT NULL AND error_at IS NULL;
@@ -91,7 +91,7 @@ where
     }
 
     // Make streaming request to Tollbooth
-    let client = crate::http_client::tollbooth_streaming_client();
+    let client = crate::http_client::shared_streaming_client();
     let response = crate::tollbooth::with_tollbooth_auth(
         client.post(format!("{}/v1/chat/completions", config.tollbooth_url)),
         &config.tollbooth_user_id,
@@ -410,7 +410,7 @@ async fn send_magic_link_email(email: &str, url: &str) -> crate::Result<()> {
     let from =
         std::env::var("EMAIL_FROM").unwrap_or_else(|_| "Virtues <noreply@virtues.com>".into());
 
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     let response = client
         .post("https://api.resend.com/emails")
         .header("Authorization", format!("Bearer {}", api_key))
@@ -33,7 +33,7 @@ use crate::api::chat_usage::{record_chat_usage, UsageData};
 use crate::api::chats::{append_message, ChatMessage, ToolCall};
 use crate::api::compaction::{build_context_for_llm, compact_chat, CompactionOptions};
 use crate::api::token_estimation::{estimate_tokens, ContextStatus};
-use crate::http_client::tollbooth_streaming_client;
+use crate::http_client::shared_streaming_client;
 use crate::middleware::auth::AuthUser;
 use crate::server::yjs::YjsState;
 use crate::tools::ToolContext;
@@ -1157,7 +1157,7 @@ fn _create_chat_stream_legacy(
         }
 
         // Make streaming request to Tollbooth using shared client with timeouts
-        let client = tollbooth_streaming_client();
+        let client = shared_streaming_client();
         let response = match crate::tollbooth::with_tollbooth_auth(
             client.post(format!("{}/v1/chat/completions", tollbooth_config.url)),
             &tollbooth_config.user_id,
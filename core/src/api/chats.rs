@@ -416,12 +416,15 @@ pub async fn get_chat(pool: &SqlitePool, chat_id: String) -> Result<ChatDetailRe
 pub async fn create_chat(
     pool: &SqlitePool,
     title: &str,
-    messages: Vec<ChatMessage>,
+    mut messages: Vec<ChatMessage>,
 ) -> Result<Chat> {
     let timestamp = Utc::now().to_rfc3339();
     let id = crate::ids::generate_id(crate::ids::CHAT_PREFIX, &[title, &timestamp]);
     let message_count = messages.len() as i32;
 
+    // Chat row and messages commit together
+    let mut tx = pool.begin().await?;
+
     // Create chat record (no JSON blob for messages anymore!)
     let row = sqlx::query(
         r#"
@@ -433,7 +436,7 @@ pub async fn create_chat(
     .bind(&id)
     .bind(title)
     .bind(message_count)
-    .fetch_one(pool)
+    .fetch_one(&mut *tx)
     .await?;
 
     // Parse ID
@@ -445,57 +448,9 @@ pub async fn create_chat(
     let chat_updated_at: String = row.get("updated_at");
 
     // Insert messages into normalized table
-    let mut inserted_messages = Vec::new();
-    for (idx, mut msg) in messages.into_iter().enumerate() {
-        let msg_id = msg.id.clone().unwrap_or_else(|| {
-            crate::ids::generate_id(crate::ids::MESSAGE_PREFIX, &[&chat_id, &uuid::Uuid::new_v4().to_string()])
-        });
-        msg.id = Some(msg_id.clone());
-
-        let tool_calls_json = msg.tool_calls
-            .as_ref()
-            .map(|tc| serde_json::to_string(tc))
-            .transpose()?;
-        let intent_json = msg.intent
-            .as_ref()
-            .map(|i| serde_json::to_string(i))
-            .transpose()?;
-        let parts_json = msg.parts
-            .as_ref()
-            .map(|p| serde_json::to_string(p))
-            .transpose()?;
-
-        let sequence_num = (idx + 1) as i32;
+    insert_messages(&mut tx, &chat_id, &mut messages, true).await?;
 
-        sqlx::query(
-            r#"
-            INSERT INTO app_chat_messages (
-                id, chat_id, role, content, model, provider, agent_id,
-                reasoning, tool_calls, intent, subject, thought_signature, sequence_num, created_at, parts
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            "#,
-        )
-        .bind(&msg_id)
-        .bind(&chat_id)
-        .bind(&msg.role)
-        .bind(&msg.content)
-        .bind(&msg.model)
-        .bind(&msg.provider)
-        .bind(&msg.agent_id)
-        .bind(&msg.reasoning)
-        .bind(&tool_calls_json)
-        .bind(&intent_json)
-        .bind(&msg.subject)
-        .bind(&msg.thought_signature)
-        .bind(sequence_num)
-        .bind(&msg.timestamp)
-        .bind(&parts_json)
-        .execute(pool)
-        .await?;
-
-        inserted_messages.push(msg);
-    }
+    tx.commit().await?;
 
     // Parse timestamps (handles both SQLite "YYYY-MM-DD HH:MM:SS" and RFC 3339 formats)
     let created_at = chat_created_at.parse::<Timestamp>()
@@ -508,7 +463,7 @@ pub async fn create_chat(
     Ok(Chat {
         id: chat_id,
         title: chat_title,
-        messages: inserted_messages,
+        messages,
         message_count: chat_message_count,
         icon: None,
         created_at,
@@ -606,7 +561,7 @@ pub async fn append_message(
 
     // Generate stable message ID
     let msg_id = message.id.clone().unwrap_or_else(|| {
-        crate::ids::generate_id(crate::ids::MESSAGE_PREFIX, &[&chat_id_str, &uuid::Uuid::new_v4().to_string()])
+        crate::ids::generate_random_id(crate::ids::MESSAGE_PREFIX, &[&chat_id_str])
     });
 
     // Get next sequence number atomically
@@ -681,60 +636,21 @@ pub async fn append_message(
 pub async fn update_messages(
     pool: &SqlitePool,
     chat_id: String,
-    messages: Vec<ChatMessage>,
+    mut messages: Vec<ChatMessage>,
 ) -> Result<()> {
     let chat_id_str = chat_id.clone();
     let message_count = messages.len() as i32;
 
+    let mut tx = pool.begin().await?;
+
     // Delete all existing messages for this chat
     sqlx::query("DELETE FROM app_chat_messages WHERE chat_id = ?")
         .bind(&chat_id_str)
-        .execute(pool)
+        .execute(&mut *tx)
         .await?;
 
     // Re-insert all messages with new sequence numbers
-    for (idx, msg) in messages.into_iter().enumerate() {
-        let msg_id = msg.id.clone().unwrap_or_else(|| {
-            crate::ids::generate_id(crate::ids::MESSAGE_PREFIX, &[&chat_id_str, &uuid::Uuid::new_v4().to_string()])
-        });
-
-        let tool_calls_json = msg.tool_calls
-            .as_ref()
-            .map(|tc| serde_json::to_string(tc))
-            .transpose()?;
-        let intent_json = msg.intent
-            .as_ref()
-            .map(|i| serde_json::to_string(i))
-            .transpose()?;
-
-        let sequence_num = (idx + 1) as i32;
-
-        sqlx::query(
-            r#"
-            INSERT INTO app_chat_messages (
-                id, chat_id, role, content, model, provider, agent_id,
-                reasoning, tool_calls, intent, subject, thought_signature, sequence_num, created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            "#,
-        )
-        .bind(&msg_id)
-        .bind(&chat_id_str)
-        .bind(&msg.role)
-        .bind(&msg.content)
-        .bind(&msg.model)
-        .bind(&msg.provider)
-        .bind(&msg.agent_id)
-        .bind(&msg.reasoning)
-        .bind(&tool_calls_json)
-        .bind(&intent_json)
-        .bind(&msg.subject)
-        .bind(&msg.thought_signature)
-        .bind(sequence_num)
-        .bind(&msg.timestamp)
-        .execute(pool)
-        .await?;
-    }
+    insert_messages(&mut tx, &chat_id_str, &mut messages, false).await?;
 
     // Update chat metadata
     sqlx::query(
@@ -746,12 +662,132 @@ pub async fn update_messages(
     )
     .bind(message_count)
     .bind(&chat_id_str)
-    .execute(pool)
+    .execute(&mut *tx)
     .await?;
 
+    tx.commit().await?;
+
+    Ok(())
+}
+
+/// Rows per multi-row message INSERT (15 binds per row, well under SQLite's limit)
+const MESSAGE_INSERT_BATCH_SIZE: usize = 500;
+
+const MESSAGE_COLUMNS: &[&str] = &[
+    "id",
+    "chat_id",
+    "role",
+    "content",
+    "model",
+    "provider",
+    "agent_id",
+    "reasoning",
+    "tool_calls",
+    "intent",
+    "subject",
+    "thought_signature",
+    "sequence_num",
+    "created_at",
+    "parts",
+];
+
+/// Insert a chat's messages in order, numbering them from 1
+///
+/// Messages without an ID are assigned one. Rows go out as multi-row INSERTs
+/// instead of one statement per message; a message whose ID already exists
+/// fails with SQLite's unique constraint error, and callers roll back their
+/// transaction. `persist_parts` controls whether UI parts are stored;
+/// otherwise the column is left NULL.
+async fn insert_messages(
+    conn: &mut sqlx::SqliteConnection,
+    chat_id: &str,
+    messages: &mut [ChatMessage],
+    persist_parts: bool,
+) -> Result<()> {
+    for msg in messages.iter_mut() {
+        if msg.id.is_none() {
+            msg.id = Some(crate::ids::generate_random_id(
+                crate::ids::MESSAGE_PREFIX,
+                &[chat_id],
+            ));
+        }
+    }
+
+    for (chunk_idx, chunk) in messages.chunks(MESSAGE_INSERT_BATCH_SIZE).enumerate() {
+        let query_str = build_message_insert_query(chunk.len());
+        let mut query = sqlx::query(&query_str);
+
+        for (idx, msg) in chunk.iter().enumerate() {
+            let tool_calls_json = msg.tool_calls
+                .as_ref()
+                .map(|tc| serde_json::to_string(tc))
+                .transpose()?;
+            let intent_json = msg.intent
+                .as_ref()
+                .map(|i| serde_json::to_string(i))
+                .transpose()?;
+            let parts_json = msg.parts
+                .as_ref()
+                .filter(|_| persist_parts)
+                .map(|p| serde_json::to_string(p))
+                .transpose()?;
+
+            let sequence_num = (chunk_idx * MESSAGE_INSERT_BATCH_SIZE + idx + 1) as i32;
+
+            query = query
+                .bind(&msg.id)
+                .bind(chat_id)
+                .bind(&msg.role)
+                .bind(&msg.content)
+                .bind(&msg.model)
+                .bind(&msg.provider)
+                .bind(&msg.agent_id)
+                .bind(&msg.reasoning)
+                .bind(tool_calls_json)
+                .bind(intent_json)
+                .bind(&msg.subject)
+                .bind(&msg.thought_signature)
+                .bind(sequence_num)
+                .bind(msg.timestamp)
+                .bind(parts_json);
+        }
+
+        query.execute(&mut *conn).await?;
+    }
+
     Ok(())
 }
 
+/// Render a multi-row message INSERT with no conflict clause
+///
+/// `Database::build_batch_insert_query` skips conflicting rows, but a message
+/// must never be dropped silently, so duplicates are left to fail the insert.
+fn build_message_insert_query(num_rows: usize) -> String {
+    let num_cols = MESSAGE_COLUMNS.len();
+
+    let mut query = format!(
+        "INSERT INTO app_chat_messages ({}) VALUES ",
+        MESSAGE_COLUMNS.join(", ")
+    );
+    query.reserve(num_rows * num_cols * 7);
+    for row_idx in 0..num_rows {
+        if row_idx > 0 {
+            query.push_str(", ");
+        }
+        query.push('(');
+        for col_idx in 0..num_cols {
+            if col_idx > 0 {
+                query.push_str(", ");
+            }
+            query.push('$');
+            query.push_str(&(row_idx * num_cols + col_idx + 1).to_string());
+        }
+        query.push(')');
+    }
+
+    query
+}
+
 /// Delete a chat
 /// Also cleans up all space_items references (orphan cleanup)
 pub async fn delete_chat(pool: &SqlitePool, chat_id: String) -> Result<DeleteChatResponse> {
@@ -823,7 +859,7 @@ Conversation:
     );
 
     // Call Tollbooth using shared client with timeouts
-    let client = crate::http_client::tollbooth_client();
+    let client = crate::http_client::shared_client();
     let response = crate::tollbooth::with_system_auth(
         client.post(format!("{}/v1/chat/completions", tollbooth_url)),
         &secret,
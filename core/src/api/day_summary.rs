@@ -8,6 +8,7 @@
 use chrono::{NaiveDate, TimeZone};
 use chrono_tz::Tz;
 use sqlx::SqlitePool;
+use std::sync::OnceLock;
 
 use crate::error::{Error, Result};
 
@@ -799,18 +800,11 @@ async fn detect_ontology_presence(
     start_str: &str,
     end_str: &str,
 ) -> Vec<(String, bool)> {
-    let ontologies = registered_ontologies();
-    let mut presence = Vec::with_capacity(ontologies.len());
+    let queries = ontology_presence_queries();
+    let mut presence = Vec::with_capacity(queries.len());
 
-    for ont in &ontologies {
-        let ts_col = ont.timestamp_column;
-        let table = ont.table_name;
-        let query = format!(
-            "SELECT COUNT(*) as cnt FROM {} WHERE {} >= $1 AND {} <= $2 LIMIT 1",
-            table, ts_col, ts_col
-        );
-
-        let has_data: bool = sqlx::query_scalar::<_, i32>(&query)
+    for (name, query) in queries {
+        let has_data: bool = sqlx::query_scalar::<_, i32>(query)
             .bind(start_str)
             .bind(end_str)
             .fetch_optional(pool)
@@ -820,12 +814,30 @@ async fn detect_ontology_presence(
             .unwrap_or(0)
             > 0;
 
-        presence.push((ont.name.to_string(), has_data));
+        presence.push((name.to_string(), has_data));
     }
 
     presence
 }
 
+/// Per-ontology presence queries, built once from the static registry
+fn ontology_presence_queries() -> &'static [(&'static str, String)] {
+    static QUERIES: OnceLock<Vec<(&'static str, String)>> = OnceLock::new();
+    QUERIES.get_or_init(|| {
+        registered_ontologies()
+            .iter()
+            .map(|ont| {
+                let ts_col = ont.timestamp_column;
+                let query = format!(
+                    "SELECT COUNT(*) as cnt FROM {} WHERE {} >= $1 AND {} <= $2 LIMIT 1",
+                    ont.table_name, ts_col, ts_col
+                );
+                (ont.name, query)
+            })
+            .collect()
+    })
+}
+
 /// Compute the 7-dimension context vector from ontology presence.
 /// Each dimension = sum(weights of present ontologies) / sum(weights of all ontologies).
 /// Dimensions: [who, whom, what, when, where, why, how]
@@ -874,7 +886,7 @@ async fn call_tollbooth(pool: &SqlitePool, user_prompt: &str) -> Result<String>
     let secret = std::env::var("TOLLBOOTH_INTERNAL_SECRET")
         .map_err(|_| Error::Configuration("TOLLBOOTH_INTERNAL_SECRET not set".into()))?;
 
-    let client = crate::http_client::tollbooth_client();
+    let client = crate::http_client::shared_client();
     let response = crate::tollbooth::with_system_auth(
         client.post(format!("{}/v1/chat/completions", tollbooth_url)),
         &secret,
@@ -209,7 +209,7 @@ pub async fn complete_pairing_by_source_id(
     }
 
     // Encrypt device ID to use as token
-    let encryptor = TokenEncryptor::from_env()
+    let encryptor = TokenEncryptor::shared()
         .map_err(|e| Error::Other(format!("Failed to initialize encryption: {e}")))?;
     let encrypted_token = encryptor
         .encrypt(device_id)
@@ -275,7 +275,7 @@ pub async fn link_device_manually(
     }
 
     // Encrypt device ID to use as token
-    let encryptor = TokenEncryptor::from_env()
+    let encryptor = TokenEncryptor::shared()
         .map_err(|e| Error::Other(format!("Failed to initialize encryption: {e}")))?;
     let encrypted_token = encryptor
         .encrypt(device_id)
@@ -320,6 +320,7 @@ pub async fn link_device_manually(
         .execute(db)
         .await
         .map_err(|e| Error::Database(format!("Failed to update source: {e}")))?;
+        crate::sources::factory::invalidate_source_info(&existing_id);
 
         existing_id
     } else {
@@ -439,7 +440,7 @@ pub async fn list_pending_pairings(db: &SqlitePool) -> Result<Vec<PendingPairing
 /// Validate a device token and return the source ID
 pub async fn validate_device_token(db: &SqlitePool, token: &str) -> Result<String> {
     // Initialize encryptor
-    let encryptor = TokenEncryptor::from_env()
+    let encryptor = TokenEncryptor::shared()
         .map_err(|e| Error::Other(format!("Failed to initialize encryption: {e}")))?;
 
     // Get all active device sources with tokens
@@ -379,11 +379,11 @@ pub async fn get_drive_usage(pool: &SqlitePool) -> Result<DriveUsage> {
 
     let (drive_bytes, quota_bytes, file_count, folder_count) = row;
 
-    // Get data lake usage from elt_stream_objects
+    // Get data lake usage from the per-stream rollups
     let data_lake_bytes: i64 = sqlx::query_scalar(
         r#"
         SELECT COALESCE(SUM(size_bytes), 0)
-        FROM elt_stream_objects
+        FROM elt_stream_rollups
         "#,
     )
     .fetch_one(pool)
@@ -630,24 +630,26 @@ pub async fn reconcile_folder(pool: &SqlitePool, config: &DriveConfig, path: &st
         }
     };
 
-    let db_filenames: HashSet<String> = db_records.iter().map(|f| f.filename.clone()).collect();
-
     // Note: Auto-registration of untracked files from storage is not supported.
     // With S3, the database is the source of truth.
     // Files should only be added through the API, not by direct S3 upload.
 
-    // Log if there are untracked files in storage (for debugging)
-    let untracked: Vec<&String> = storage_filenames
-        .iter()
-        .filter(|name| !db_filenames.contains(*name))
-        .collect();
-    if !untracked.is_empty() {
-        tracing::debug!(
-            "Found {} untracked files in storage at '{}': {:?}",
-            untracked.len(),
-            path_str,
-            untracked.iter().take(5).collect::<Vec<_>>()
-        );
+    // Log if there are untracked files in storage (for debugging). The diff
+    // only feeds this log line, so skip it unless debug logging is on.
+    if tracing::enabled!(tracing::Level::DEBUG) {
+        let db_filenames: HashSet<&str> = db_records.iter().map(|f| f.filename.as_str()).collect();
+        let untracked: Vec<&String> = storage_filenames
+            .iter()
+            .filter(|name| !db_filenames.contains(name.as_str()))
+            .collect();
+        if !untracked.is_empty() {
+            tracing::debug!(
+                "Found {} untracked files in storage at '{}': {:?}",
+                untracked.len(),
+                path_str,
+                untracked.iter().take(5).collect::<Vec<_>>()
+            );
+        }
     }
 
     // --- Remove ghost DB records (in DB but not in storage) ---
@@ -764,7 +766,7 @@ pub async fn get_file_metadata(pool: &SqlitePool, file_id: &str) -> Result<Drive
     // Handle virtual lake folder IDs
     if file_id == LAKE_VIRTUAL_ID {
         let lake_size: i64 =
-            sqlx::query_scalar("SELECT COALESCE(SUM(size_bytes), 0) FROM elt_stream_objects")
+            sqlx::query_scalar("SELECT COALESCE(SUM(size_bytes), 0) FROM elt_stream_rollups")
                 .fetch_one(pool)
                 .await
                 .unwrap_or(0);
@@ -1644,34 +1646,53 @@ pub async fn empty_trash(pool: &SqlitePool, config: &DriveConfig) -> Result<u64>
     Ok(deleted_count)
 }
 
+/// Rows fetched per page when scanning for expired trash
+const TRASH_PURGE_PAGE_SIZE: i64 = 500;
+
 /// Purge files that have been in trash for more than 30 days
 ///
-/// Called by scheduled job daily
+/// Called by scheduled job daily. Expired entries are paged through by id
+/// rather than loaded all at once, so a large trash backlog doesn't turn
+/// into one large allocation.
 pub async fn purge_old_trash(pool: &SqlitePool, config: &DriveConfig) -> Result<u64> {
-    let old_files = sqlx::query_as::<_, DriveFile>(
-        r#"
-        SELECT id, path, filename, mime_type, size_bytes,
-               is_folder, parent_id, sha256_hash, deleted_at, created_at, updated_at
-        FROM drive_files
-        WHERE deleted_at IS NOT NULL
-          AND deleted_at < datetime('now', '-30 days')
-        "#,
-    )
-    .fetch_all(pool)
-    .await
-    .map_err(|e| Error::Database(format!("Failed to list old trash: {e}")))?;
-
     let mut purged_count = 0u64;
+    let mut last_id = String::new();
 
-    for file in old_files {
-        match purge_file(pool, config, &file.id).await {
-            Ok(_) => {
-                purged_count += 1;
-                tracing::debug!("Purged old trash file: {}", file.path);
-            }
-            Err(e) => {
-                tracing::warn!("Failed to purge old trash file {}: {}", file.path, e);
+    loop {
+        let page = sqlx::query_as::<_, (String, String)>(
+            r#"
+            SELECT id, path
+            FROM drive_files
+            WHERE deleted_at IS NOT NULL
+              AND deleted_at < datetime('now', '-30 days')
+              AND id > $1
+            ORDER BY id
+            LIMIT $2
+            "#,
+        )
+        .bind(&last_id)
+        .bind(TRASH_PURGE_PAGE_SIZE)
+        .fetch_all(pool)
+        .await
+        .map_err(|e| Error::Database(format!("Failed to list old trash: {e}")))?;
+
+        let page_len = page.len();
+
+        for (id, path) in page {
+            match purge_file(pool, config, &id).await {
+                Ok(_) => {
+                    purged_count += 1;
+                    tracing::debug!("Purged old trash file: {}", path);
+                }
+                Err(e) => {
+                    tracing::warn!("Failed to purge old trash file {}: {}", path, e);
+                }
             }
+            last_id = id;
+        }
+
+        if (page_len as i64) < TRASH_PURGE_PAGE_SIZE {
+            break;
         }
     }
 
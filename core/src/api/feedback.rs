@@ -29,7 +29,7 @@ pub async fn submit_feedback(
 
     // In production, we forward this to the Tollbooth sidecar
     if let Ok(tollbooth_url) = env::var("TOLLBOOTH_URL") {
-        let client = reqwest::Client::new();
+        let client = crate::http_client::shared_client();
         let target_url = format!("{}/v1/services/feedback", tollbooth_url);
 
         // We fire and forget - don't block the user if tollbooth is down
@@ -22,6 +22,8 @@ pub struct CreateJobResponse {
 /// Trigger a sync for a specific stream (async version)
 ///
 /// This creates a job and starts it in the background, returning immediately.
+/// Long-lived callers should hold a `JobExecutor` and use
+/// [`trigger_stream_sync_with_executor`] instead of rebuilding one per sync.
 pub async fn trigger_stream_sync(
     db: &SqlitePool,
     storage: &Storage,
@@ -30,14 +32,26 @@ pub async fn trigger_stream_sync(
     stream_name: &str,
     sync_mode: Option<crate::sources::base::SyncMode>,
 ) -> Result<CreateJobResponse> {
-    // Check if there's already an active sync for this stream
-    if jobs::has_active_sync_job(db, &source_id, stream_name).await? {
-        return Err(Error::InvalidInput(format!(
-            "Stream '{}' already has an active sync job",
-            stream_name
-        )));
-    }
+    // Create context without data source
+    // The sync_job executor will create its own context with the actual records after sync completes.
+    let api_keys = ApiKeys::from_env();
+    let context = TransformContext::new(Arc::new(storage.clone()), stream_writer, api_keys);
+    let executor = JobExecutor::new(db.clone(), context);
 
+    trigger_stream_sync_with_executor(db, &executor, source_id, stream_name, sync_mode).await
+}
+
+/// Trigger a sync for a specific stream on an existing executor
+///
+/// Same as [`trigger_stream_sync`], but reuses the caller's executor (and its
+/// transform context) rather than building one for this job.
+pub async fn trigger_stream_sync_with_executor(
+    db: &SqlitePool,
+    executor: &JobExecutor,
+    source_id: String,
+    stream_name: &str,
+    sync_mode: Option<crate::sources::base::SyncMode>,
+) -> Result<CreateJobResponse> {
     // Convert sync mode to string for storage
     let sync_mode_str = match sync_mode {
         Some(crate::sources::base::SyncMode::FullRefresh) => "full_refresh",
@@ -46,41 +60,29 @@ pub async fn trigger_stream_sync(
     }
     .to_string();
 
-    // Load cursor from database for incremental syncs
-    let cursor_before = if sync_mode_str == "incremental" {
-        sqlx::query_scalar::<_, Option<String>>(
-            "SELECT last_sync_token FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = $2",
-        )
-        .bind(&source_id)
-        .bind(stream_name)
-        .fetch_optional(db)
-        .await?
-        .flatten()
-    } else {
-        None
-    };
-
-    // Create job request
+    // Create job request; for incremental syncs the stored cursor is
+    // filled in by the INSERT itself
     let request = CreateJobRequest::new_sync_job(
         source_id.clone(),
         stream_name.to_string(),
         sync_mode_str.clone(),
         SyncJobMetadata {
             sync_mode: sync_mode_str,
-            cursor_before,
+            cursor_before: None,
         },
     );
 
-    // Create job in database
-    let job = jobs::create_job(db, request).await?;
-
-    // Create context without data source
-    // The sync_job executor will create its own context with the actual records after sync completes.
-    let api_keys = ApiKeys::from_env();
-    let context = TransformContext::new(Arc::new(storage.clone()), stream_writer, api_keys);
+    // Create job in database, unless there's already an active sync for this stream
+    let job = jobs::create_sync_job_if_idle(db, request)
+        .await?
+        .ok_or_else(|| {
+            Error::InvalidInput(format!(
+                "Stream '{}' already has an active sync job",
+                stream_name
+            ))
+        })?;
 
     // Start job execution in background
-    let executor = JobExecutor::new(db.clone(), context);
     executor.execute_async(job.id.clone());
 
     Ok(CreateJobResponse {
@@ -73,15 +73,15 @@ struct LakeStreamRow {
 
 /// Get summary statistics for the data lake
 pub async fn get_lake_summary(pool: &SqlitePool) -> Result<LakeSummary> {
-    // Get aggregate stats from elt_stream_objects
+    // Get aggregate stats from the per-stream rollups (one row per stream)
     let row = sqlx::query_as::<_, LakeSummaryRow>(
         r#"
         SELECT
             COALESCE(SUM(size_bytes), 0) as total_bytes,
-            COUNT(*) as object_count,
+            COALESCE(SUM(object_count), 0) as object_count,
             COALESCE(SUM(record_count), 0) as record_count,
-            COUNT(DISTINCT source_connection_id || ':' || stream_name) as stream_count
-        FROM elt_stream_objects
+            COUNT(*) as stream_count
+        FROM elt_stream_rollups
         "#,
     )
     .fetch_one(pool)
@@ -111,19 +111,18 @@ pub async fn list_lake_streams(pool: &SqlitePool) -> Result<Vec<LakeStream>> {
     let rows = sqlx::query_as::<_, LakeStreamRow>(
         r#"
         SELECT
-            so.source_connection_id,
+            sr.source_connection_id,
             sc.name as source_name,
             sc.source as source_type,
-            so.stream_name,
-            COALESCE(SUM(so.size_bytes), 0) as size_bytes,
-            COALESCE(SUM(so.record_count), 0) as record_count,
-            COUNT(*) as object_count,
-            MIN(so.min_timestamp) as earliest_at,
-            MAX(so.max_timestamp) as latest_at
-        FROM elt_stream_objects so
-        JOIN elt_source_connections sc ON so.source_connection_id = sc.id
-        GROUP BY so.source_connection_id, so.stream_name, sc.name, sc.source
-        ORDER BY size_bytes DESC
+            sr.stream_name,
+            sr.size_bytes,
+            sr.record_count,
+            sr.object_count,
+            sr.earliest_at,
+            sr.latest_at
+        FROM elt_stream_rollups sr
+        JOIN elt_source_connections sc ON sr.source_connection_id = sc.id
+        ORDER BY sr.size_bytes DESC
         "#,
     )
     .fetch_all(pool)
@@ -158,7 +158,7 @@ pub use exa::{
 pub use feedback::{submit_feedback, FeedbackRequest};
 pub use jobs::{
     cancel_job, get_job_history, get_job_status, query_jobs, trigger_stream_sync,
-    CreateJobResponse, QueryJobsRequest,
+    trigger_stream_sync_with_executor, CreateJobResponse, QueryJobsRequest,
 };
 pub use media::{
     get_media, is_audio_type, is_image_type, is_supported_media_type, is_video_type, upload_media,
@@ -211,7 +211,7 @@ pub async fn initiate_oauth_flow(
 /// Fetch a meaningful source name based on the OAuth provider
 /// Falls back to "{Provider} Account" if fetching fails
 async fn fetch_source_name(provider: &str, access_token: &str, display_name: &str) -> String {
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     
     match provider {
         "google" => {
@@ -289,7 +289,7 @@ pub async fn handle_oauth_callback(
         let proxy_url = std::env::var("OAUTH_PROXY_URL")
             .unwrap_or_else(|_| "https://auth.virtues.com".to_string());
 
-        let client = reqwest::Client::new();
+        let client = crate::http_client::shared_client();
 
         let response = client
             .post(&format!("{}/{}/token", proxy_url, params.provider))
@@ -139,7 +139,7 @@ pub async fn autocomplete(request: AutocompleteRequest) -> Result<AutocompleteRe
         body["sessionToken"] = serde_json::json!(token);
     }
 
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     let response = tollbooth::with_system_auth(
         client.post(format!(
             "{}/v1/services/google/places/autocomplete",
@@ -201,7 +201,7 @@ pub async fn get_place_details(request: PlaceDetailsRequest) -> Result<PlaceDeta
     let secret = get_tollbooth_secret()?;
     let tollbooth_url = get_tollbooth_url();
 
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     let response = tollbooth::with_system_auth(
         client.get(format!(
             "{}/v1/services/google/places/{}",
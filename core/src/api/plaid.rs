@@ -115,7 +115,7 @@ pub async fn create_link_token(
 
     // Use a unique identifier for the user session
     // In a multi-user system, this would be the actual user ID
-    let user_client_id = crate::ids::generate_id("plaid-user", &[&uuid::Uuid::new_v4().to_string()]);
+    let user_client_id = crate::ids::generate_random_id("plaid-user", &[]);
 
     // Request financial products (investments/liabilities require additional Plaid approval)
     // Note: We use accounts_get() instead of accounts_balance_get() to avoid $0.10/call balance fees
@@ -216,7 +216,7 @@ pub async fn exchange_public_token(
     );
 
     // Encrypt the access token before storing
-    let encryptor = TokenEncryptor::from_env()?;
+    let encryptor = TokenEncryptor::shared()?;
     let encrypted_token = encryptor.encrypt(&access_token)?;
 
     // Create source connection
@@ -336,7 +336,7 @@ pub async fn get_plaid_accounts(db: &SqlitePool, source_id: String) -> Result<Ve
         .ok_or_else(|| Error::Configuration("Plaid source has no access token".to_string()))?;
 
     // Decrypt the access token
-    let encryptor = TokenEncryptor::from_env()?;
+    let encryptor = TokenEncryptor::shared()?;
     let access_token = encryptor.decrypt(&encrypted_token)?;
 
     let client = PlaidClient::from_env()?;
@@ -391,7 +391,7 @@ pub async fn remove_plaid_item(db: &SqlitePool, source_id: String) -> Result<()>
         .ok_or_else(|| Error::Configuration("Plaid source has no access token".to_string()))?;
 
     // Decrypt the access token
-    let encryptor = TokenEncryptor::from_env()?;
+    let encryptor = TokenEncryptor::shared()?;
     let access_token = encryptor.decrypt(&encrypted_token)?;
 
     // Revoke access with Plaid
@@ -80,6 +80,7 @@ pub async fn pause_source(db: &SqlitePool, source_id: String) -> Result<SourceCo
         .execute(db)
         .await
         .map_err(|e| Error::Database(format!("Failed to pause source: {e}")))?;
+    crate::sources::factory::invalidate_source_info(source_id_str);
  
     get_source(db, source_id).await
 }
@@ -94,6 +95,7 @@ pub async fn resume_source(db: &SqlitePool, source_id: String) -> Result<SourceC
         .execute(db)
         .await
         .map_err(|e| Error::Database(format!("Failed to resume source: {e}")))?;
+    crate::sources::factory::invalidate_source_info(source_id_str);
  
     get_source(db, source_id).await
 }
@@ -108,6 +110,7 @@ pub async fn delete_source(db: &SqlitePool, source_id: String) -> Result<()> {
         .execute(db)
         .await
         .map_err(|e| Error::Database(format!("Failed to delete source: {e}")))?;
+    crate::sources::factory::invalidate_source_info(source_id_str);
  
     Ok(())
 }
@@ -100,28 +100,25 @@ pub async fn get_object_content(
     .map_err(|e| Error::Database(format!("Failed to query stream object: {e}")))?
     .ok_or_else(|| Error::NotFound(format!("Stream object not found: {object_id_str}")))?;
 
-    // 2. Download from storage
-    let data = storage
-        .download(&metadata.storage_key)
+    // 2. Stream from storage
+    let reader = storage
+        .download_reader(&metadata.storage_key)
         .await
         .map_err(|e| Error::Other(format!("Failed to download object from storage: {e}")))?;
 
-    // 3. Parse JSONL content (newline-delimited JSON)
-    let content = String::from_utf8(data)
-        .map_err(|e| Error::Other(format!("Invalid UTF-8 in object content: {e}")))?;
-
-    let records: Vec<serde_json::Value> = content
-        .lines()
-        .filter(|line| !line.trim().is_empty())
-        .filter_map(|line| {
-            serde_json::from_str(line)
-                .map_err(|e| {
-                    tracing::warn!("Failed to parse JSONL line: {e}");
-                    e
-                })
-                .ok()
-        })
-        .collect();
+    // 3. Parse JSONL content (newline-delimited JSON) as it arrives
+    let mut lines = crate::storage::JsonlLines::new(reader);
+    let mut records: Vec<serde_json::Value> = Vec::new();
+    while let Some((_, line)) = lines
+        .next_line()
+        .await
+        .map_err(|e| Error::Other(format!("Failed to read object from storage: {e}")))?
+    {
+        match serde_json::from_slice(line) {
+            Ok(record) => records.push(record),
+            Err(e) => tracing::warn!("Failed to parse JSONL line: {e}"),
+        }
+    }
 
     Ok(ObjectContent {
         id: metadata.id,
@@ -3,13 +3,11 @@
 //! Merges shared metadata from virtues-registry with user-specific state from SQLite.
 
 use sqlx::SqlitePool;
-use std::sync::Arc;
-use tokio::sync::Mutex;
 
 use super::plaid::PlaidSourceMetadata;
 use super::sources::get_source;
 use crate::error::{Error, Result};
-use crate::storage::stream_writer::StreamWriter;
+use crate::jobs::JobExecutor;
 use crate::types::Timestamp;
 
 /// A user's stream connection
@@ -169,10 +167,11 @@ pub async fn get_stream_info(
 }
 
 /// Enable a stream for a source
+///
+/// Pull-based sources get an initial sync, started on `executor`.
 pub async fn enable_stream(
     db: &SqlitePool,
-    storage: &crate::storage::Storage,
-    stream_writer: Arc<Mutex<StreamWriter>>,
+    executor: &JobExecutor,
     source_id: String,
     stream_name: &str,
     config: Option<serde_json::Value>,
@@ -217,15 +216,13 @@ pub async fn enable_stream(
     // Trigger initial sync for pull-based sources
     if source.auth_type == "oauth2" || source.auth_type == "plaid" {
         let db_clone = db.clone();
-        let storage_clone = storage.clone();
-        let stream_writer_clone = stream_writer.clone();
+        let executor = executor.clone();
         let stream_name_clone = stream_name.to_string();
         let source_id_clone = source_id.clone();
         tokio::spawn(async move {
-            match crate::api::jobs::trigger_stream_sync(
+            match crate::api::jobs::trigger_stream_sync_with_executor(
                 &db_clone,
-                &storage_clone,
-                stream_writer_clone,
+                &executor,
                 source_id_clone,
                 &stream_name_clone,
                 None,
@@ -388,10 +385,11 @@ pub struct BulkUpdateStreamsResponse {
 }
 
 /// Bulk update multiple streams for a source
+///
+/// Initial syncs for newly enabled pull-based streams run on `executor`.
 pub async fn bulk_update_streams(
     db: &SqlitePool,
-    storage: &crate::storage::Storage,
-    stream_writer: Arc<Mutex<StreamWriter>>,
+    executor: &JobExecutor,
     source_id: String,
     updates: Vec<StreamUpdate>,
 ) -> Result<BulkUpdateStreamsResponse> {
@@ -402,6 +400,11 @@ pub async fn bulk_update_streams(
         .ok_or_else(|| Error::Other(format!("Unknown provider: {provider}")))?;
 
     let mut updated_count = 0;
+    let mut initial_syncs = Vec::new();
+
+    // Apply every update in one transaction, then fire the initial syncs
+    // together once the new stream rows are committed
+    let mut tx = db.begin().await?;
 
     for update in &updates {
         let stream_reg = source_reg
@@ -440,34 +443,12 @@ pub async fn bulk_update_streams(
             .bind(stream_desc.table_name)
             .bind(&config)
             .bind(stream_desc.default_cron_schedule)
-            .execute(db)
+            .execute(&mut *tx)
             .await
             .map_err(|e| Error::Database(format!("Failed to enable stream: {e}")))?;
 
             if source.auth_type == "oauth2" || source.auth_type == "plaid" {
-                let db_clone = db.clone();
-                let storage_clone = storage.clone();
-                let stream_writer_clone = stream_writer.clone();
-                let stream_name_clone = update.stream_name.clone();
-                let source_id_clone = source_id.clone();
-                tokio::spawn(async move {
-                    if let Err(e) = crate::api::jobs::trigger_stream_sync(
-                        &db_clone,
-                        &storage_clone,
-                        stream_writer_clone,
-                        source_id_clone,
-                        &stream_name_clone,
-                        None,
-                    )
-                    .await
-                    {
-                        tracing::error!(
-                            "Failed to create initial sync job for {}: {}",
-                            stream_name_clone,
-                            e
-                        );
-                    }
-                });
+                initial_syncs.push(update.stream_name.clone());
             }
         } else {
             sqlx::query(
@@ -479,7 +460,7 @@ pub async fn bulk_update_streams(
             )
             .bind(&source_id)
             .bind(&update.stream_name)
-            .execute(db)
+            .execute(&mut *tx)
             .await
             .map_err(|e| Error::Database(format!("Failed to disable stream: {e}")))?;
         }
@@ -487,6 +468,33 @@ pub async fn bulk_update_streams(
         updated_count += 1;
     }
 
+    tx.commit().await?;
+
+    if !initial_syncs.is_empty() {
+        let db = db.clone();
+        let executor = executor.clone();
+        let source_id = source_id.clone();
+        tokio::spawn(async move {
+            for stream_name in initial_syncs {
+                if let Err(e) = crate::api::jobs::trigger_stream_sync_with_executor(
+                    &db,
+                    &executor,
+                    source_id.clone(),
+                    &stream_name,
+                    None,
+                )
+                .await
+                {
+                    tracing::error!(
+                        "Failed to create initial sync job for {}: {}",
+                        stream_name,
+                        e
+                    );
+                }
+            }
+        });
+    }
+
     let streams = list_source_streams(db, source_id).await?;
 
     Ok(BulkUpdateStreamsResponse {
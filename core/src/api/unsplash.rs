@@ -83,7 +83,7 @@ pub async fn search(request: SearchRequest) -> Result<SearchResponse> {
 
     let tollbooth_url = get_tollbooth_url();
 
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     let response = tollbooth::with_system_auth(
         client.post(format!("{}/v1/services/unsplash/search", tollbooth_url)),
         &secret,
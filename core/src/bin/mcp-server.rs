@@ -7,10 +7,10 @@ use anyhow::Result;
 use clap::Parser;
 use dotenv::dotenv;
 use rmcp::{transport::stdio, ServiceExt};
-use sqlx::sqlite::SqlitePoolOptions;
 use std::env;
 use tracing::info;
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt};
+use virtues::database::Database;
 use virtues::mcp::VirtuesMcpServer;
 
 #[derive(Parser, Debug)]
@@ -42,11 +42,11 @@ async fn main() -> Result<()> {
     let database_url =
         env::var("DATABASE_URL").expect("DATABASE_URL must be set in environment or .env file");
 
-    // Create database connection pool
-    let pool = SqlitePoolOptions::new()
-        .max_connections(5)
-        .connect(&database_url)
-        .await?;
+    // Create database connection pool with the same tuning as the main
+    // server (WAL, busy timeout, statement cache, no per-acquire ping)
+    let database = Database::new(&database_url)?;
+    database.test_connection().await?;
+    let pool = database.pool().clone();
 
     info!("Connected to database");
 
@@ -94,11 +94,20 @@ pub async fn handle_stream_command(
         } => {
             println!("Enabling stream: {} / {}", source_id, stream_name);
 
+            // The CLI holds no long-lived executor; build one for the initial sync
+            let executor = crate::jobs::JobExecutor::new(
+                virtues.database.pool().clone(),
+                crate::jobs::TransformContext::new(
+                    virtues.storage.clone(),
+                    stream_writer.clone(),
+                    crate::jobs::ApiKeys::from_env(),
+                ),
+            );
+
             // Enable with default config (None = use defaults)
             crate::enable_stream(
                 virtues.database.pool(),
-                &*virtues.storage,
-                stream_writer.clone(),
+                &executor,
                 source_id,
                 &stream_name,
                 None,
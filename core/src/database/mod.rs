@@ -1,9 +1,15 @@
 //! Database module for SQLite operations
 
-use std::sync::Once;
+use std::fmt::Write as _;
+use std::str::FromStr;
+use std::sync::{Arc, Once, OnceLock};
 use std::time::Duration;
 
-use sqlx::{sqlite::SqlitePoolOptions, SqlitePool};
+use moka::sync::Cache;
+use sqlx::{
+    sqlite::{SqliteConnectOptions, SqliteJournalMode, SqlitePoolOptions, SqliteSynchronous},
+    SqlitePool,
+};
 
 use crate::error::{Error, Result};
 
@@ -24,6 +30,23 @@ fn register_sqlite_vec_extension() {
     });
 }
 
+/// Upper bound on cached batch INSERT statements, in bytes of SQL text
+const BATCH_INSERT_CACHE_BYTES: u64 = 16 * 1024 * 1024;
+
+/// Rendered batch INSERT statements keyed by (table/columns/conflict, row count)
+///
+/// Transforms insert in fixed-size batches, so the same few statements are
+/// requested over and over; each one is rendered once and then shared.
+fn batch_insert_query_cache() -> &'static Cache<(String, usize), Arc<str>> {
+    static CACHE: OnceLock<Cache<(String, usize), Arc<str>>> = OnceLock::new();
+    CACHE.get_or_init(|| {
+        Cache::builder()
+            .weigher(|_key, sql: &Arc<str>| u32::try_from(sql.len()).unwrap_or(u32::MAX))
+            .max_capacity(BATCH_INSERT_CACHE_BYTES)
+            .build()
+    })
+}
+
 /// Database connection and operations
 #[derive(Clone)]
 pub struct Database {
@@ -41,33 +64,57 @@ impl Database {
             .and_then(|s| s.parse::<u32>().ok())
             .unwrap_or(5);
 
-        tracing::info!("Database pool max connections: {}", max_connections);
+        // Idle connections the pool keeps open in the background (default: 1).
+        // Each new connection loads sqlite-vec and applies the pragmas below,
+        // so a warm one saves the first request after an idle period from it.
+        let min_connections = std::env::var("DATABASE_MIN_CONNECTIONS")
+            .ok()
+            .and_then(|s| s.parse::<u32>().ok())
+            .unwrap_or(1)
+            .min(max_connections);
+
+        // How long a caller waits for a free connection (default: 10s). Raise
+        // it alongside max_connections when many jobs run at once.
+        let acquire_timeout_secs = std::env::var("DATABASE_ACQUIRE_TIMEOUT_SECS")
+            .ok()
+            .and_then(|s| s.parse::<u64>().ok())
+            .unwrap_or(10);
+
+        // Prepared statements cached per connection (default: 256). Batch inserts
+        // generate one statement per table and row count, so the sqlx default
+        // of 100 churns once several transforms run on the same connection.
+        let statement_cache_capacity = std::env::var("DATABASE_STATEMENT_CACHE_CAPACITY")
+            .ok()
+            .and_then(|s| s.parse::<usize>().ok())
+            .unwrap_or(256);
+
+        tracing::info!(
+            max_connections,
+            min_connections,
+            acquire_timeout_secs,
+            statement_cache_capacity,
+            "Database pool configured"
+        );
+
+        // SQLite-specific settings for better performance and safety, applied
+        // as part of the connection handshake rather than as separate queries
+        let connect_options = SqliteConnectOptions::from_str(database_url)?
+            .foreign_keys(true)
+            .journal_mode(SqliteJournalMode::Wal)
+            .busy_timeout(Duration::from_secs(5))
+            .synchronous(SqliteSynchronous::Normal)
+            .statement_cache_capacity(statement_cache_capacity);
 
-        // Pool will be created on first use
+        // Pool will be created on first use. Connections are to a local file,
+        // so skip the liveness ping sqlx otherwise runs on every acquire.
         let pool = SqlitePoolOptions::new()
             .max_connections(max_connections)
-            .acquire_timeout(Duration::from_secs(10))
+            .min_connections(min_connections)
+            .acquire_timeout(Duration::from_secs(acquire_timeout_secs))
             .idle_timeout(Duration::from_secs(600))
             .max_lifetime(Duration::from_secs(1800))
-            .after_connect(|conn, _meta| {
-                Box::pin(async move {
-                    // Enable SQLite-specific settings for better performance and safety
-                    sqlx::query("PRAGMA foreign_keys = ON")
-                        .execute(&mut *conn)
-                        .await?;
-                    sqlx::query("PRAGMA journal_mode = WAL")
-                        .execute(&mut *conn)
-                        .await?;
-                    sqlx::query("PRAGMA busy_timeout = 5000")
-                        .execute(&mut *conn)
-                        .await?;
-                    sqlx::query("PRAGMA synchronous = NORMAL")
-                        .execute(&mut *conn)
-                        .await?;
-                    Ok(())
-                })
-            })
-            .connect_lazy(database_url)?;
+            .test_before_acquire(false)
+            .connect_lazy_with(connect_options);
 
         Ok(Self { pool })
     }
@@ -84,15 +131,24 @@ impl Database {
 
     /// Initialize database (run migrations, etc.)
     pub async fn initialize(&self) -> Result<()> {
-        // Test connection
+        self.test_connection().await?;
+
+        // Run migrations
+        self.run_migrations().await?;
+
+        Ok(())
+    }
+
+    /// Open a connection and run a trivial query
+    ///
+    /// The pool is created lazily, so this is where a bad URL or unreadable
+    /// file surfaces. The pool keeps its minimum idle connections itself.
+    pub async fn test_connection(&self) -> Result<()> {
         sqlx::query("SELECT 1")
             .execute(&self.pool)
             .await
             .map_err(|e| Error::Database(format!("Failed to connect: {e}")))?;
 
-        // Run migrations
-        self.run_migrations().await?;
-
         Ok(())
     }
 
@@ -124,6 +180,8 @@ impl Database {
     ///
     /// This is a helper that returns the SQL query string with placeholders.
     /// Individual transforms should use this to build their batch insert queries.
+    /// Statements are rendered once per (table, columns, conflict column, row count)
+    /// and shared from a process-wide cache afterwards.
     ///
     /// # Arguments
     /// * `table` - Table name (e.g., "data_location_point")
@@ -151,30 +209,70 @@ impl Database {
         columns: &[&str],
         conflict_column: &str,
         num_rows: usize,
-    ) -> String {
-        let num_cols = columns.len();
-
-        let mut query = format!("INSERT INTO {} (", table);
-        query.push_str(&columns.join(", "));
-        query.push_str(") VALUES ");
-
-        // Build VALUES clauses: ($1, $2, $3), ($4, $5, $6), ...
-        // Note: SQLite via sqlx supports $N style parameters
-        let mut value_clauses = Vec::with_capacity(num_rows);
-        for row_idx in 0..num_rows {
-            let mut placeholders = Vec::with_capacity(num_cols);
-            for col_idx in 0..num_cols {
-                let param_num = row_idx * num_cols + col_idx + 1;
-                placeholders.push(format!("${}", param_num));
-            }
-            value_clauses.push(format!("({})", placeholders.join(", ")));
-        }
+    ) -> Arc<str> {
+        Self::cached_batch_insert_query(table, columns, conflict_column, None, num_rows)
+    }
 
-        query.push_str(&value_clauses.join(", "));
-        // SQLite uses same ON CONFLICT syntax as PostgreSQL
-        query.push_str(&format!(" ON CONFLICT ({}) DO NOTHING", conflict_column));
+    /// Batch upsert helper - like `build_batch_insert_query`, but resolves
+    /// conflicts with `DO UPDATE SET <update_set>` instead of `DO NOTHING`
+    ///
+    /// Statements are cached the same way, so callers should pass a fixed
+    /// `update_set` string (e.g. a `const`) rather than formatting one per call.
+    ///
+    /// # Example
+    /// ```ignore
+    /// let query_str = Database::build_batch_upsert_query(
+    ///     "data_financial_account",
+    ///     &["id", "account_name", "current_balance"],
+    ///     "id",
+    ///     "current_balance = EXCLUDED.current_balance, updated_at = datetime('now')",
+    ///     100,
+    /// );
+    /// // Returns: INSERT INTO data_financial_account (id, account_name, current_balance)
+    /// //          VALUES ($1, $2, $3), ($4, $5, $6), ...
+    /// //          ON CONFLICT (id) DO UPDATE SET current_balance = EXCLUDED.current_balance, ...
+    /// ```
+    pub fn build_batch_upsert_query(
+        table: &str,
+        columns: &[&str],
+        conflict_column: &str,
+        update_set: &str,
+        num_rows: usize,
+    ) -> Arc<str> {
+        Self::cached_batch_insert_query(table, columns, conflict_column, Some(update_set), num_rows)
+    }
+
+    fn cached_batch_insert_query(
+        table: &str,
+        columns: &[&str],
+        conflict_column: &str,
+        update_set: Option<&str>,
+        num_rows: usize,
+    ) -> Arc<str> {
+        // Looked up on every batch, so build the key in a single allocation
+        // rather than going through join + format
+        let mut shape = String::with_capacity(
+            table.len()
+                + columns.iter().map(|c| c.len() + 1).sum::<usize>()
+                + conflict_column.len()
+                + update_set.map_or(0, str::len)
+                + 3,
+        );
+        shape.push_str(table);
+        for column in columns {
+            shape.push(',');
+            shape.push_str(column);
+        }
+        shape.push('|');
+        shape.push_str(conflict_column);
+        if let Some(update_set) = update_set {
+            shape.push('|');
+            shape.push_str(update_set);
+        }
 
-        query
+        batch_insert_query_cache().get_with((shape, num_rows), || {
+            render_batch_insert_query(table, columns, conflict_column, update_set, num_rows).into()
+        })
     }
 
     /// Health check
@@ -192,6 +290,50 @@ impl Database {
     }
 }
 
+/// Render a multi-row INSERT statement (see `Database::build_batch_insert_query`)
+fn render_batch_insert_query(
+    table: &str,
+    columns: &[&str],
+    conflict_column: &str,
+    update_set: Option<&str>,
+    num_rows: usize,
+) -> String {
+    let num_cols = columns.len();
+
+    let mut query = format!("INSERT INTO {} (", table);
+    query.push_str(&columns.join(", "));
+    query.push_str(") VALUES ");
+
+    // Build VALUES clauses: ($1, $2, $3), ($4, $5, $6), ...
+    // Note: SQLite via sqlx supports $N style parameters
+    query.reserve(num_rows * num_cols * 7);
+    for row_idx in 0..num_rows {
+        if row_idx > 0 {
+            query.push_str(", ");
+        }
+        query.push('(');
+        for col_idx in 0..num_cols {
+            if col_idx > 0 {
+                query.push_str(", ");
+            }
+            let param_num = row_idx * num_cols + col_idx + 1;
+            let _ = write!(query, "${}", param_num);
+        }
+        query.push(')');
+    }
+
+    // SQLite uses same ON CONFLICT syntax as PostgreSQL
+    let _ = write!(query, " ON CONFLICT ({}) ", conflict_column);
+    match update_set {
+        Some(update_set) => {
+            let _ = write!(query, "DO UPDATE SET {}", update_set);
+        }
+        None => query.push_str("DO NOTHING"),
+    }
+
+    query
+}
+
 /// Health status for database
 #[derive(Debug)]
 pub struct HealthStatus {
@@ -209,4 +351,31 @@ mod tests {
         let result = Database::new("sqlite::memory:");
         assert!(result.is_ok());
     }
+
+    #[test]
+    fn test_build_batch_insert_query() {
+        let query = Database::build_batch_insert_query("t", &["a", "b"], "a", 2);
+        assert_eq!(
+            &*query,
+            "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4) ON CONFLICT (a) DO NOTHING"
+        );
+
+        // Repeated requests share the cached statement
+        let again = Database::build_batch_insert_query("t", &["a", "b"], "a", 2);
+        assert!(Arc::ptr_eq(&query, &again));
+    }
+
+    #[test]
+    fn test_build_batch_upsert_query() {
+        let query =
+            Database::build_batch_upsert_query("t", &["a", "b"], "a", "b = EXCLUDED.b", 2);
+        assert_eq!(
+            &*query,
+            "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4) ON CONFLICT (a) DO UPDATE SET b = EXCLUDED.b"
+        );
+
+        // Distinct from the DO NOTHING statement for the same columns
+        let insert = Database::build_batch_insert_query("t", &["a", "b"], "a", 2);
+        assert!(!Arc::ptr_eq(&query, &insert));
+    }
 }
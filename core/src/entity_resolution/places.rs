@@ -38,6 +38,9 @@ const TEMPORAL_GAP_MINUTES: i64 = 5; // Max time gap within visit (robust for iO
 const MAX_HORIZONTAL_ACCURACY: f64 = 100.0; // Filter low-quality points
 const DEFAULT_PLACE_RADIUS_METERS: f64 = 100.0; // Default radius for new places
 
+/// Merchant name suffixes stripped before matching (compared against the uppercased name)
+const MERCHANT_SUFFIXES: &[&str] = &[" INC", " LLC", " LTD", " CORP", " CO", " #", "*", " - ", "  "];
+
 /// Location point for clustering
 #[derive(Debug, Clone)]
 struct LocationPoint {
@@ -338,43 +341,31 @@ async fn resolve_or_create_merchant_org(
 ///
 /// Removes common suffixes, special characters, and normalizes capitalization.
 fn normalize_merchant_name(name: &str) -> String {
-    let mut normalized = name.to_string();
+    // Uppercase once for suffix matching; ASCII-only so byte offsets line up with `name`
+    let upper = name.to_ascii_uppercase();
 
     // Remove common suffixes
-    let suffixes = [
-        " INC",
-        " LLC",
-        " LTD",
-        " CORP",
-        " CO",
-        " #",
-        "*",
-        " - ",
-        "  ",
-    ];
-    for suffix in &suffixes {
-        if let Some(pos) = normalized.to_uppercase().find(suffix) {
-            normalized.truncate(pos);
+    let mut end = name.len();
+    for suffix in MERCHANT_SUFFIXES {
+        if let Some(pos) = upper[..end].find(suffix) {
+            end = pos;
         }
     }
 
     // Title case
+    let mut normalized = String::with_capacity(end);
+    for word in name[..end].split_whitespace() {
+        if !normalized.is_empty() {
+            normalized.push(' ');
+        }
+        let mut chars = word.chars();
+        if let Some(first) = chars.next() {
+            normalized.extend(first.to_uppercase());
+            normalized.push_str(&chars.as_str().to_lowercase());
+        }
+    }
+
     normalized
-        .split_whitespace()
-        .map(|word| {
-            let mut chars = word.chars();
-            match chars.next() {
-                None => String::new(),
-                Some(first) => {
-                    first.to_uppercase().collect::<String>()
-                        + &chars.as_str().to_lowercase()
-                }
-            }
-        })
-        .collect::<Vec<_>>()
-        .join(" ")
-        .trim()
-        .to_string()
 }
 
 /// Categorize merchant based on Plaid category
@@ -817,4 +808,12 @@ mod tests {
 
         assert_eq!(id1, id2);
     }
+
+    #[test]
+    fn test_normalize_merchant_name() {
+        assert_eq!(normalize_merchant_name("STARBUCKS INC"), "Starbucks");
+        assert_eq!(normalize_merchant_name("blue bottle llc"), "Blue Bottle");
+        assert_eq!(normalize_merchant_name("SQ *SIGHTGLASS"), "Sq");
+        assert_eq!(normalize_merchant_name("Trader Joe's #123"), "Trader Joe's");
+    }
 }
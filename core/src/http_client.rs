@@ -6,6 +6,7 @@
 //! All clients going to Tollbooth should use these to ensure consistent
 //! timeout behavior and connection pooling.
 
+use std::sync::OnceLock;
 use std::time::Duration;
 
 /// Connect timeout in seconds (time to establish TCP connection)
@@ -28,6 +29,17 @@ pub fn tollbooth_client() -> reqwest::Client {
         .expect("Failed to build HTTP client")
 }
 
+/// Process-wide HTTP client with the regular (non-streaming) timeouts
+///
+/// `reqwest::Client` clones share one connection pool, so request handlers
+/// should use this instead of building a client per call - that way
+/// repeated calls to Tollbooth and other upstreams reuse keep-alive
+/// connections rather than paying a TCP + TLS handshake each time.
+pub fn shared_client() -> reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(tollbooth_client).clone()
+}
+
 /// Create an HTTP client for streaming Tollbooth requests (SSE)
 ///
 /// Uses longer timeouts to accommodate streaming responses that
@@ -40,6 +52,17 @@ pub fn tollbooth_streaming_client() -> reqwest::Client {
         .expect("Failed to build streaming HTTP client")
 }
 
+/// Process-wide HTTP client with the streaming timeouts
+///
+/// The streaming counterpart of `shared_client`. Agent turns and transforms
+/// issue many long-running Tollbooth calls back to back; sharing one client
+/// keeps their connections warm between calls instead of rebuilding the
+/// pool for each one.
+pub fn shared_streaming_client() -> reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(tollbooth_streaming_client).clone()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
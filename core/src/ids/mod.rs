@@ -11,7 +11,7 @@
 //! // All IDs use the same function
 //! let session_id = generate_id("session", &["My Chat", "2024-01-15T10:30:00Z"]);
 //! let archive_id = generate_id("archive", &[&storage_key]);
-//! let msg_id = generate_id("msg", &[&session_id, &uuid::Uuid::new_v4().to_string()]);
+//! let msg_id = generate_random_id("msg", &[&session_id]);
 //! ```
 
 use sha2::{Digest, Sha256};
@@ -110,8 +110,8 @@ pub const SESSION_PREFIX_DEPRECATED: &str = "session";  // Kept for backwards co
 /// // Archive job: unique by storage key
 /// let id = generate_id("archive", &[&storage_key]);
 ///
-/// // Message: unique by session + random UUID
-/// let id = generate_id("msg", &[&session_id, &uuid::Uuid::new_v4().to_string()]);
+/// // Message: unique by session + random UUID (see `generate_random_id`)
+/// let id = generate_random_id("msg", &[&session_id]);
 ///
 /// // Checkpoint: unique by source + stream + key
 /// let id = generate_id("checkpoint", &[source_id, stream_name, checkpoint_key]);
@@ -120,11 +120,29 @@ pub const SESSION_PREFIX_DEPRECATED: &str = "session";  // Kept for backwards co
 /// let id = generate_id("day", &[date]);
 /// ```
 pub fn generate_id(prefix: &str, components: &[&str]) -> String {
+    finish_id(prefix, component_hasher(components))
+}
+
+/// Generate a semantic ID for an entity with no natural key
+///
+/// Hashes `components` followed by a fresh random UUID. The UUID's raw bytes
+/// are fed to the hasher directly instead of being formatted as a string first.
+pub fn generate_random_id(prefix: &str, components: &[&str]) -> String {
+    let mut hasher = component_hasher(components);
+    hasher.update(uuid::Uuid::new_v4().as_bytes());
+    finish_id(prefix, hasher)
+}
+
+fn component_hasher(components: &[&str]) -> Sha256 {
     let mut hasher = Sha256::new();
     for component in components {
         hasher.update(component.as_bytes());
         hasher.update(b"|"); // Separator to avoid collisions like ["ab", "c"] vs ["a", "bc"]
     }
+    hasher
+}
+
+fn finish_id(prefix: &str, hasher: Sha256) -> String {
     let hash = hasher.finalize();
     let hash_str = hex::encode(&hash[..8]); // 16 hex chars from 8 bytes
     format!("{}_{}", prefix, hash_str)
@@ -195,6 +213,15 @@ mod tests {
         assert_eq!(id.len(), "test_".len() + 16);
     }
 
+    #[test]
+    fn test_generate_random_id_unique() {
+        let id1 = generate_random_id("msg", &["chat_1"]);
+        let id2 = generate_random_id("msg", &["chat_1"]);
+        assert_ne!(id1, id2);
+        assert!(id1.starts_with("msg_"));
+        assert_eq!(id1.len(), "msg_".len() + 16);
+    }
+
     #[test]
     fn test_extract_prefix() {
         assert_eq!(extract_prefix("session_a1b2c3d4e5f6g7h8"), Some("session"));
@@ -38,33 +38,33 @@ impl JobExecutor {
         let context = self.context.clone();
 
         tokio::spawn(async move {
-            if let Err(e) = Self::run_job(&db, &context, &job_id).await {
-                tracing::error!(
-                    job_id = %job_id,
-                    error = %e,
-                    "Job execution failed"
-                );
-            }
+            // Failures are already logged where they occur: by run_job before
+            // a job is claimed, then by the job handler and the job timer
+            let _ = Self::run_job(&db, &context, &job_id).await;
         });
     }
 
     /// Internal method to run a job
     async fn run_job(db: &SqlitePool, context: &Arc<TransformContext>, job_id: &str) -> Result<()> {
-        // Fetch the job
-        let job = super::get_job(db, job_id).await?;
-
-        // Check if job is in pending state
-        if job.status != JobStatus::Pending {
-            tracing::warn!(
-                job_id = %job_id,
-                status = %job.status,
-                "Job is not in pending state, skipping execution"
-            );
-            return Ok(());
-        }
-
-        // Update job status to running
-        super::update_job_status(db, &job.id, JobStatus::Running, None).await?;
+        // Claim the job: pending -> running in one statement
+        let job = match super::claim_pending_job(db, job_id).await {
+            Ok(Some(job)) => job,
+            Ok(None) => {
+                tracing::warn!(
+                    job_id = %job_id,
+                    "Job is not in pending state, skipping execution"
+                );
+                return Ok(());
+            }
+            Err(e) => {
+                tracing::error!(
+                    job_id = %job_id,
+                    error = %e,
+                    "Failed to claim job"
+                );
+                return Err(e);
+            }
+        };
 
         // Start metrics timer
         let job_type_str = job.job_type.to_string();
@@ -105,16 +105,12 @@ impl JobExecutor {
                 timer.success();
             }
             Err(e) => {
-                timer.failure(&e.to_string());
+                let message = e.to_string();
+                timer.failure(&message);
                 // Ensure job is marked as failed even if the job handler didn't do it
                 // (e.g., early metadata validation errors in transform_job)
-                let _ = super::update_job_status(
-                    db,
-                    &job.id,
-                    JobStatus::Failed,
-                    Some(e.to_string()),
-                )
-                .await;
+                let _ =
+                    super::update_job_status(db, &job.id, JobStatus::Failed, Some(message)).await;
             }
         }
 
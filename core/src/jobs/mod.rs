@@ -23,6 +23,31 @@ pub use transform_trigger::create_transform_job_for_stream;
 
 use crate::error::{Error, Result};
 use sqlx::SqlitePool;
+use std::sync::OnceLock;
+
+/// Prefix of runner ids belonging to server processes
+const SERVER_RUNNER_PREFIX: &str = "server-";
+
+/// Id of this process, recorded on every job it creates or claims
+static RUNNER_ID: OnceLock<String> = OnceLock::new();
+
+/// Mark this process as the server for job ownership
+///
+/// Must run before the process creates or claims any job. Jobs owned by
+/// other server ids were left behind by a previous server and are
+/// recovered by [`recover_interrupted_jobs`]; jobs owned by any other
+/// process (e.g. a CLI sync) are left alone.
+pub fn mark_server_process() {
+    let id = format!("{SERVER_RUNNER_PREFIX}{}", uuid::Uuid::new_v4());
+    if RUNNER_ID.set(id).is_err() {
+        tracing::warn!("Job runner id was assigned before the server started");
+    }
+}
+
+/// Id recorded as the owner of jobs created or claimed by this process
+fn runner_id() -> &'static str {
+    RUNNER_ID.get_or_init(|| format!("process-{}", uuid::Uuid::new_v4()))
+}
 
 /// Helper function to convert a row to a Job
 fn job_from_row(row: &sqlx::sqlite::SqliteRow) -> Result<Job> {
@@ -56,35 +81,9 @@ fn job_from_row(row: &sqlx::sqlite::SqliteRow) -> Result<Job> {
     })
 }
 
-/// Check if a stream has an active (pending or running) sync job
-pub async fn has_active_sync_job(
-    db: &SqlitePool,
-    source_id: &str,
-    stream_name: &str,
-) -> Result<bool> {
-    let result = sqlx::query_scalar::<_, bool>(
-        r#"
-        SELECT EXISTS(
-            SELECT 1 FROM elt_jobs
-            WHERE source_connection_id = $1
-              AND stream_name = $2
-              AND job_type = 'sync'
-              AND status IN ('pending', 'running')
-        )
-        "#,
-    )
-    .bind(source_id)
-    .bind(stream_name)
-    .fetch_one(db)
-    .await?;
-
-    Ok(result)
-}
-
-/// Create a new job in the database
-pub async fn create_job(db: &SqlitePool, request: CreateJobRequest) -> Result<Job> {
-    // Generate ID with proper prefix (job_{hash16})
-    let job_id = crate::ids::generate_id(
+/// Generate a job ID with proper prefix (job_{hash16})
+fn generate_job_id(request: &CreateJobRequest) -> String {
+    crate::ids::generate_id(
         crate::ids::JOB_PREFIX,
         &[
             &request.job_type.to_string(),
@@ -92,7 +91,12 @@ pub async fn create_job(db: &SqlitePool, request: CreateJobRequest) -> Result<Jo
             request.stream_name.as_deref().unwrap_or(""),
             &chrono::Utc::now().to_rfc3339(),
         ],
-    );
+    )
+}
+
+/// Create a new job in the database
+pub async fn create_job(db: &SqlitePool, request: CreateJobRequest) -> Result<Job> {
+    let job_id = generate_job_id(&request);
     let row = sqlx::query(
         r#"
         INSERT INTO elt_jobs (
@@ -106,8 +110,9 @@ pub async fn create_job(db: &SqlitePool, request: CreateJobRequest) -> Result<Jo
             transform_strategy,
             parent_job_id,
             transform_stage,
-            metadata
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+            metadata,
+            runner_id
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
         RETURNING *
         "#,
     )
@@ -122,12 +127,87 @@ pub async fn create_job(db: &SqlitePool, request: CreateJobRequest) -> Result<Jo
     .bind(&request.parent_job_id)
     .bind(&request.transform_stage)
     .bind(&request.metadata)
+    .bind(runner_id())
     .fetch_one(db)
     .await?;
 
     Ok(job_from_row(&row)?)
 }
 
+/// Create a sync job unless the stream already has one pending or running
+///
+/// The active-job check is part of the INSERT itself, so eligibility is
+/// decided by the database in the same statement (no separate EXISTS
+/// round-trip, and no window for two triggers to both pass the check).
+///
+/// Incremental syncs whose metadata carries no `cursor_before` get the
+/// stream's stored sync token filled in by the same statement, so callers
+/// don't need to read it first.
+///
+/// Returns `None` when the stream already has an active sync job.
+pub async fn create_sync_job_if_idle(
+    db: &SqlitePool,
+    request: CreateJobRequest,
+) -> Result<Option<Job>> {
+    let job_id = generate_job_id(&request);
+    let row = sqlx::query(
+        r#"
+        WITH stream_cursor AS (
+            SELECT last_sync_token AS token
+            FROM elt_stream_connections
+            WHERE source_connection_id = $4 AND stream_name = $5
+        )
+        INSERT INTO elt_jobs (
+            id,
+            job_type,
+            status,
+            source_connection_id,
+            stream_name,
+            sync_mode,
+            transform_id,
+            transform_strategy,
+            parent_job_id,
+            transform_stage,
+            metadata,
+            runner_id
+        )
+        SELECT $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+            CASE
+                WHEN $6 = 'incremental'
+                     AND json_extract($11, '$.cursor_before') IS NULL
+                     AND (SELECT token FROM stream_cursor) IS NOT NULL
+                THEN json_set($11, '$.cursor_before', (SELECT token FROM stream_cursor))
+                ELSE $11
+            END,
+            $12
+        WHERE NOT EXISTS (
+            SELECT 1 FROM elt_jobs
+            WHERE source_connection_id = $4
+              AND stream_name = $5
+              AND job_type = 'sync'
+              AND status IN ('pending', 'running')
+        )
+        RETURNING *
+        "#,
+    )
+    .bind(&job_id)
+    .bind(&request.job_type.to_string())
+    .bind(&request.status.to_string())
+    .bind(&request.source_connection_id)
+    .bind(&request.stream_name)
+    .bind(&request.sync_mode)
+    .bind(&request.transform_id)
+    .bind(&request.transform_strategy)
+    .bind(&request.parent_job_id)
+    .bind(&request.transform_stage)
+    .bind(&request.metadata)
+    .bind(runner_id())
+    .fetch_optional(db)
+    .await?;
+
+    row.as_ref().map(job_from_row).transpose()
+}
+
 /// Get a job by ID
 pub async fn get_job(db: &SqlitePool, job_id: &str) -> Result<Job> {
     let row = sqlx::query(
@@ -144,6 +224,36 @@ pub async fn get_job(db: &SqlitePool, job_id: &str) -> Result<Job> {
     job_from_row(&row)
 }
 
+/// Move a pending job to running and return it
+///
+/// The pending check and the status change are a single statement, so a job
+/// is claimed in one round-trip and can't be started twice. Returns `None`
+/// when the job exists but is no longer pending.
+pub async fn claim_pending_job(db: &SqlitePool, job_id: &str) -> Result<Option<Job>> {
+    let row = sqlx::query(
+        r#"
+        UPDATE elt_jobs
+        SET status = 'running',
+            runner_id = $2
+        WHERE id = $1 AND status = 'pending'
+        RETURNING *
+        "#,
+    )
+    .bind(job_id)
+    .bind(runner_id())
+    .fetch_optional(db)
+    .await?;
+
+    match row {
+        Some(row) => job_from_row(&row).map(Some),
+        None => {
+            // Distinguish a missing job from one that already left pending
+            get_job(db, job_id).await?;
+            Ok(None)
+        }
+    }
+}
+
 /// Update job status
 pub async fn update_job_status(
     db: &SqlitePool,
@@ -255,6 +365,80 @@ pub async fn query_jobs(
     Ok(jobs)
 }
 
+/// Recover jobs left active by a previous server process
+///
+/// Jobs run as in-process tasks, so a crash or restart leaves their rows
+/// `pending` or `running` forever, and the active-job check then blocks
+/// every later sync of that stream. Sync jobs only depend on their row, so
+/// they are reset to `pending` and re-run. Other jobs may have depended on
+/// in-memory records that are gone, so they are marked failed.
+///
+/// Only jobs owned by another server id are touched: a CLI process may be
+/// running its own jobs against the same database right now. Requires
+/// [`mark_server_process`] to have been called.
+pub async fn recover_interrupted_jobs(db: &SqlitePool, executor: &JobExecutor) -> Result<()> {
+    let current = runner_id();
+    if !current.starts_with(SERVER_RUNNER_PREFIX) {
+        return Err(Error::Other(
+            "Job recovery must run in a process marked as the server".to_string(),
+        ));
+    }
+    let server_pattern = format!("{SERVER_RUNNER_PREFIX}%");
+
+    let mut tx = db.begin().await?;
+
+    let failed = sqlx::query(
+        r#"
+        UPDATE elt_jobs
+        SET status = 'failed',
+            completed_at = datetime('now'),
+            error_message = 'Interrupted by server restart'
+        WHERE status IN ('pending', 'running')
+          AND job_type != 'sync'
+          AND runner_id LIKE $1
+          AND runner_id != $2
+        "#,
+    )
+    .bind(&server_pattern)
+    .bind(current)
+    .execute(&mut *tx)
+    .await?
+    .rows_affected();
+
+    let requeued: Vec<String> = sqlx::query_scalar(
+        r#"
+        UPDATE elt_jobs
+        SET status = 'pending',
+            runner_id = $2
+        WHERE status IN ('pending', 'running')
+          AND job_type = 'sync'
+          AND runner_id LIKE $1
+          AND runner_id != $2
+        RETURNING id
+        "#,
+    )
+    .bind(&server_pattern)
+    .bind(current)
+    .fetch_all(&mut *tx)
+    .await?;
+
+    tx.commit().await?;
+
+    if failed > 0 || !requeued.is_empty() {
+        tracing::info!(
+            failed,
+            requeued = requeued.len(),
+            "Recovered jobs interrupted by a previous shutdown"
+        );
+    }
+
+    for job_id in requeued {
+        executor.execute_async(job_id);
+    }
+
+    Ok(())
+}
+
 /// Cancel a running job
 pub async fn cancel_job(db: &SqlitePool, job_id: &str) -> Result<()> {
     let rows_affected = sqlx::query(
@@ -156,6 +156,7 @@ pub struct CreateJobRequest {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SyncJobMetadata {
     pub sync_mode: String,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub cursor_before: Option<String>,
 }
 
@@ -5,11 +5,44 @@ use crate::jobs::models::Job;
 use crate::jobs::{JobExecutor, TransformContext};
 use crate::sources::base::SyncMode;
 use crate::sources::StreamFactory;
-use crate::registry;
-use serde_json::json;
+use chrono::{DateTime, Utc};
+use serde::Serialize;
+use sqlx::types::Json;
 use sqlx::SqlitePool;
 use std::sync::Arc;
 
+/// Job metadata recorded when a sync succeeds
+///
+/// Borrows from the sync result and is serialized straight into the
+/// UPDATE, rather than being built up as an intermediate JSON tree.
+/// Unset optional fields are omitted; readers treat a missing key as null.
+#[derive(Debug, Serialize)]
+struct SyncSucceededMetadata<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    cursor_before: Option<&'a str>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    cursor_after: Option<&'a str>,
+    records_fetched: usize,
+    records_written: usize,
+    records_failed: usize,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    earliest_record_at: Option<DateTime<Utc>>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    latest_record_at: Option<DateTime<Utc>>,
+    duration_ms: i64,
+    direct_transform_enabled: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    storage_key: Option<&'a str>,
+}
+
+/// Job metadata recorded when a sync fails
+#[derive(Debug, Serialize)]
+struct SyncFailedMetadata<'a> {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    cursor_before: Option<&'a str>,
+    error_class: &'a str,
+}
+
 /// Execute a sync job
 ///
 /// This function is called by the job executor to perform the actual sync work.
@@ -35,23 +68,21 @@ pub async fn execute_sync_job(
         .as_ref()
         .ok_or_else(|| crate::Error::InvalidInput("Sync job missing sync_mode".to_string()))?;
 
-    // 1. Tier Enforcement
-    // Get source and stream info from registry
-    let source_conn = sqlx::query!(
-        "SELECT source FROM elt_source_connections WHERE id = $1",
-        source_id
-    )
-    .fetch_one(db)
-    .await
-    .map_err(|e| crate::Error::Database(format!("Failed to fetch source connection: {}", e)))?;
-
-    let registered_stream = registry::get_stream(&source_conn.source, stream_name).ok_or_else(|| {
-        crate::Error::InvalidInput(format!(
-            "Stream '{}' not found for source '{}'",
-            stream_name, source_conn.source
-        ))
-    })?;
+    // Create factory and stream instance using new PullStream API. The factory
+    // resolves the connection's provider, so it is not queried separately here.
+    let factory = StreamFactory::new(
+        db.clone(),
+        context.storage.clone(),
+        context.stream_writer.clone(),
+    );
+    // The factory resolves the stream's registry entry while building it, so
+    // the tier check below uses that rather than a second lookup
+    let (mut stream_type, registered_stream) = factory
+        .create_stream_with_descriptor(&source_id, stream_name)
+        .await?;
+    let source_type = stream_type.source_name().to_string();
 
+    // 1. Tier Enforcement
     // Get user tier (mocked for now, should come from profile/subscription)
     // TODO: Implement actual subscription check
     let user_tier = virtues_registry::sources::SourceTier::Standard;
@@ -108,14 +139,6 @@ pub async fn execute_sync_job(
         }
     };
 
-    // Create factory and stream instance using new PullStream API
-    let factory = StreamFactory::new(
-        db.clone(),
-        context.storage.clone(),
-        context.stream_writer.clone(),
-    );
-    let mut stream_type = factory.create_stream_typed(&source_id, stream_name).await?;
-
     // Ensure we got a PullStream (sync jobs should only work with pull streams)
     let pull_stream = match stream_type.as_pull_mut() {
         Some(stream) => stream,
@@ -134,37 +157,11 @@ pub async fn execute_sync_job(
     let result = pull_stream.sync_pull(sync_mode.clone()).await;
 
     match result {
-        Ok(sync_result) => {
-            // Update watermarks and sync status
-            sqlx::query(
-                r#"
-                UPDATE elt_stream_connections
-                SET last_sync_at = $1, 
-                    last_sync_token = $2, 
-                    earliest_record_at = COALESCE(earliest_record_at, $3),
-                    latest_record_at = $4,
-                    sync_status = $5,
-                    updated_at = datetime('now')
-                WHERE source_connection_id = $6 AND stream_name = $7
-                "#,
-            )
-            .bind(sync_result.completed_at)
-            .bind(&sync_result.next_cursor)
-            .bind(sync_result.earliest_record_at)
-            .bind(sync_result.latest_record_at)
-            .bind(match sync_mode {
-                SyncMode::FullRefresh => "initial",
-                SyncMode::Incremental { .. } => "incremental",
-                SyncMode::Backfill { .. } => "backfilling",
-            })
-            .bind(&source_id)
-            .bind(stream_name)
-            .execute(db)
-            .await?;
-
-            // Extract records for direct transform and archival
+        Ok(mut sync_result) => {
+            // Take the records for direct transform and archival; the rest of
+            // the result is only read for its stats, so they aren't copied
             let has_records = sync_result.records.is_some();
-            let records = sync_result.records.clone().unwrap_or_default();
+            let records = sync_result.records.take().unwrap_or_default();
 
             tracing::info!(
                 stream_name = %stream_name,
@@ -173,33 +170,31 @@ pub async fn execute_sync_job(
                 "Sync completed, checking for records to archive"
             );
 
-            // Write records directly to filesystem (sync, no async job queue)
-            let storage_key = if !records.is_empty() {
+            // Write records directly to filesystem (sync, no async job queue);
+            // the metadata row is recorded below with the rest of the writes
+            let archived = if !records.is_empty() {
                 tracing::info!(
                     stream_name = %stream_name,
                     record_count = records.len(),
                     "Writing records to filesystem"
                 );
 
-                let storage_key = write_stream_records(
-                    db,
+                let archived = upload_stream_records(
                     context.storage.as_ref(),
                     &source_id,
-                    &source_conn.source,
+                    &source_type,
                     stream_name,
                     &records,
-                    sync_result.earliest_record_at,
-                    sync_result.latest_record_at,
                 )
                 .await?;
 
                 tracing::info!(
                     stream_name = %stream_name,
-                    storage_key = %storage_key,
+                    storage_key = %archived.storage_key,
                     "Records written to filesystem successfully"
                 );
 
-                Some(storage_key)
+                Some(archived)
             } else {
                 tracing::warn!(
                     stream_name = %stream_name,
@@ -209,18 +204,62 @@ pub async fn execute_sync_job(
             };
 
             // Build metadata with detailed sync info
-            let metadata = json!({
-                "cursor_before": cursor_before,
-                "cursor_after": sync_result.next_cursor,
-                "records_fetched": sync_result.records_fetched,
-                "records_written": sync_result.records_written,
-                "records_failed": sync_result.records_failed,
-                "earliest_record_at": sync_result.earliest_record_at,
-                "latest_record_at": sync_result.latest_record_at,
-                "duration_ms": sync_result.duration_ms(),
-                "direct_transform_enabled": has_records,
-                "storage_key": storage_key
-            });
+            let metadata = SyncSucceededMetadata {
+                cursor_before: cursor_before.as_deref(),
+                cursor_after: sync_result.next_cursor.as_deref(),
+                records_fetched: sync_result.records_fetched,
+                records_written: sync_result.records_written,
+                records_failed: sync_result.records_failed,
+                earliest_record_at: sync_result.earliest_record_at,
+                latest_record_at: sync_result.latest_record_at,
+                duration_ms: sync_result.duration_ms(),
+                direct_transform_enabled: has_records,
+                storage_key: archived.as_ref().map(|a| a.storage_key.as_str()),
+            };
+
+            // Record the watermarks, the archived object and the job outcome
+            // in a single transaction: one commit instead of one per write
+            let mut tx = db.begin().await?;
+
+            // Update watermarks and sync status
+            sqlx::query(
+                r#"
+                UPDATE elt_stream_connections
+                SET last_sync_at = $1, 
+                    last_sync_token = $2, 
+                    earliest_record_at = COALESCE(earliest_record_at, $3),
+                    latest_record_at = $4,
+                    sync_status = $5,
+                    updated_at = datetime('now')
+                WHERE source_connection_id = $6 AND stream_name = $7
+                "#,
+            )
+            .bind(sync_result.completed_at)
+            .bind(&sync_result.next_cursor)
+            .bind(sync_result.earliest_record_at)
+            .bind(sync_result.latest_record_at)
+            .bind(match sync_mode {
+                SyncMode::FullRefresh => "initial",
+                SyncMode::Incremental { .. } => "incremental",
+                SyncMode::Backfill { .. } => "backfilling",
+            })
+            .bind(&source_id)
+            .bind(stream_name)
+            .execute(&mut *tx)
+            .await?;
+
+            if let Some(archived) = &archived {
+                record_stream_object(
+                    &mut *tx,
+                    &source_id,
+                    stream_name,
+                    archived,
+                    records.len(),
+                    sync_result.earliest_record_at,
+                    sync_result.latest_record_at,
+                )
+                .await?;
+            }
 
             // Update job with final stats and metadata
             sqlx::query(
@@ -234,11 +273,13 @@ pub async fn execute_sync_job(
                 "#,
             )
             .bind(sync_result.records_written as i64)
-            .bind(metadata)
+            .bind(Json(&metadata))
             .bind(&job.id)
-            .execute(db)
+            .execute(&mut *tx)
             .await?;
 
+            tx.commit().await?;
+
             tracing::info!(
                 job_id = %job.id,
                 stream_name = %stream_name,
@@ -246,7 +287,7 @@ pub async fn execute_sync_job(
                 records_written = sync_result.records_written,
                 duration_ms = sync_result.duration_ms(),
                 direct_transform = has_records,
-                storage_key = ?storage_key,
+                storage_key = ?metadata.storage_key,
                 "Sync job completed successfully"
             );
 
@@ -284,10 +325,10 @@ pub async fn execute_sync_job(
             let error_class = classify_sync_error(&e);
 
             // Build metadata with error details
-            let metadata = json!({
-                "cursor_before": cursor_before,
-                "error_class": error_class
-            });
+            let metadata = SyncFailedMetadata {
+                cursor_before: cursor_before.as_deref(),
+                error_class,
+            };
 
             // Update job with error
             sqlx::query(
@@ -303,7 +344,7 @@ pub async fn execute_sync_job(
             )
             .bind(e.to_string())
             .bind(error_class)
-            .bind(metadata)
+            .bind(Json(&metadata))
             .bind(&job.id)
             .execute(db)
             .await?;
@@ -332,10 +373,17 @@ pub async fn execute_sync_job(
     }
 }
 
+/// A batch of stream records written to storage but not yet recorded
+pub(crate) struct ArchivedRecords {
+    pub storage_key: String,
+    pub size_bytes: i64,
+}
+
 /// Write stream records directly to filesystem and record metadata
 ///
 /// This replaces the async archive job system with synchronous filesystem writes.
-async fn write_stream_records(
+/// Shared by pull syncs and the push ingest path so both archive identically.
+pub(crate) async fn write_stream_records(
     db: &SqlitePool,
     storage: &crate::storage::Storage,
     source_id: &str,
@@ -345,7 +393,34 @@ async fn write_stream_records(
     min_timestamp: Option<chrono::DateTime<chrono::Utc>>,
     max_timestamp: Option<chrono::DateTime<chrono::Utc>>,
 ) -> Result<String> {
-    use chrono::Utc;
+    let archived =
+        upload_stream_records(storage, source_id, source_type, stream_name, records).await?;
+
+    record_stream_object(
+        db,
+        source_id,
+        stream_name,
+        &archived,
+        records.len(),
+        min_timestamp,
+        max_timestamp,
+    )
+    .await?;
+
+    Ok(archived.storage_key)
+}
+
+/// Write stream records to storage as JSONL
+///
+/// Callers must follow up with [`record_stream_object`] so the object is
+/// visible to the lake.
+pub(crate) async fn upload_stream_records(
+    storage: &crate::storage::Storage,
+    source_id: &str,
+    source_type: &str,
+    stream_name: &str,
+    records: &[serde_json::Value],
+) -> Result<ArchivedRecords> {
     use crate::storage::models::StreamKeyBuilder;
 
     let date = Utc::now().date_naive();
@@ -353,17 +428,32 @@ async fn write_stream_records(
         .map_err(|e| crate::Error::Other(format!("Invalid stream key: {}", e)))?;
     let storage_key = key_builder.build();
 
-    // Write JSONL to filesystem
-    storage.upload_jsonl(&storage_key, records).await?;
+    // Write JSONL to filesystem (size comes from the serialized payload)
+    let size_bytes = storage.upload_jsonl(&storage_key, records).await? as i64;
 
-    // Calculate size
-    let size_bytes: i64 = records
-        .iter()
-        .map(|r| serde_json::to_string(r).unwrap_or_default().len() as i64)
-        .sum();
+    Ok(ArchivedRecords {
+        storage_key,
+        size_bytes,
+    })
+}
 
-    // Record metadata in elt_stream_objects
-    let stream_object_id = crate::ids::generate_id(crate::ids::STREAM_OBJECT_PREFIX, &[&storage_key]);
+/// Record metadata for an archived object in elt_stream_objects
+///
+/// Takes any executor so it can join a caller's transaction.
+pub(crate) async fn record_stream_object<'e, E>(
+    executor: E,
+    source_id: &str,
+    stream_name: &str,
+    archived: &ArchivedRecords,
+    record_count: usize,
+    min_timestamp: Option<chrono::DateTime<chrono::Utc>>,
+    max_timestamp: Option<chrono::DateTime<chrono::Utc>>,
+) -> Result<()>
+where
+    E: sqlx::SqliteExecutor<'e>,
+{
+    let stream_object_id =
+        crate::ids::generate_id(crate::ids::STREAM_OBJECT_PREFIX, &[&archived.storage_key]);
     sqlx::query(
         "INSERT INTO elt_stream_objects
          (id, source_connection_id, stream_name, storage_key, record_count, size_bytes,
@@ -373,51 +463,41 @@ async fn write_stream_records(
     .bind(&stream_object_id)
     .bind(source_id)
     .bind(stream_name)
-    .bind(&storage_key)
-    .bind(records.len() as i32)
-    .bind(size_bytes)
+    .bind(&archived.storage_key)
+    .bind(record_count as i32)
+    .bind(archived.size_bytes)
     .bind(min_timestamp)
     .bind(max_timestamp)
-    .execute(db)
+    .execute(executor)
     .await?;
 
     tracing::info!(
         stream_object_id = %stream_object_id,
-        storage_key = %storage_key,
-        record_count = records.len(),
+        storage_key = %archived.storage_key,
+        record_count = record_count,
         "Stream object metadata recorded"
     );
 
-    Ok(storage_key)
+    Ok(())
 }
 
 /// Classify errors for monitoring and alerting
 fn classify_sync_error(error: &crate::error::Error) -> &'static str {
     use crate::error::Error;
+    use crate::sources::base::oauth_client::api_error_status;
 
     match error {
-        Error::Http(msg) => {
-            let msg_lower = msg.to_lowercase();
-            if msg_lower.contains("401") || msg_lower.contains("unauthorized") {
-                "auth_error"
-            } else if msg_lower.contains("429") || msg_lower.contains("rate limit") {
-                "rate_limit"
-            } else if msg_lower.contains("sync token") {
-                "sync_token_error"
-            } else if msg_lower.contains("5")
-                && (msg_lower.contains("500") || msg_lower.contains("503"))
-            {
-                "server_error"
-            } else if msg_lower.contains("4")
-                && (msg_lower.contains("400") || msg_lower.contains("404"))
-            {
-                "client_error"
-            } else {
-                "network_error"
-            }
-        }
+        Error::Http(_) => match api_error_status(error) {
+            Some(status) => classify_http_status(status),
+            None => "network_error",
+        },
+        Error::Reqwest(e) => match e.status() {
+            Some(status) => classify_http_status(status),
+            None => "network_error",
+        },
+        Error::Network(_) => "network_error",
         Error::Source(_) => "sync_token_error",
-        Error::Database(_) => "database_error",
+        Error::Database(_) | Error::Sql(_) => "database_error",
         Error::Storage(_) => "storage_error",
         Error::Authentication(_) | Error::Unauthorized(_) => "auth_error",
         Error::Serialization(_) => "serialization_error",
@@ -425,3 +505,14 @@ fn classify_sync_error(error: &crate::error::Error) -> &'static str {
         _ => "unknown_error",
     }
 }
+
+/// Map an upstream response status onto a sync error class
+fn classify_http_status(status: reqwest::StatusCode) -> &'static str {
+    match status.as_u16() {
+        401 => "auth_error",
+        429 => "rate_limit",
+        500..=599 => "server_error",
+        400..=499 => "client_error",
+        _ => "network_error",
+    }
+}
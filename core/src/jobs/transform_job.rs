@@ -3,7 +3,8 @@
 //! Handles execution of transformation jobs that convert raw stream data
 //! into normalized ontology tables.
 
-use serde_json::json;
+use serde::Serialize;
+use sqlx::types::Json;
 use sqlx::SqlitePool;
 use std::sync::Arc;
 
@@ -13,6 +14,29 @@ use crate::jobs::transform_context::TransformContext;
 use crate::jobs::transform_factory::TransformFactory;
 use crate::jobs::JobExecutor;
 
+/// Job metadata recorded when a transform succeeds
+///
+/// Serialized straight from borrowed fields, like the sync job metadata.
+#[derive(Debug, Serialize)]
+struct TransformSucceededMetadata<'a> {
+    source_table: &'a str,
+    target_table: &'a str,
+    domain: &'a str,
+    records_read: usize,
+    records_written: usize,
+    records_failed: usize,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    last_processed_id: Option<&'a str>,
+}
+
+/// Job metadata recorded when a transform fails
+#[derive(Debug, Serialize)]
+struct TransformFailedMetadata<'a> {
+    source_table: &'a str,
+    target_table: &'a str,
+    error: &'a str,
+}
+
 /// Execute a transform job
 ///
 /// This function is called by the job executor to perform the actual transformation work.
@@ -71,15 +95,15 @@ pub async fn execute_transform_job(
     match result {
         Ok(transform_result) => {
             // Build metadata with detailed transform info
-            let metadata = json!({
-                "source_table": source_table,
-                "target_table": target_table,
-                "domain": transformer.domain(),
-                "records_read": transform_result.records_read,
-                "records_written": transform_result.records_written,
-                "records_failed": transform_result.records_failed,
-                "last_processed_id": transform_result.last_processed_id,
-            });
+            let metadata = TransformSucceededMetadata {
+                source_table,
+                target_table,
+                domain: transformer.domain(),
+                records_read: transform_result.records_read,
+                records_written: transform_result.records_written,
+                records_failed: transform_result.records_failed,
+                last_processed_id: transform_result.last_processed_id.as_deref(),
+            };
 
             // Update job with success
             sqlx::query(
@@ -93,7 +117,7 @@ pub async fn execute_transform_job(
                 "#,
             )
             .bind(transform_result.records_written as i64)
-            .bind(metadata)
+            .bind(Json(&metadata))
             .bind(&job.id)
             .execute(db)
             .await?;
@@ -149,11 +173,12 @@ pub async fn execute_transform_job(
         }
         Err(e) => {
             // Build metadata with error details
-            let metadata = json!({
-                "source_table": source_table,
-                "target_table": target_table,
-                "error": e.to_string(),
-            });
+            let error_message = e.to_string();
+            let metadata = TransformFailedMetadata {
+                source_table,
+                target_table,
+                error: &error_message,
+            };
 
             // Update job with failure
             sqlx::query(
@@ -166,8 +191,8 @@ pub async fn execute_transform_job(
                 WHERE id = $3
                 "#,
             )
-            .bind(e.to_string())
-            .bind(metadata)
+            .bind(&error_message)
+            .bind(Json(&metadata))
             .bind(&job.id)
             .execute(db)
             .await?;
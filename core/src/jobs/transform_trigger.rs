@@ -46,7 +46,7 @@ pub async fn create_transform_job_for_stream(
 
     // Use source registry as single source of truth for stream → ontology mapping
     let (source_name, stream) =
-        registry::get_stream_by_table_name(&table_name).ok_or_else(|| {
+        registry::get_stream_by_table_name(table_name).ok_or_else(|| {
             let err = Error::InvalidInput(format!(
                 "Unknown stream for transform: '{}'. Check registry for valid streams.",
                 table_name
@@ -67,7 +67,7 @@ impl TollboothClient {
         Ok(Self {
             secret,
             user_id: tollbooth::SYSTEM_USER_ID.to_string(),
-            client: crate::http_client::tollbooth_client(),
+            client: crate::http_client::shared_client(),
             base_url,
         })
     }
@@ -77,7 +77,7 @@ impl TollboothClient {
         Self {
             secret,
             user_id,
-            client: crate::http_client::tollbooth_client(),
+            client: crate::http_client::shared_client(),
             base_url: "http://localhost:9002".to_string(),
         }
     }
@@ -87,7 +87,7 @@ impl TollboothClient {
         Self {
             secret,
             user_id,
-            client: crate::http_client::tollbooth_client(),
+            client: crate::http_client::shared_client(),
             base_url,
         }
     }
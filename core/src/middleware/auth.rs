@@ -192,23 +192,42 @@ pub async fn delete_all_user_sessions(pool: &SqlitePool, user_id: String) -> cra
     Ok(())
 }
 
+/// Maximum rows removed per DELETE by the expiry cleanups
+const CLEANUP_CHUNK_SIZE: i64 = 10_000;
+
+/// Delete expired rows from an auth table in bounded chunks
+///
+/// Each chunk commits on its own, so a large backlog never holds the
+/// SQLite write lock (or grows the WAL) for one long-running DELETE.
+async fn delete_expired_in_chunks(pool: &SqlitePool, table: &str) -> crate::Result<u64> {
+    let sql = format!(
+        "DELETE FROM {table} WHERE rowid IN \
+         (SELECT rowid FROM {table} WHERE expires < datetime('now') LIMIT $1)"
+    );
+
+    let mut total = 0;
+    loop {
+        let deleted = sqlx::query(&sql)
+            .bind(CLEANUP_CHUNK_SIZE)
+            .execute(pool)
+            .await?
+            .rows_affected();
+        total += deleted;
+
+        if deleted < CLEANUP_CHUNK_SIZE as u64 {
+            return Ok(total);
+        }
+    }
+}
+
 /// Cleanup expired sessions
 pub async fn cleanup_expired_sessions(pool: &SqlitePool) -> crate::Result<u64> {
-    let result = sqlx::query!("DELETE FROM app_auth_session WHERE expires < datetime('now')")
-        .execute(pool)
-        .await?;
-
-    Ok(result.rows_affected())
+    delete_expired_in_chunks(pool, "app_auth_session").await
 }
 
 /// Cleanup expired verification tokens
 pub async fn cleanup_expired_tokens(pool: &SqlitePool) -> crate::Result<u64> {
-    let result =
-        sqlx::query!("DELETE FROM app_auth_verification_token WHERE expires < datetime('now')")
-            .execute(pool)
-            .await?;
-
-    Ok(result.rows_affected())
+    delete_expired_in_chunks(pool, "app_auth_verification_token").await
 }
 
 /// Middleware function that checks for valid authentication
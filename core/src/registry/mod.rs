@@ -175,13 +175,30 @@ impl<'de> Deserialize<'de> for RegisteredStream {
     }
 }
 
+/// Shared stream metadata indexed by stream name, built once
+///
+/// Every `RegisteredStream::new` call looks its descriptor up here instead of
+/// rebuilding and scanning the full `registered_streams()` list.
+fn stream_manifest() -> &'static HashMap<&'static str, virtues_registry::streams::StreamDescriptor> {
+    static MANIFEST: std::sync::OnceLock<HashMap<&'static str, virtues_registry::streams::StreamDescriptor>> =
+        std::sync::OnceLock::new();
+    MANIFEST.get_or_init(|| {
+        let mut manifest = HashMap::new();
+        for descriptor in virtues_registry::streams::registered_streams() {
+            // Keep the first descriptor for a name, as the previous linear scan did
+            manifest.entry(descriptor.name).or_insert(descriptor);
+        }
+        manifest
+    })
+}
+
 impl RegisteredStream {
     /// Create a new stream descriptor builder
     pub fn new(name: &'static str) -> StreamBuilder {
         // Find metadata in shared registry
-        let descriptor = virtues_registry::streams::registered_streams()
-            .into_iter()
-            .find(|s| s.name == name)
+        let descriptor = stream_manifest()
+            .get(name)
+            .cloned()
             .unwrap_or_else(|| panic!("Stream '{}' not found in virtues-registry", name));
 
         StreamBuilder {
@@ -283,6 +300,22 @@ pub trait SourceRegistry {
 pub struct Registry {
     /// Internal storage for registered sources (public for internal use)
     pub sources: HashMap<String, RegisteredSource>,
+
+    /// Streams indexed by table name: table_name -> (source name, index in `streams`)
+    ///
+    /// Transform dispatch resolves streams by table name on every job, so this
+    /// is built once at registration instead of scanning every source per lookup.
+    streams_by_table: HashMap<&'static str, (&'static str, usize)>,
+
+    /// Table names of enabled streams indexed by short stream name
+    ///
+    /// Backs `normalize_stream_name`, which runs on every transform trigger.
+    table_names_by_stream: HashMap<&'static str, &'static str>,
+
+    /// Enabled streams of enabled sources: (source name, stream name) -> index in `streams`
+    ///
+    /// Every sync job and ingest batch resolves its stream through `get_stream`.
+    streams_by_name: HashMap<(&'static str, &'static str), usize>,
 }
 
 impl Registry {
@@ -290,12 +323,54 @@ impl Registry {
     fn new() -> Self {
         Self {
             sources: HashMap::new(),
+            streams_by_table: HashMap::new(),
+            table_names_by_stream: HashMap::new(),
+            streams_by_name: HashMap::new(),
         }
     }
 
     /// Register a source
     fn register(&mut self, descriptor: RegisteredSource) {
-        self.sources.insert(descriptor.descriptor.name.to_string(), descriptor);
+        let source_name = descriptor.descriptor.name;
+        for (index, stream) in descriptor.streams.iter().enumerate() {
+            self.streams_by_table
+                .entry(stream.descriptor.table_name)
+                .or_insert((source_name, index));
+            if descriptor.descriptor.enabled && stream.descriptor.enabled {
+                self.table_names_by_stream
+                    .entry(stream.descriptor.name)
+                    .or_insert(stream.descriptor.table_name);
+                self.streams_by_name
+                    .entry((source_name, stream.descriptor.name))
+                    .or_insert(index);
+            }
+        }
+        self.sources.insert(source_name.to_string(), descriptor);
+    }
+
+    /// Get a stream by its table name, including disabled streams
+    pub fn get_stream_by_table_name_including_disabled(
+        &self,
+        table_name: &str,
+    ) -> Option<(&str, &RegisteredStream)> {
+        let (source_name, index) = self.streams_by_table.get(table_name)?;
+        let source = self.sources.get(*source_name)?;
+        source.streams.get(*index).map(|stream| (*source_name, stream))
+    }
+
+    /// Get an enabled stream of an enabled source by its table name
+    pub fn get_stream_by_table_name(&self, table_name: &str) -> Option<(&str, &RegisteredStream)> {
+        let (source_name, stream) = self.get_stream_by_table_name_including_disabled(table_name)?;
+        let source_enabled = self
+            .sources
+            .get(source_name)
+            .is_some_and(|source| source.descriptor.enabled);
+        (source_enabled && stream.descriptor.enabled).then_some((source_name, stream))
+    }
+
+    /// Get the table name of an enabled stream by its short name
+    pub fn get_table_name_for_stream(&self, stream_name: &str) -> Option<&'static str> {
+        self.table_names_by_stream.get(stream_name).copied()
     }
 
     /// Get all registered sources
@@ -313,15 +388,10 @@ impl Registry {
 
     /// Get a specific stream from a source
     pub fn get_stream(&self, source_name: &str, stream_name: &str) -> Option<&RegisteredStream> {
-        self.sources
-            .get(source_name)
-            .filter(|source| source.descriptor.enabled)
-            .and_then(|source| {
-                source
-                    .streams
-                    .iter()
-                    .find(|s| s.descriptor.name == stream_name && s.descriptor.enabled)
-            })
+        // Keys are 'static, but the map is covariant so borrowed names can look up directly
+        let streams_by_name: &HashMap<(&str, &str), usize> = &self.streams_by_name;
+        let index = *streams_by_name.get(&(source_name, stream_name))?;
+        self.sources.get(source_name)?.streams.get(index)
     }
 
     /// List all streams across all sources
@@ -413,10 +483,7 @@ pub fn list_all_streams_including_disabled() -> Vec<(&'static str, &'static Regi
 pub fn get_stream_by_table_name(
     table_name: &str,
 ) -> Option<(&'static str, &'static RegisteredStream)> {
-    registry()
-        .list_all_streams()
-        .into_iter()
-        .find(|(_, stream)| stream.descriptor.table_name == table_name)
+    registry().get_stream_by_table_name(table_name)
 }
 
 /// Get a stream by its table name, including disabled streams
@@ -426,10 +493,7 @@ pub fn get_stream_by_table_name(
 pub fn get_stream_by_table_name_including_disabled(
     table_name: &str,
 ) -> Option<(&'static str, &'static RegisteredStream)> {
-    registry()
-        .list_all_streams_including_disabled()
-        .into_iter()
-        .find(|(_, stream)| stream.descriptor.table_name == table_name)
+    registry().get_stream_by_table_name_including_disabled(table_name)
 }
 
 /// Find and create a transform for the given source and target tables
@@ -476,16 +540,17 @@ pub fn find_transform(
 ///
 /// If the name already starts with "stream_", it is returned as-is.
 /// Otherwise, short names are expanded to their full stream table names.
-pub fn normalize_stream_name(name: &str) -> String {
+///
+/// Either way the result is borrowed (the input, or the registry's static
+/// table name), so resolving a name on every transform trigger doesn't allocate.
+pub fn normalize_stream_name(name: &str) -> &str {
     if name.starts_with("stream_") {
-        return name.to_string();
+        return name;
     }
 
     // Try to find by short name in registry
-    for (_source_name, stream) in list_all_streams() {
-        if stream.descriptor.name == name {
-            return stream.descriptor.table_name.to_string();
-        }
+    if let Some(table_name) = registry().get_table_name_for_stream(name) {
+        return table_name;
     }
 
     // Return as-is if not found (caller may have passed a full table name)
@@ -493,7 +558,7 @@ pub fn normalize_stream_name(name: &str) -> String {
         "Stream name '{}' not found in registry, returning as-is",
         name
     );
-    name.to_string()
+    name
 }
 
 #[cfg(test)]
@@ -528,6 +593,13 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_normalize_stream_name() {
+        assert_eq!(normalize_stream_name("calendar"), "stream_google_calendar");
+        assert_eq!(normalize_stream_name("stream_google_calendar"), "stream_google_calendar");
+        assert_eq!(normalize_stream_name("not_a_stream"), "not_a_stream");
+    }
+
     #[test]
     fn test_list_all_streams() {
         let streams = list_all_streams();
@@ -539,4 +611,14 @@ mod tests {
             assert!(stream.descriptor.table_name.contains(source));
         }
     }
+
+    #[test]
+    fn test_get_stream_by_table_name() {
+        let (source, stream) = get_stream_by_table_name("stream_google_calendar")
+            .expect("Should find Google Calendar by table name");
+        assert_eq!(source, "google");
+        assert_eq!(stream.descriptor.name, "calendar");
+
+        assert!(get_stream_by_table_name("stream_does_not_exist").is_none());
+    }
 }
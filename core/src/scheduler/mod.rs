@@ -32,9 +32,9 @@ use crate::{
 /// Simplified scheduler using StreamFactory
 pub struct Scheduler {
     db: SqlitePool,
-    storage: Storage,
     drive_config: crate::api::DriveConfig,
-    stream_writer: Arc<Mutex<StreamWriter>>,
+    /// Executor shared by every scheduled sync, built once with the scheduler
+    job_executor: crate::jobs::JobExecutor,
     scheduler: JobScheduler,
 }
 
@@ -50,13 +50,24 @@ impl Scheduler {
             .map_err(|e| Error::Other(format!("Failed to create scheduler: {e}")))?;
 
         // Create drive config from storage
-        let drive_config = crate::api::DriveConfig::new(std::sync::Arc::new(storage.clone()));
+        let storage = Arc::new(storage);
+        let drive_config = crate::api::DriveConfig::new(storage.clone());
+
+        // Sync jobs only need the base context (no data source), so one
+        // executor serves every scheduled run
+        let job_executor = crate::jobs::JobExecutor::new(
+            db.clone(),
+            crate::jobs::TransformContext::new(
+                storage,
+                stream_writer,
+                crate::jobs::ApiKeys::from_env(),
+            ),
+        );
 
         Ok(Self {
             db,
-            storage,
             drive_config,
-            stream_writer,
+            job_executor,
             scheduler,
         })
     }
@@ -167,8 +178,7 @@ impl Scheduler {
             let cron = cron_schedule.expect("cron_schedule is NOT NULL per WHERE clause");
 
             let db = self.db.clone();
-            let storage = self.storage.clone();
-            let stream_writer = self.stream_writer.clone();
+            let job_executor = self.job_executor.clone();
 
             tracing::debug!(
                 "Scheduling {}/{} ({}) with cron: {}",
@@ -185,8 +195,7 @@ impl Scheduler {
 
             let job = Job::new_async(cron.as_str(), move |_uuid, _lock| {
                 let db = db.clone();
-                let storage = storage.clone();
-                let stream_writer = stream_writer.clone();
+                let job_executor = job_executor.clone();
                 let source_id_str = source_id.clone();
                 let stream_name = stream_name.clone();
                 let source_name = source_name.clone();
@@ -200,10 +209,9 @@ impl Scheduler {
                     );
 
                     // Use the job-based API with String source_id
-                    match crate::api::jobs::trigger_stream_sync(
+                    match crate::api::jobs::trigger_stream_sync_with_executor(
                         &db,
-                        &storage,
-                        stream_writer,
+                        &job_executor,
                         source_id_str.clone(),
                         &stream_name,
                         None,
@@ -332,16 +340,18 @@ impl Scheduler {
                     None => return, // No profile yet
                 };
 
-                // 2. Compute current hour in the user's timezone (or UTC if unset)
+                // 2. Compute current hour and date in the user's timezone (or UTC
+                //    if unset), parsing the zone once per tick
                 let now_utc = chrono::Utc::now();
-                let current_hour = if let Some(ref tz_str) = timezone {
-                    if let Ok(tz) = tz_str.parse::<chrono_tz::Tz>() {
-                        now_utc.with_timezone(&tz).hour()
-                    } else {
-                        now_utc.hour()
+                let (current_hour, today) = match timezone
+                    .as_deref()
+                    .and_then(|tz_str| tz_str.parse::<chrono_tz::Tz>().ok())
+                {
+                    Some(tz) => {
+                        let local_now = now_utc.with_timezone(&tz);
+                        (local_now.hour(), local_now.date_naive())
                     }
-                } else {
-                    now_utc.hour()
+                    None => (now_utc.hour(), now_utc.date_naive()),
                 };
 
                 // 3. Only proceed if it's the maintenance hour
@@ -352,16 +362,7 @@ impl Scheduler {
                 tracing::info!("Running DailySummaryJob (maintenance hour {} in user's timezone)", maintenance_hour);
 
                 // 4. Compute "yesterday" in the user's timezone
-                let yesterday = if let Some(ref tz_str) = timezone {
-                    if let Ok(tz) = tz_str.parse::<chrono_tz::Tz>() {
-                        let local_now = now_utc.with_timezone(&tz);
-                        local_now.date_naive() - chrono::Duration::days(1)
-                    } else {
-                        now_utc.date_naive() - chrono::Duration::days(1)
-                    }
-                } else {
-                    now_utc.date_naive() - chrono::Duration::days(1)
-                };
+                let yesterday = today - chrono::Duration::days(1);
 
                 // 5. Check if autobiography already exists (idempotent)
                 let existing = crate::api::wiki::get_or_create_day(&db, yesterday).await;
@@ -445,6 +446,44 @@ impl Scheduler {
         Ok(())
     }
 
+    /// Schedule the proactive OAuth token refresh job (every minute)
+    ///
+    /// Refreshes tokens that expire within the next few minutes so syncs and
+    /// API calls read a valid token instead of refreshing it inline.
+    pub async fn schedule_token_refresh_job(&self) -> Result<()> {
+        let token_manager = Arc::new(crate::sources::base::TokenManager::new(self.db.clone())?);
+
+        // Every minute
+        let cron_expr = "0 * * * * *";
+
+        tracing::info!("Scheduling TokenRefreshJob every minute");
+
+        let job = Job::new_async(cron_expr, move |_uuid, _lock| {
+            let token_manager = token_manager.clone();
+
+            Box::pin(async move {
+                match token_manager.refresh_expiring_tokens().await {
+                    Ok(0) => {}
+                    Ok(count) => {
+                        tracing::info!("TokenRefreshJob completed: {} tokens refreshed", count);
+                    }
+                    Err(e) => {
+                        tracing::error!("TokenRefreshJob failed: {}", e);
+                    }
+                }
+            })
+        })
+        .map_err(|e| Error::Other(format!("Failed to create TokenRefreshJob: {}", e)))?;
+
+        self.scheduler
+            .add(job)
+            .await
+            .map_err(|e| Error::Other(format!("Failed to add TokenRefreshJob: {}", e)))?;
+
+        tracing::info!("TokenRefreshJob scheduled every minute");
+        Ok(())
+    }
+
     /// Stop the scheduler
     pub async fn stop(&mut self) -> Result<()> {
         self.scheduler
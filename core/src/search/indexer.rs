@@ -6,12 +6,60 @@
 use anyhow::Result;
 use sha2::{Digest, Sha256};
 use sqlx::SqlitePool;
+use std::sync::OnceLock;
 
 use super::embedder::get_embedder;
 
 /// Maximum records to process per ontology per run
 const BATCH_SIZE: i64 = 500;
 
+/// Per-ontology queries for records not yet embedded, built once from the
+/// static registry rather than re-rendered on every indexer run
+fn pending_records_queries() -> &'static [(&'static str, String)] {
+    static QUERIES: OnceLock<Vec<(&'static str, String)>> = OnceLock::new();
+    QUERIES.get_or_init(|| {
+        virtues_registry::ontologies::registered_ontologies()
+            .into_iter()
+            .filter_map(|ontology| {
+                let config = ontology.embedding.as_ref()?;
+
+                // Prefix bare column refs with t. to avoid ambiguity with search_embeddings columns
+                let prefix_col = |sql: &str| -> String {
+                    if sql.contains('.') || sql.contains('(') || sql == "NULL" {
+                        sql.to_string()
+                    } else {
+                        format!("t.{}", sql)
+                    }
+                };
+                let timestamp_sql = prefix_col(config.timestamp_sql);
+                let title_sql = config.title_sql.map(prefix_col).unwrap_or_else(|| "NULL".to_string());
+                let preview_sql = prefix_col(config.preview_sql);
+                let author_sql = config.author_sql.map(prefix_col).unwrap_or_else(|| "NULL".to_string());
+                let sql = format!(
+                    "SELECT t.id, \
+                     {embed_text} as embed_text, \
+                     {title} as title, \
+                     {preview} as preview, \
+                     {author} as author, \
+                     {timestamp} as ts \
+                     FROM {table} t \
+                     LEFT JOIN search_embeddings se ON se.ontology = ? AND se.record_id = t.id \
+                     WHERE se.id IS NULL \
+                     ORDER BY t.id ASC \
+                     LIMIT ?",
+                    embed_text = config.embed_text_sql,
+                    title = title_sql,
+                    preview = preview_sql,
+                    author = author_sql,
+                    timestamp = timestamp_sql,
+                    table = ontology.table_name,
+                );
+                Some((ontology.name, sql))
+            })
+            .collect()
+    })
+}
+
 /// Run one cycle of the embedding indexer.
 ///
 /// For each searchable ontology:
@@ -21,53 +69,16 @@ const BATCH_SIZE: i64 = 500;
 /// 4. Update progress checkpoint
 pub async fn run_embedding_job(pool: &SqlitePool) -> Result<()> {
     let embedder = get_embedder().await?;
-    let searchable = virtues_registry::ontologies::registered_ontologies()
-        .into_iter()
-        .filter(|o| o.embedding.is_some())
-        .collect::<Vec<_>>();
+    let searchable = pending_records_queries();
 
     tracing::info!("Embedding indexer: processing {} ontologies", searchable.len());
 
     let mut total_embedded = 0u64;
-    for ontology in &searchable {
-        let config = ontology.embedding.as_ref().unwrap();
-        let table = ontology.table_name;
-        let ont_name = ontology.name;
+    for (ont_name, sql) in searchable {
+        let ont_name = *ont_name;
 
         // Find unprocessed records via LEFT JOIN (no cursor — always finds gaps)
-        // Prefix bare column refs with t. to avoid ambiguity with search_embeddings columns
-        let prefix_col = |sql: &str| -> String {
-            if sql.contains('.') || sql.contains('(') || sql == "NULL" {
-                sql.to_string()
-            } else {
-                format!("t.{}", sql)
-            }
-        };
-        let timestamp_sql = prefix_col(config.timestamp_sql);
-        let title_sql = config.title_sql.map(prefix_col).unwrap_or_else(|| "NULL".to_string());
-        let preview_sql = prefix_col(config.preview_sql);
-        let author_sql = config.author_sql.map(prefix_col).unwrap_or_else(|| "NULL".to_string());
-        let sql = format!(
-            "SELECT t.id, \
-             {embed_text} as embed_text, \
-             {title} as title, \
-             {preview} as preview, \
-             {author} as author, \
-             {timestamp} as ts \
-             FROM {table} t \
-             LEFT JOIN search_embeddings se ON se.ontology = ? AND se.record_id = t.id \
-             WHERE se.id IS NULL \
-             ORDER BY t.id ASC \
-             LIMIT ?",
-            embed_text = config.embed_text_sql,
-            title = title_sql,
-            preview = preview_sql,
-            author = author_sql,
-            timestamp = timestamp_sql,
-            table = table,
-        );
-
-        let rows = sqlx::query_as::<_, (String, Option<String>, Option<String>, Option<String>, Option<String>, Option<String>)>(&sql)
+        let rows = sqlx::query_as::<_, (String, Option<String>, Option<String>, Option<String>, Option<String>, Option<String>)>(sql)
             .bind(ont_name)
             .bind(BATCH_SIZE)
             .fetch_all(pool)
@@ -290,8 +290,7 @@ pub async fn bulk_update_streams_handler(
 ) -> Response {
     match crate::api::bulk_update_streams(
         state.db.pool(),
-        &*state.storage,
-        state.stream_writer.clone(),
+        &state.job_executor,
         source_id,
         request.streams,
     )
@@ -333,8 +332,7 @@ pub async fn enable_stream_handler(
 ) -> Response {
     match crate::api::enable_stream(
         state.db.pool(),
-        &*state.storage,
-        state.stream_writer.clone(),
+        &state.job_executor,
         source_id,
         &stream_name,
         request.config,
@@ -435,10 +433,9 @@ pub async fn sync_stream_handler(
     });
 
     // Use the new async job-based sync
-    match crate::api::trigger_stream_sync(
+    match crate::api::trigger_stream_sync_with_executor(
         state.db.pool(),
-        &*state.storage,
-        state.stream_writer.clone(),
+        &state.job_executor,
         source_id,
         &stream_name,
         sync_mode,
@@ -506,7 +503,7 @@ async fn fetch_user_tier() -> Result<String, String> {
     let secret = std::env::var("TOLLBOOTH_INTERNAL_SECRET")
         .map_err(|_| "TOLLBOOTH_INTERNAL_SECRET not set".to_string())?;
 
-    let client = reqwest::Client::new();
+    let client = crate::http_client::shared_client();
     let resp = crate::tollbooth::with_system_auth(
         client.get(format!("{}/v1/limits/tier", tollbooth_url)),
         &secret,
@@ -69,6 +69,10 @@ pub struct AppState {
     pub storage: Arc<Storage>,
     pub drive_config: crate::api::DriveConfig,
     pub stream_writer: Arc<Mutex<StreamWriter>>,
+    /// Base transform context (no data source) shared by every ingest batch
+    pub transform_context: Arc<crate::jobs::TransformContext>,
+    /// Executor for the transform jobs triggered by ingest batches
+    pub job_executor: crate::jobs::JobExecutor,
     pub tool_executor: Option<Arc<crate::tools::ToolExecutor>>,
     pub yjs_state: super::yjs::YjsState,
     pub chat_cancel_state: ChatCancellationState,
@@ -101,6 +105,7 @@ pub async fn ingest(
     headers: HeaderMap,
     payload: std::result::Result<Json<IngestRequest>, JsonRejection>,
 ) -> Response {
+    let started = std::time::Instant::now();
     let payload = match payload {
         Ok(Json(payload)) => payload,
         Err(rejection) => {
@@ -134,11 +139,6 @@ pub async fn ingest(
         }
     };
 
-    // Update last_seen timestamp
-    if let Err(e) = crate::api::update_last_seen(state.db.pool(), &source_id).await {
-        tracing::warn!("Failed to update last_seen: {}", e);
-    }
-
     // Validate source and stream exist
     if let Err(e) = validate_source_stream(&state.db, &payload.source, &payload.stream).await {
         return (
@@ -150,28 +150,37 @@ pub async fn ingest(
             .into_response();
     }
 
-    // Process records using PushStream trait
-    let (accepted, rejected) = match process_batch(
-        &state,
-        &source_id,
-        &payload.source,
-        &payload.stream,
-        &payload.records,
-        &payload.device_id,
-        payload.timestamp,
-    )
-    .await
-    {
-        Ok(counts) => counts,
+    // Process records using PushStream trait. The last_seen bookkeeping write
+    // doesn't depend on the batch, so it runs alongside instead of before it.
+    let record_count = payload.records.len();
+    let (last_seen, batch) = tokio::join!(
+        crate::api::update_last_seen(state.db.pool(), &source_id),
+        process_batch(
+            &state,
+            &source_id,
+            &payload.source,
+            &payload.stream,
+            payload.records,
+            &payload.device_id,
+            payload.timestamp,
+        )
+    );
+    if let Err(e) = last_seen {
+        tracing::warn!("Failed to update last_seen: {}", e);
+    }
+    let (accepted, rejected, source_type) = match batch {
+        Ok((accepted, rejected, source_type)) => (accepted, rejected, Some(source_type)),
         Err(e) => {
             tracing::error!("Failed to process records: {}", e);
-            (0, payload.records.len())
+            (0, record_count, None)
         }
     };
 
     // Trigger transforms if records were successfully processed (hot path like cloud syncs)
-    if accepted > 0 {
-        if let Err(e) = trigger_transforms_for_batch(&state, &source_id, &payload.stream).await {
+    if let Some(source_type) = source_type.filter(|_| accepted > 0) {
+        if let Err(e) =
+            trigger_transforms_for_batch(&state, &source_id, &source_type, &payload.stream).await
+        {
             tracing::error!(
                 error = %e,
                 error_debug = ?e,
@@ -185,6 +194,18 @@ pub async fn ingest(
         }
     }
 
+    // One summary record per batch; the per-step logs above are debug-level
+    tracing::info!(
+        source_id = %source_id,
+        source = %payload.source,
+        stream = %payload.stream,
+        device_id = %payload.device_id,
+        accepted,
+        rejected,
+        elapsed_ms = started.elapsed().as_millis(),
+        "Ingested device batch"
+    );
+
     (
         StatusCode::OK,
         Json(IngestResponse {
@@ -224,15 +245,18 @@ async fn validate_source_stream(_db: &Database, _source: &str, _stream: &str) ->
 }
 
 /// Process batch of records using PushStream trait
+///
+/// Returns the accepted and rejected counts along with the source type
+/// (provider) of the connection, as resolved by the stream factory.
 async fn process_batch(
     state: &AppState,
     source_id: &str,
     source: &str,
     stream: &str,
-    records: &[Value],
+    records: Vec<Value>,
     device_id: &str,
     timestamp: DateTime<Utc>,
-) -> Result<(usize, usize)> {
+) -> Result<(usize, usize, String)> {
     // Create factory and get stream instance
     let factory = StreamFactory::new(
         state.db.pool().clone(),
@@ -255,12 +279,15 @@ async fn process_batch(
         }
     };
 
+    // The factory instantiated this stream from the connection's provider
+    let source_type = push_stream.source_name().to_string();
+
     // Build IngestPayload for the push stream
     let payload = IngestPayload {
         source: source.to_string(),
         stream: stream.to_string(),
         device_id: device_id.to_string(),
-        records: records.to_vec(),
+        records,
         timestamp,
     };
 
@@ -275,7 +302,7 @@ async fn process_batch(
         .records_received
         .saturating_sub(result.records_written);
 
-    Ok((accepted, rejected))
+    Ok((accepted, rejected, source_type))
 }
 
 /// Trigger transforms for device batch (hot path - unified with cloud syncs)
@@ -286,6 +313,7 @@ async fn process_batch(
 async fn trigger_transforms_for_batch(
     state: &AppState,
     source_id: &str,
+    source_type: &str,
     stream_name: &str,
 ) -> Result<()> {
     // Collect buffered records from StreamWriter
@@ -293,7 +321,7 @@ async fn trigger_transforms_for_batch(
         let mut writer = state.stream_writer.lock().await;
         match writer.collect_records(source_id, stream_name) {
             Some((records, min_ts, max_ts)) => {
-                tracing::info!(
+                tracing::debug!(
                     source_id = %source_id,
                     stream_name,
                     record_count = records.len(),
@@ -314,10 +342,11 @@ async fn trigger_transforms_for_batch(
 
     // Write records directly to filesystem
     let _storage_key = if !records.is_empty() {
-        match write_stream_records(
+        match crate::jobs::sync_job::write_stream_records(
             state.db.pool(),
             state.storage.as_ref(),
             source_id,
+            source_type,
             stream_name,
             &records,
             min_timestamp,
@@ -326,7 +355,7 @@ async fn trigger_transforms_for_batch(
         .await
         {
             Ok(key) => {
-                tracing::info!(
+                tracing::debug!(
                     storage_key = %key,
                     source_id = %source_id,
                     stream_name = %stream_name,
@@ -379,24 +408,15 @@ async fn trigger_transforms_for_batch(
         None
     };
 
-    // Create context without data source for transform triggering
-    // The create_transform_job_for_stream function will create a new context
-    // with the actual MemoryDataSource when executing the transform
-    let api_keys = crate::jobs::ApiKeys::from_env();
-
-    let context = Arc::new(crate::jobs::TransformContext::new(
-        Arc::clone(&state.storage),
-        state.stream_writer.clone(),
-        api_keys,
-    ));
-
-    let executor = crate::jobs::JobExecutor::new(state.db.pool().clone(), (*context).clone());
+    // The shared context has no data source; create_transform_job_for_stream
+    // derives a new context with the actual MemoryDataSource when executing
+    // the transform
 
     // Create and execute transform job with in-memory records (hot path)
     let _job_id = crate::jobs::create_transform_job_for_stream(
         state.db.pool(),
-        &executor,
-        &context,
+        &state.job_executor,
+        &state.transform_context,
         source_id.to_string(),
         stream_name,
         Some(records), // Pass collected records for direct transform
@@ -406,69 +426,6 @@ async fn trigger_transforms_for_batch(
     Ok(())
 }
 
-/// Write stream records directly to filesystem and record metadata
-async fn write_stream_records(
-    db: &sqlx::SqlitePool,
-    storage: &Storage,
-    source_id: &str,
-    stream_name: &str,
-    records: &[Value],
-    min_timestamp: Option<DateTime<Utc>>,
-    max_timestamp: Option<DateTime<Utc>>,
-) -> Result<String> {
-    use crate::storage::models::StreamKeyBuilder;
-
-    // Get source type from source connection
-    let source_type: String =
-        sqlx::query_scalar("SELECT source FROM elt_source_connections WHERE id = $1")
-            .bind(source_id)
-            .fetch_one(db)
-            .await?;
-
-    let date = Utc::now().date_naive();
-    let key_builder = StreamKeyBuilder::new(None, &source_type, source_id, stream_name, date)
-        .map_err(|e| Error::Other(format!("Invalid stream key: {}", e)))?;
-    let storage_key = key_builder.build();
-
-    // Write JSONL to filesystem
-    storage.upload_jsonl(&storage_key, records).await?;
-
-    // Calculate size
-    let size_bytes: i64 = records
-        .iter()
-        .map(|r| serde_json::to_string(r).unwrap_or_default().len() as i64)
-        .sum();
-
-    // Record metadata in elt_stream_objects
-    let stream_object_id =
-        crate::ids::generate_id(crate::ids::STREAM_OBJECT_PREFIX, &[&storage_key]);
-    sqlx::query(
-        "INSERT INTO elt_stream_objects
-         (id, source_connection_id, stream_name, storage_key, record_count, size_bytes,
-          min_timestamp, max_timestamp, created_at)
-         VALUES ($1, $2, $3, $4, $5, $6, $7, $8, datetime('now'))",
-    )
-    .bind(&stream_object_id)
-    .bind(source_id)
-    .bind(stream_name)
-    .bind(&storage_key)
-    .bind(records.len() as i32)
-    .bind(size_bytes)
-    .bind(min_timestamp)
-    .bind(max_timestamp)
-    .execute(db)
-    .await?;
-
-    tracing::info!(
-        stream_object_id = %stream_object_id,
-        storage_key = %storage_key,
-        record_count = records.len(),
-        "Stream object metadata recorded"
-    );
-
-    Ok(storage_key)
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -29,6 +29,26 @@ pub async fn run(client: Virtues, host: &str, port: u16) -> Result<()> {
     // Validate required environment variables early
     validate_environment()?;
 
+    // Claim job ownership as the server before any job is created, so
+    // startup recovery can tell a previous server's jobs from a CLI's
+    crate::jobs::mark_server_process();
+
+    // Build the source/stream registry now so the first ingest or sync
+    // doesn't pay for it on the request path
+    let registry = crate::registry::registry();
+    tracing::info!(
+        sources = registry.sources.len(),
+        streams = registry.list_all_streams_including_disabled().len(),
+        "Source registry loaded"
+    );
+
+    // Likewise build the process-wide HTTP client (TLS roots) and token
+    // encryptor (key decode and AES schedule) that sync jobs first touch
+    let _ = crate::http_client::shared_client();
+    if let Err(e) = crate::sources::base::TokenEncryptor::shared() {
+        tracing::warn!(error = %e, "Token encryption unavailable, OAuth sources will fail to sync");
+    }
+
     // Initialize usage limits from TIER env var
     if let Err(e) = crate::api::init_limits_from_tier(client.database.pool()).await {
         tracing::warn!("Failed to initialize usage limits: {}", e);
@@ -90,6 +110,11 @@ pub async fn run(client: Virtues, host: &str, port: u16) -> Result<()> {
                         tracing::warn!("Failed to schedule embedding job: {}", e);
                     }
 
+                    // Schedule proactive OAuth token refresh (every minute)
+                    if let Err(e) = sched.schedule_token_refresh_job().await {
+                        tracing::warn!("Failed to schedule token refresh job: {}", e);
+                    }
+
                     // Keep scheduler alive - it will be dropped when the server shuts down
                     // The JobScheduler runs background tasks that need to stay active
                     loop {
@@ -125,11 +150,32 @@ pub async fn run(client: Virtues, host: &str, port: u16) -> Result<()> {
     // Create drive config with shared storage backend
     let drive_config = crate::api::DriveConfig::new(client.storage.clone());
 
+    // Transform context and executor for ingest batches, built once rather
+    // than per batch (the context is immutable apart from its data source)
+    let transform_context = Arc::new(crate::jobs::TransformContext::new(
+        client.storage.clone(),
+        stream_writer_arc.clone(),
+        crate::jobs::ApiKeys::from_env(),
+    ));
+    let job_executor = crate::jobs::JobExecutor::new(
+        client.database.pool().clone(),
+        (*transform_context).clone(),
+    );
+
+    // Re-run syncs (and fail other jobs) left active by a previous process
+    if let Err(e) =
+        crate::jobs::recover_interrupted_jobs(client.database.pool(), &job_executor).await
+    {
+        tracing::warn!("Failed to recover interrupted jobs: {}", e);
+    }
+
     let state = AppState {
         db: client.database.clone(),
         storage: client.storage.clone(),
         drive_config,
         stream_writer: stream_writer_arc.clone(),
+        transform_context,
+        job_executor,
         tool_executor,
         yjs_state: yjs_state.clone(),
         chat_cancel_state,
@@ -1,6 +1,6 @@
 //! Base infrastructure and utilities for all sources
 
-use serde::{de::DeserializeOwned, Serialize};
+use serde::{de::DeserializeOwned, Deserialize, Serialize};
 
 pub mod device;
 pub mod error_handler;
@@ -20,7 +20,15 @@ pub mod validation;
 pub trait ConfigSerializable: Serialize + DeserializeOwned {
     /// Deserialize config from JSON value (from database)
     fn from_json(value: &serde_json::Value) -> Result<Self, serde_json::Error> {
-        serde_json::from_value(value.clone())
+        Self::deserialize(value)
+    }
+
+    /// Deserialize config straight from its stored JSON text
+    ///
+    /// Preferred when loading from the database: it parses directly into the
+    /// config type instead of building (and then walking) a `Value` tree.
+    fn from_json_str(json: &str) -> Result<Self, serde_json::Error> {
+        serde_json::from_str(json)
     }
 
     /// Serialize config to JSON value (for database storage)
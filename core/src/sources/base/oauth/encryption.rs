@@ -6,6 +6,7 @@
 use base64::Engine;
 use ring::aead::{Aad, LessSafeKey, Nonce, UnboundKey, AES_256_GCM};
 use ring::rand::{SecureRandom, SystemRandom};
+use std::sync::{Arc, OnceLock};
 
 use crate::error::{Error, Result};
 
@@ -33,6 +34,23 @@ impl TokenEncryptor {
         Self::from_base64_key(&key_b64)
     }
 
+    /// Process-wide encryptor built from the environment on first use
+    ///
+    /// The key is fixed for the lifetime of the process, so the env lookup,
+    /// base64 decode and AES key schedule only need to happen once. Failures
+    /// are not cached, so a missing key is reported on every call.
+    pub fn shared() -> Result<Arc<Self>> {
+        static SHARED: OnceLock<Arc<TokenEncryptor>> = OnceLock::new();
+
+        if let Some(encryptor) = SHARED.get() {
+            return Ok(encryptor.clone());
+        }
+
+        let encryptor = Arc::new(Self::from_env()?);
+        tracing::info!("✅ Token encryption enabled");
+        Ok(SHARED.get_or_init(|| encryptor).clone())
+    }
+
     /// Create a new token encryptor from a base64-encoded key
     pub fn from_base64_key(key_b64: &str) -> Result<Self> {
         let key_bytes = base64::engine::general_purpose::STANDARD
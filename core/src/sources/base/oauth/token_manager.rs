@@ -4,14 +4,80 @@
 //! It integrates with the auth.virtues.com OAuth proxy for token refresh operations.
 
 use chrono::{DateTime, Duration, Utc};
+use futures::StreamExt;
+use moka::sync::Cache;
 use reqwest::Client;
 use serde::Deserialize;
 use sqlx::SqlitePool;
-
+use std::sync::{Arc, OnceLock};
 
 use super::encryption::TokenEncryptor;
 use crate::error::{Error, Result};
 
+/// Tokens within this many seconds of expiry are refreshed inline
+///
+/// Kept short because the scheduler refreshes anything inside
+/// [`PROACTIVE_REFRESH_WINDOW_SECS`] ahead of time; the request path only
+/// refreshes when that pass was missed.
+const REQUEST_REFRESH_WINDOW_SECS: i64 = 60;
+
+/// Tokens within this many seconds of expiry are refreshed by the scheduler
+const PROACTIVE_REFRESH_WINDOW_SECS: i64 = 300;
+
+/// Proxy refresh calls a proactive pass keeps in flight at once
+const PROACTIVE_REFRESH_CONCURRENCY: usize = 8;
+
+/// Most tokens a single proactive pass refreshes, soonest expiry first
+const PROACTIVE_REFRESH_BATCH: i64 = 500;
+
+/// How long a decrypted token is served from memory before re-reading its row
+const TOKEN_CACHE_TTL: std::time::Duration = std::time::Duration::from_secs(300);
+
+/// Upper bound on cached tokens
+const TOKEN_CACHE_CAPACITY: u64 = 1024;
+
+/// Decrypted tokens keyed by source connection id
+///
+/// Every OAuth request asks for a valid token, but a token only changes
+/// when it is refreshed or the source is reconnected. Both paths update or
+/// invalidate the entry here, so requests skip the SELECT and decrypt.
+///
+/// Other processes sharing the database (e.g. a CLI sync) can refresh a
+/// token without touching this cache, so an entry may go stale. The
+/// OAuth client drops the entry when a provider rejects the token, and
+/// refreshes always re-read the row under the refresh lock.
+fn token_cache() -> &'static Cache<String, OAuthToken> {
+    static CACHE: OnceLock<Cache<String, OAuthToken>> = OnceLock::new();
+    CACHE.get_or_init(|| {
+        Cache::builder()
+            .max_capacity(TOKEN_CACHE_CAPACITY)
+            .time_to_live(TOKEN_CACHE_TTL)
+            .build()
+    })
+}
+
+/// Per-source locks serializing token refreshes
+///
+/// Several syncs of one source can find its token expiring at the same
+/// time. Without a lock each would call the proxy, and providers that
+/// rotate refresh tokens invalidate all but one of the results.
+fn refresh_lock(source_id: &str) -> Arc<tokio::sync::Mutex<()>> {
+    static LOCKS: OnceLock<Cache<String, Arc<tokio::sync::Mutex<()>>>> = OnceLock::new();
+    LOCKS
+        .get_or_init(|| {
+            Cache::builder()
+                .max_capacity(TOKEN_CACHE_CAPACITY)
+                .time_to_idle(TOKEN_CACHE_TTL)
+                .build()
+        })
+        .get_with(source_id.to_string(), || Arc::new(tokio::sync::Mutex::new(())))
+}
+
+/// Drop a source's cached token after its connection row changes
+pub fn invalidate_cached_token(source_id: &str) {
+    token_cache().invalidate(source_id);
+}
+
 /// Token refresh response from OAuth proxy
 #[derive(Debug, Deserialize)]
 pub struct TokenRefreshResponse {
@@ -39,9 +105,15 @@ pub struct OAuthProxyConfig {
 
 impl Default for OAuthProxyConfig {
     fn default() -> Self {
+        static BASE_URL: OnceLock<String> = OnceLock::new();
+
         Self {
-            base_url: std::env::var("OAUTH_PROXY_URL")
-                .unwrap_or_else(|_| "https://auth.virtues.com".to_string()),
+            base_url: BASE_URL
+                .get_or_init(|| {
+                    std::env::var("OAUTH_PROXY_URL")
+                        .unwrap_or_else(|_| "https://auth.virtues.com".to_string())
+                })
+                .clone(),
         }
     }
 }
@@ -51,7 +123,7 @@ pub struct TokenManager {
     db: SqlitePool,
     client: Client,
     proxy_config: OAuthProxyConfig,
-    encryptor: TokenEncryptor,
+    encryptor: Arc<TokenEncryptor>,
 }
 
 impl TokenManager {
@@ -75,7 +147,7 @@ impl TokenManager {
     /// Returns error if encryption key is not set or invalid
     pub fn with_config(db: SqlitePool, proxy_config: OAuthProxyConfig) -> Result<Self> {
         // Always require encryption - no insecure mode
-        let encryptor = TokenEncryptor::from_env().map_err(|_| {
+        let encryptor = TokenEncryptor::shared().map_err(|_| {
             Error::Configuration(
                 "VIRTUES_ENCRYPTION_KEY environment variable is required. \
                  Generate one with: openssl rand -base64 32"
@@ -83,11 +155,9 @@ impl TokenManager {
             )
         })?;
 
-        tracing::info!("✅ Token encryption enabled");
-
         Ok(Self {
             db,
-            client: Client::new(),
+            client: crate::http_client::shared_client(),
             proxy_config,
             encryptor,
         })
@@ -103,16 +173,22 @@ impl TokenManager {
 
         Self {
             db,
-            client: Client::new(),
+            client: crate::http_client::shared_client(),
             proxy_config: OAuthProxyConfig::default(),
-            encryptor: TokenEncryptor::new_insecure(),
+            encryptor: Arc::new(TokenEncryptor::new_insecure()),
         }
     }
 
     /// Get a valid access token for a source, refreshing if necessary
     pub async fn get_valid_token(&self, source_id: String) -> Result<String> {
-        // Load token from database
-        let token = self.load_token(source_id.clone()).await?;
+        let token = match token_cache().get(&source_id) {
+            Some(token) => token,
+            None => {
+                let token = self.load_token(source_id.clone()).await?;
+                token_cache().insert(source_id.clone(), token.clone());
+                token
+            }
+        };
 
         // Check if token needs refresh
         if self.needs_refresh(&token) {
@@ -171,17 +247,151 @@ impl TokenManager {
         })
     }
 
-    /// Check if a token needs refresh
+    /// Check if a token needs refresh before it can be used
     pub fn needs_refresh(&self, token: &OAuthToken) -> bool {
         token
             .expires_at
-            .map(|exp| exp <= Utc::now() + Duration::minutes(5))
+            .map(|exp| exp <= Utc::now() + Duration::seconds(REQUEST_REFRESH_WINDOW_SECS))
             .unwrap_or(false)
     }
 
     /// Refresh an OAuth token through the proxy
     #[tracing::instrument(skip(self, token), fields(source_id = %source_id, source = %token.source))]
     pub async fn refresh_token(&self, source_id: String, token: &OAuthToken) -> Result<OAuthToken> {
+        let lock = refresh_lock(&source_id);
+        let _guard = lock.lock().await;
+
+        // Whoever held the lock may have just refreshed this token, and a
+        // CLI process may have refreshed it without the lock. Re-read the row
+        // so the refresh starts from the newest refresh token.
+        let current = self.load_token(source_id.clone()).await?;
+        if current.expires_at != token.expires_at && !self.needs_refresh(&current) {
+            token_cache().insert(source_id, current.clone());
+            return Ok(current);
+        }
+
+        self.refresh_and_store(&source_id, &current, Utc::now()).await
+    }
+
+    /// Refresh every active token that expires within the proactive window
+    ///
+    /// Run periodically by the scheduler so requests rarely find a token
+    /// close enough to expiry to refresh inline. Proxy calls run
+    /// concurrently, and each new token is written as soon as its call
+    /// returns: providers that rotate refresh tokens have already revoked
+    /// the old one, so a later failure must not discard it. Returns the
+    /// number of tokens refreshed; a source whose refresh fails is logged
+    /// and left for the request path to retry and report.
+    ///
+    /// A source rejected with an authentication error (e.g. a revoked
+    /// refresh token) is marked with [`Self::mark_auth_error`] and skipped
+    /// by later passes, so it doesn't hit the proxy every minute. It is
+    /// picked up again once a reconnect or inline refresh clears the error.
+    pub async fn refresh_expiring_tokens(&self) -> Result<usize> {
+        // One timestamp for the whole pass: it bounds the scan and dates
+        // every new token's expiry
+        let now = Utc::now();
+        let threshold = now + Duration::seconds(PROACTIVE_REFRESH_WINDOW_SECS);
+
+        let source_ids = sqlx::query_scalar::<_, String>(
+            r#"
+            SELECT id
+            FROM elt_source_connections
+            WHERE is_active = true
+              AND refresh_token IS NOT NULL
+              AND error_at IS NULL
+              AND token_expires_at <= $1
+            ORDER BY token_expires_at ASC
+            LIMIT $2
+            "#,
+        )
+        .bind(threshold)
+        .bind(PROACTIVE_REFRESH_BATCH)
+        .fetch_all(&self.db)
+        .await?;
+
+        if source_ids.is_empty() {
+            return Ok(0);
+        }
+
+        // Each refresh holds its source's lock until the new token is stored
+        // and cached, so an inline refresh can't start from the old one. The
+        // lock is released as soon as that source is done.
+        let count = futures::stream::iter(source_ids)
+            .map(|source_id| async move {
+                // A source already being refreshed inline is left to that refresh
+                let _guard = refresh_lock(&source_id).try_lock_owned().ok()?;
+
+                // Re-read the row under the lock: the token may have been
+                // refreshed since the SELECT above, possibly by another process
+                let result = match self.load_token(source_id.clone()).await {
+                    Ok(token) if token.expires_at.is_some_and(|exp| exp > threshold) => {
+                        return None;
+                    }
+                    Ok(token) => self.refresh_and_store(&source_id, &token, now).await,
+                    Err(e) => Err(e),
+                };
+
+                match result {
+                    Ok(_) => Some(()),
+                    Err(Error::Authentication(message)) => {
+                        tracing::warn!(
+                            source_id = %source_id,
+                            error = %message,
+                            "Proactive token refresh rejected, marking source for re-authentication"
+                        );
+                        if let Err(e) = self.mark_auth_error(source_id.clone(), &message).await {
+                            tracing::error!(
+                                source_id = %source_id,
+                                error = %e,
+                                "Failed to mark source auth error"
+                            );
+                        }
+                        None
+                    }
+                    Err(e) => {
+                        tracing::warn!(
+                            source_id = %source_id,
+                            error = %e,
+                            "Proactive token refresh failed"
+                        );
+                        None
+                    }
+                }
+            })
+            .buffer_unordered(PROACTIVE_REFRESH_CONCURRENCY)
+            .filter_map(|result| async move { result })
+            .count()
+            .await;
+
+        Ok(count)
+    }
+
+    /// Refresh a token through the proxy, then store and cache the result
+    ///
+    /// Callers must hold the source's [`refresh_lock`].
+    async fn refresh_and_store(
+        &self,
+        source_id: &str,
+        token: &OAuthToken,
+        requested_at: DateTime<Utc>,
+    ) -> Result<OAuthToken> {
+        let refreshed = self.request_refresh(token, requested_at).await?;
+        self.store_refreshed_token(source_id, &refreshed).await?;
+        token_cache().insert(source_id.to_string(), refreshed.clone());
+        Ok(refreshed)
+    }
+
+    /// Exchange a token's refresh token for a new one through the proxy
+    ///
+    /// The new expiry is counted from `requested_at`, which is captured no
+    /// later than the request. Does not persist the result; see
+    /// [`Self::store_refreshed_token`].
+    async fn request_refresh(
+        &self,
+        token: &OAuthToken,
+        requested_at: DateTime<Utc>,
+    ) -> Result<OAuthToken> {
         let refresh_token = token
             .refresh_token
             .as_ref()
@@ -228,18 +438,30 @@ impl TokenManager {
         // Calculate new expiry time
         let expires_at = refresh_response
             .expires_in
-            .map(|seconds| Utc::now() + Duration::seconds(seconds));
-
-        // Encrypt tokens before storing
-        let access_token_to_store = self.encryptor.encrypt(&refresh_response.access_token)?;
+            .map(|seconds| requested_at + Duration::seconds(seconds));
 
         // Determine the refresh token to keep (new one if provided, otherwise keep old one)
-        let new_refresh_token = refresh_response
+        let refresh_token = refresh_response
             .refresh_token
-            .clone()
             .or_else(|| token.refresh_token.clone());
 
-        let refresh_token_to_store = if let Some(ref rt) = &new_refresh_token {
+        Ok(OAuthToken {
+            access_token: refresh_response.access_token,
+            refresh_token,
+            expires_at,
+            source: token.source.clone(),
+        })
+    }
+
+    /// Encrypt and write a refreshed token to its source connection row
+    ///
+    /// Also clears any auth error, which returns the source to the
+    /// proactive refresh pass.
+    async fn store_refreshed_token(&self, source_id: &str, token: &OAuthToken) -> Result<()> {
+        // Encrypt tokens before storing
+        let access_token_to_store = self.encryptor.encrypt(&token.access_token)?;
+
+        let refresh_token_to_store = if let Some(ref rt) = token.refresh_token {
             Some(self.encryptor.encrypt(rt)?)
         } else {
             None
@@ -253,23 +475,20 @@ impl TokenManager {
                 access_token = $1,
                 refresh_token = COALESCE($2, refresh_token),
                 token_expires_at = $3,
+                error_message = NULL,
+                error_at = NULL,
                 updated_at = datetime('now')
             WHERE id = $4
             "#,
         )
         .bind(&access_token_to_store)
         .bind(refresh_token_to_store.as_ref())
-        .bind(expires_at)
-        .bind(&source_id)
+        .bind(token.expires_at)
+        .bind(source_id)
         .execute(&self.db)
         .await?;
 
-        Ok(OAuthToken {
-            access_token: refresh_response.access_token,
-            refresh_token: new_refresh_token,
-            expires_at,
-            source: token.source.clone(),
-        })
+        Ok(())
     }
 
     /// Store initial OAuth tokens from a callback
@@ -322,6 +541,9 @@ impl TokenManager {
         .fetch_one(&self.db)
         .await?;
 
+        // A reconnect replaces the tokens of an existing row
+        invalidate_cached_token(&source_id_str);
+
         Ok(source_id_str)
     }
 
@@ -28,6 +28,7 @@ use std::sync::Arc;
 use std::time::Duration;
 
 use super::error_handler::{DefaultErrorHandler, ErrorClass, ErrorHandler};
+use super::oauth::token_manager::invalidate_cached_token;
 use super::oauth::TokenManager;
 use crate::error::{Error, Result};
 
@@ -104,18 +105,13 @@ impl OAuthHttpClient {
     /// * `source_id` - ID of the source for token lookups
     /// * `token_manager` - Shared token manager for OAuth token operations
     pub fn new(source_id: String, token_manager: Arc<TokenManager>) -> Self {
-        // Configure HTTP client with timeouts to prevent infinite hangs
-        let client = Client::builder()
-            .connect_timeout(Duration::from_secs(10)) // TCP connection timeout
-            .timeout(Duration::from_secs(60)) // Total request timeout
-            .build()
-            .expect("Failed to build HTTP client");
-
         Self {
             source_id,
             token_manager,
             base_url: String::new(),
-            client,
+            // Shared pool with the regular 10s connect / 60s request timeouts,
+            // so provider connections stay alive across streams and syncs
+            client: crate::http_client::shared_client(),
             config: RetryConfig::default(),
             custom_headers: HeaderMap::new(),
             error_handler: Box::new(DefaultErrorHandler),
@@ -256,7 +252,9 @@ impl OAuthHttpClient {
                     {
                         match error_class {
                             ErrorClass::AuthError => {
-                                // Token might be invalid - TokenManager will refresh on next attempt
+                                // The cached token may be stale, e.g. refreshed by a CLI
+                                // process; drop it so the next attempt re-reads the row
+                                invalidate_cached_token(&self.source_id);
                                 if attempt < self.config.max_retries - 1 {
                                     tokio::time::sleep(Duration::from_millis(100)).await;
                                     continue;
@@ -265,7 +263,7 @@ impl OAuthHttpClient {
                             ErrorClass::RateLimit => {
                                 // Rate limited - back off exponentially
                                 if attempt < self.config.max_retries - 1 {
-                                    let wait_time = self.calculate_backoff(attempt);
+                                    let wait_time = with_jitter(self.calculate_backoff(attempt));
                                     tokio::time::sleep(wait_time).await;
                                     continue;
                                 }
@@ -273,7 +271,7 @@ impl OAuthHttpClient {
                             ErrorClass::ServerError => {
                                 // Server error - back off and retry
                                 if attempt < self.config.max_retries - 1 {
-                                    let wait_time = self.calculate_backoff(attempt);
+                                    let wait_time = with_jitter(self.calculate_backoff(attempt));
                                     tokio::time::sleep(wait_time).await;
                                     continue;
                                 }
@@ -291,10 +289,16 @@ impl OAuthHttpClient {
                     return Err(self.format_error(status, &error_body));
                 }
                 Err(e) => {
+                    // Only transient transport failures are worth another
+                    // attempt; a malformed request fails the same way every time
+                    if !is_transient_network_error(&e) {
+                        return Err(Error::Network(format!("Request failed: {e}")));
+                    }
+
                     // Network error - retry with backoff
                     last_error = Some(e);
                     if attempt < self.config.max_retries - 1 {
-                        let wait_time = self.calculate_backoff(attempt);
+                        let wait_time = with_jitter(self.calculate_backoff(attempt));
                         tokio::time::sleep(wait_time).await;
                         continue;
                     }
@@ -342,10 +346,45 @@ impl OAuthHttpClient {
 
     /// Format error message based on status and body
     fn format_error(&self, status: StatusCode, body: &str) -> Error {
-        Error::Http(format!("API error ({status}): {body}"))
+        Error::Http(format!("{API_ERROR_PREFIX}{status}): {body}"))
     }
 }
 
+/// Leading text of the `Error::Http` messages built by `format_error`
+const API_ERROR_PREFIX: &str = "API error (";
+
+/// Recover the response status from an API error returned by this client
+///
+/// Reads only the status code `format_error` put at the front of the
+/// message, never the response body, so error text can't be mistaken for
+/// a status. Returns `None` for errors this client didn't produce.
+pub fn api_error_status(error: &Error) -> Option<StatusCode> {
+    let Error::Http(msg) = error else {
+        return None;
+    };
+    let code = msg.strip_prefix(API_ERROR_PREFIX)?.get(..3)?;
+    StatusCode::from_bytes(code.as_bytes()).ok()
+}
+
+/// Fraction a retry backoff is spread by in either direction
+const BACKOFF_JITTER: f64 = 0.25;
+
+/// Randomize a backoff by ±[`BACKOFF_JITTER`]
+///
+/// Streams throttled by the same provider at the same moment would
+/// otherwise all retry in lockstep and trip the rate limit again.
+fn with_jitter(backoff: Duration) -> Duration {
+    backoff.mul_f64(rand::random_range((1.0 - BACKOFF_JITTER)..=(1.0 + BACKOFF_JITTER)))
+}
+
+/// Whether a transport error is likely to succeed on retry
+///
+/// Timeouts, connection failures and errors while sending are transient;
+/// builder, redirect and decode errors are deterministic.
+fn is_transient_network_error(error: &reqwest::Error) -> bool {
+    error.is_timeout() || error.is_connect() || error.is_request()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -365,6 +404,16 @@ mod tests {
         assert_eq!(client.calculate_backoff(10), Duration::from_secs(30)); // Still max
     }
 
+    #[test]
+    fn test_backoff_jitter_stays_within_bounds() {
+        let base = Duration::from_secs(8);
+        for _ in 0..100 {
+            let jittered = with_jitter(base);
+            assert!(jittered >= Duration::from_secs(6));
+            assert!(jittered <= Duration::from_secs(10));
+        }
+    }
+
     #[tokio::test]
     async fn test_build_url() {
         let pool = sqlx::SqlitePool::connect_lazy("sqlite::memory:").unwrap();
@@ -397,6 +446,25 @@ mod tests {
         assert!(config.retry_on_5xx);
     }
 
+    #[tokio::test]
+    async fn test_api_error_status_reads_only_the_status() {
+        let pool = sqlx::SqlitePool::connect_lazy("sqlite::memory:").unwrap();
+        let token_manager = Arc::new(TokenManager::new_insecure(pool));
+        let client = OAuthHttpClient::new("test-source".to_string(), token_manager);
+
+        let error = client.format_error(StatusCode::NOT_FOUND, "401 Unauthorized rate limit 503");
+        assert_eq!(api_error_status(&error), Some(StatusCode::NOT_FOUND));
+
+        let error = Error::Http("Token exchange failed: 401 Unauthorized".to_string());
+        assert_eq!(api_error_status(&error), None);
+    }
+
+    #[test]
+    fn test_builder_errors_are_not_transient() {
+        let error = reqwest::Client::new().get("not a url").build().unwrap_err();
+        assert!(!is_transient_network_error(&error));
+    }
+
     #[test]
     fn test_retry_config_no_retry() {
         let config = RetryConfig::no_retry();
@@ -7,8 +7,10 @@
 //! eliminating the need for large match statements. Each stream registers
 //! its creator function alongside its metadata.
 
+use moka::sync::Cache;
 use sqlx::SqlitePool;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
+use std::time::Duration;
 use tokio::sync::Mutex;
 
 use super::base::TokenManager;
@@ -18,6 +20,37 @@ use crate::storage::{stream_writer::StreamWriter, Storage};
 
 use super::{auth::SourceAuth, stream_type::StreamType};
 
+/// How long a source's type and name are reused before re-reading the row
+const SOURCE_INFO_TTL: Duration = Duration::from_secs(300);
+
+/// Upper bound on cached source rows
+const SOURCE_INFO_CACHE_CAPACITY: u64 = 1024;
+
+/// Active source rows keyed by source connection id
+///
+/// Every sync job and ingest batch resolves its source through the factory,
+/// while the rows themselves change only when a source is paired, paused,
+/// resumed or deleted. Those writes call [`invalidate_source_info`]; the TTL
+/// bounds staleness for anything else.
+fn source_info_cache() -> &'static Cache<String, SourceInfo> {
+    static CACHE: OnceLock<Cache<String, SourceInfo>> = OnceLock::new();
+    CACHE.get_or_init(|| {
+        Cache::builder()
+            .max_capacity(SOURCE_INFO_CACHE_CAPACITY)
+            .time_to_live(SOURCE_INFO_TTL)
+            .build()
+    })
+}
+
+/// Drop a source's cached row after its connection record changes
+///
+/// Also drops its cached OAuth token, so a paused or deleted source stops
+/// serving one.
+pub fn invalidate_source_info(source_id: &str) {
+    source_info_cache().invalidate(source_id);
+    super::base::oauth::token_manager::invalidate_cached_token(source_id);
+}
+
 /// Factory for creating stream instances
 ///
 /// The StreamFactory handles:
@@ -81,27 +114,47 @@ impl StreamFactory {
         source_id: &str,
         stream_name: &str,
     ) -> Result<StreamType> {
+        Ok(self.create_stream_with_descriptor(source_id, stream_name).await?.0)
+    }
+
+    /// Create a stream instance along with its registry entry
+    ///
+    /// Same as [`create_stream_typed`](Self::create_stream_typed), but also
+    /// returns the descriptor the factory resolved, so callers that need the
+    /// stream's registry metadata don't look it up again.
+    pub async fn create_stream_with_descriptor(
+        &self,
+        source_id: &str,
+        stream_name: &str,
+    ) -> Result<(StreamType, &'static crate::registry::RegisteredStream)> {
         // Load source info from database
         let source = self.load_source(source_id).await?;
 
         // Validate against registry (ensures source and stream are enabled)
-        let _stream_desc = crate::registry::get_stream(&source.source, stream_name).ok_or_else(|| {
+        let stream_desc = crate::registry::get_stream(&source.source, stream_name).ok_or_else(|| {
             Error::Other(format!(
                 "Stream {}/{} not found or disabled in registry",
                 source.source, stream_name
             ))
         })?;
 
-        // Create auth abstraction
-        let auth = self.create_auth(source_id, &source.source).await?;
+        // Create auth abstraction, reusing the row loaded above
+        let auth = self
+            .create_auth(source_id, &source.source, Some(&source.name))
+            .await?;
 
-        // Create the appropriate stream implementation
-        self.create_stream_typed_impl(source_id, &source.source, stream_name, auth)
-            .await
+        // Create the stream from the descriptor resolved above rather than
+        // looking it up in the registry a second time
+        let stream = self.instantiate_stream(source_id, &source.source, stream_desc, auth)?;
+        Ok((stream, stream_desc))
     }
 
-    /// Load source information from the database
+    /// Load source information, served from the source cache when possible
     async fn load_source(&self, source_id: &str) -> Result<SourceInfo> {
+        if let Some(info) = source_info_cache().get(source_id) {
+            return Ok(info);
+        }
+
         let result = sqlx::query_as::<_, (String, String)>(
             "SELECT source, name FROM elt_source_connections WHERE id = $1 AND is_active = true",
         )
@@ -110,7 +163,11 @@ impl StreamFactory {
         .await?;
 
         match result {
-            Some((source, name)) => Ok(SourceInfo { source, name }),
+            Some((source, name)) => {
+                let info = SourceInfo { source, name };
+                source_info_cache().insert(source_id.to_string(), info.clone());
+                Ok(info)
+            }
             None => Err(Error::Database(format!(
                 "Source not found or inactive: {}",
                 source_id
@@ -119,7 +176,15 @@ impl StreamFactory {
     }
 
     /// Create authentication for a source
-    async fn create_auth(&self, source_id: &str, provider: &str) -> Result<SourceAuth> {
+    ///
+    /// `source_name` is the connection's name when the caller has already
+    /// loaded it; device sources otherwise look it up.
+    async fn create_auth(
+        &self,
+        source_id: &str,
+        provider: &str,
+        source_name: Option<&str>,
+    ) -> Result<SourceAuth> {
         match provider {
             "github" | "google" | "notion" | "plaid" | "spotify" | "strava" => {
                 // OAuth2 sources - create TokenManager for token refresh
@@ -129,8 +194,11 @@ impl StreamFactory {
             "ios" | "mac" => {
                 // Device sources don't use traditional auth - they push data
                 // The device_id is the source name
-                let source = self.load_source(source_id).await?;
-                Ok(SourceAuth::device(source.name))
+                let device_id = match source_name {
+                    Some(name) => name.to_string(),
+                    None => self.load_source(source_id).await?.name,
+                };
+                Ok(SourceAuth::device(device_id))
             }
             _ => Err(Error::Other(format!("Unknown provider: {}", provider))),
         }
@@ -138,12 +206,11 @@ impl StreamFactory {
 
     /// Create the stream implementation with StreamType enum
     ///
-    /// This method now delegates to the unified registry for stream creation.
-    /// Each stream registers its creator function alongside its metadata,
-    /// eliminating the need for large match statements.
-    ///
-    /// All streams now implement either PullStream (backend-initiated) or
-    /// PushStream (client-initiated) traits for clear architectural boundaries.
+    /// Resolves the stream by name (including disabled streams) and runs its
+    /// registered creator. `create_stream_typed` already holds the descriptor
+    /// and goes straight to `instantiate_stream`; this entry point lets tests
+    /// construct streams without a source row in the database.
+    #[cfg(test)]
     async fn create_stream_typed_impl(
         &self,
         source_id: &str,
@@ -163,6 +230,24 @@ impl StreamFactory {
                 ))
             })?;
 
+        self.instantiate_stream(source_id, provider, stream_desc, auth)
+    }
+
+    /// Run a resolved stream's registered creator
+    ///
+    /// This delegates to the unified registry for stream creation. Each
+    /// stream registers its creator function alongside its metadata,
+    /// eliminating the need for large match statements.
+    ///
+    /// All streams now implement either PullStream (backend-initiated) or
+    /// PushStream (client-initiated) traits for clear architectural boundaries.
+    fn instantiate_stream(
+        &self,
+        source_id: &str,
+        provider: &str,
+        stream_desc: &crate::registry::RegisteredStream,
+        auth: SourceAuth,
+    ) -> Result<StreamType> {
         // Check if the stream has a creator registered
         if let Some(creator) = stream_desc.stream_creator {
             // Use the unified registry's stream creator
@@ -179,7 +264,7 @@ impl StreamFactory {
         // Fallback: Stream doesn't have a creator registered yet
         Err(Error::Other(format!(
             "Stream {}/{} has no creator registered in the unified registry",
-            provider, stream_name
+            provider, stream_desc.descriptor.name
         )))
     }
 }
@@ -195,6 +280,7 @@ impl Clone for StreamFactory {
 }
 
 /// Source information loaded from database
+#[derive(Clone)]
 struct SourceInfo {
     source: String,
     name: String,
@@ -231,12 +317,31 @@ mod tests {
 
         // Note: This will fail without a source in the database
         // That's expected - this tests the code path, not the database
-        let result = factory.create_auth("source_ios-test", "ios").await;
+        let result = factory.create_auth("source_ios-test", "ios", None).await;
 
         // Should return error because source doesn't exist
         assert!(result.is_err());
     }
 
+    #[tokio::test]
+    async fn test_create_auth_device_with_known_name() {
+        let pool = SqlitePool::connect_lazy("sqlite::memory:").unwrap();
+        let storage = Arc::new(Storage::local("./test_data".to_string()).unwrap());
+        let stream_writer = Arc::new(Mutex::new(StreamWriter::new()));
+        let factory = StreamFactory::new(pool, storage, stream_writer);
+
+        // A caller-supplied name skips the database lookup entirely
+        let auth = factory
+            .create_auth("source_ios-test", "ios", Some("device-123"))
+            .await
+            .unwrap();
+
+        match auth {
+            SourceAuth::Device { device_id } => assert_eq!(device_id, "device-123"),
+            _ => panic!("Expected SourceAuth::Device"),
+        }
+    }
+
     #[tokio::test]
     async fn test_create_auth_unknown_source() {
         let pool = SqlitePool::connect_lazy("sqlite::memory:").unwrap();
@@ -245,7 +350,7 @@ mod tests {
         let factory = StreamFactory::new(pool, storage, stream_writer);
 
         let result = factory
-            .create_auth("source_unknown-test", "unknown_source")
+            .create_auth("source_unknown-test", "unknown_source", None)
             .await;
         assert!(result.is_err());
 
@@ -188,7 +188,7 @@ impl GitHubEventsStream {
                         "id": o.id,
                         "login": o.login,
                     })),
-                    "synced_at": Utc::now(),
+                    "synced_at": started_at,
                 });
 
                 // Write to object storage via StreamWriter
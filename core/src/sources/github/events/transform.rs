@@ -211,7 +211,7 @@ impl OntologyTransform for GitHubBookmarkTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -250,7 +250,7 @@ impl OntologyTransform for GitHubBookmarkTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -62,7 +62,7 @@ impl GoogleCalendarStream {
     /// Load configuration from database (called by PullStream trait)
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Load from stream_connections table only
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'calendar'",
         )
         .bind(source_id)
@@ -70,7 +70,7 @@ impl GoogleCalendarStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = GoogleCalendarConfig::from_json(&config_json) {
+            if let Ok(config) = GoogleCalendarConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -98,9 +98,6 @@ impl GoogleCalendarStream {
         let mut earliest_record_at: Option<DateTime<Utc>> = None;
         let mut latest_record_at: Option<DateTime<Utc>> = None;
 
-        // Start database transaction for atomicity
-        let mut tx = self.db.begin().await?;
-
         // Get last sync token from database
         let last_sync_token = self.get_last_sync_token().await?;
 
@@ -135,7 +132,7 @@ impl GoogleCalendarStream {
                 "Response metadata"
             );
 
-            // Process events within transaction
+            // Process events
             for event in result.items {
                 // Update watermarks
                 let event_start = if let Some(start) = event.start.as_ref() {
@@ -167,7 +164,7 @@ impl GoogleCalendarStream {
                 }
 
                 match self
-                    .upsert_event_with_tx(calendar_id, &event, &mut tx)
+                    .upsert_event(calendar_id, &event, started_at)
                     .await
                 {
                     Ok(true) => records_written += 1,
@@ -186,18 +183,21 @@ impl GoogleCalendarStream {
                 }
             }
 
-            // Save new sync token within transaction
             if let Some(token) = result.next_sync_token {
-                tracing::info!("Saving sync token: {}", &token);
-                self.save_sync_token_with_tx(&token, &mut tx).await?;
                 next_cursor = Some(token);
             } else {
                 tracing::warn!("No sync token returned from API response");
             }
         }
 
-        // Commit transaction - all or nothing
-        tx.commit().await?;
+        // Save the sync token once every calendar has been fetched.
+        // Transaction scoped tightly so no connection is held across network I/O.
+        if let Some(ref token) = next_cursor {
+            tracing::info!("Saving sync token: {}", token);
+            let mut tx = self.db.begin().await?;
+            self.save_sync_token_with_tx(token, &mut tx).await?;
+            tx.commit().await?;
+        }
 
         let completed_at = Utc::now();
 
@@ -269,38 +269,39 @@ impl GoogleCalendarStream {
         let min_time_dt = start_date.or(config_min);
         let max_time_dt = end_date.or(config_max);
 
+        // Resolve the query window once; only the page token changes per page
+        let max_results = self.config.max_events_per_sync.to_string();
+        let min_time = min_time_dt.map(|min| min.to_rfc3339());
+        let max_time = max_time_dt.map(|max| max.to_rfc3339());
+        let path = format!("calendars/{calendar_id}/events");
+
+        let mut base_params: Vec<(&str, &str)> = vec![
+            ("maxResults", max_results.as_str()),
+            ("singleEvents", "true"),
+            ("orderBy", "updated"),
+            ("showDeleted", "false"),
+            ("showHiddenInvitations", "false"),
+        ];
+        if let Some(ref min) = min_time {
+            base_params.push(("timeMin", min.as_str()));
+        }
+        if let Some(ref max) = max_time {
+            base_params.push(("timeMax", max.as_str()));
+        }
+
         let mut all_events = Vec::new();
         let mut page_token: Option<String> = None;
         let mut final_sync_token: Option<String> = None;
 
         loop {
-            let mut params = vec![
-                ("maxResults", self.config.max_events_per_sync.to_string()),
-                ("singleEvents", "true".to_string()),
-                ("orderBy", "updated".to_string()),
-                ("showDeleted", "false".to_string()),
-                ("showHiddenInvitations", "false".to_string()),
-            ];
-
-            if let Some(min) = min_time_dt {
-                params.push(("timeMin", min.to_rfc3339()));
-            }
-            if let Some(max) = max_time_dt {
-                params.push(("timeMax", max.to_rfc3339()));
-            }
+            let mut param_refs = base_params.clone();
 
             // Add page token if we have one
             if let Some(ref token) = page_token {
-                params.push(("pageToken", token.clone()));
+                param_refs.push(("pageToken", token.as_str()));
             }
 
-            let param_refs: Vec<(&str, &str)> =
-                params.iter().map(|(k, v)| (*k, v.as_str())).collect();
-
-            let response: EventsResponse = self
-                .client
-                .get_with_params(&format!("calendars/{calendar_id}/events"), &param_refs)
-                .await?;
+            let response: EventsResponse = self.client.get_with_params(&path, &param_refs).await?;
 
             // Accumulate events from this page
             all_events.extend(response.items);
@@ -339,12 +340,12 @@ impl GoogleCalendarStream {
         })
     }
 
-    /// Insert or update an event within a transaction
-    async fn upsert_event_with_tx(
+    /// Write an event to the StreamWriter
+    async fn upsert_event(
         &self,
         calendar_id: &str,
         event: &Event,
-        _tx: &mut sqlx::Transaction<'_, sqlx::Sqlite>,
+        synced_at: DateTime<Utc>,
     ) -> Result<bool> {
         // Extract key fields - handle both datetime and date formats
         let start_time = if let Some(start) = event.start.as_ref() {
@@ -459,7 +460,7 @@ impl GoogleCalendarStream {
             "is_recurring": event.recurring_event_id.is_some(),
             "recurring_event_id": event.recurring_event_id,
             "raw_event": event,
-            "synced_at": Utc::now(),
+            "synced_at": synced_at,
         });
 
         // Write to S3/object storage via StreamWriter
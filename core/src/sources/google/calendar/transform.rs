@@ -246,7 +246,7 @@ impl OntologyTransform for GoogleCalendarTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -285,7 +285,7 @@ impl OntologyTransform for GoogleCalendarTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
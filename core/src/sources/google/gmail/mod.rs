@@ -66,7 +66,7 @@ impl GoogleGmailStream {
     /// Load configuration from database (called by PullStream trait)
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Try loading from stream_connections table first (new pattern)
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'gmail'",
         )
         .bind(source_id)
@@ -74,7 +74,7 @@ impl GoogleGmailStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = GoogleGmailConfig::from_json(&config_json) {
+            if let Ok(config) = GoogleGmailConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -228,6 +228,28 @@ impl GoogleGmailStream {
         ))
     }
 
+    /// Build the list parameters shared by every page of a full sync
+    fn full_sync_params(&self) -> Vec<(&'static str, String)> {
+        let mut params = vec![("maxResults", self.config.max_messages_per_sync.to_string())];
+
+        // Add label filters
+        for label in &self.config.label_ids {
+            params.push(("labelIds", label.clone()));
+        }
+
+        // Add query
+        let query = self.config.build_query();
+        if !query.is_empty() {
+            params.push(("q", query));
+        }
+
+        if self.config.include_spam_trash {
+            params.push(("includeSpamTrash", "true".to_string()));
+        }
+
+        params
+    }
+
     /// Full sync of messages with pagination
     async fn sync_messages_full(&self) -> Result<(usize, usize, usize, Option<String>)> {
         let mut records_fetched = 0;
@@ -236,33 +258,18 @@ impl GoogleGmailStream {
         let mut latest_history_id = None;
         let mut page_token: Option<String> = None;
 
-        loop {
-            // Build query parameters
-            let mut params = vec![("maxResults", self.config.max_messages_per_sync.to_string())];
-
-            // Add label filters
-            for label in &self.config.label_ids {
-                params.push(("labelIds", label.clone()));
-            }
+        // Resolve the query window once so every page lists the same range
+        let params = self.full_sync_params();
 
-            // Add query
-            let query = self.config.build_query();
-            if !query.is_empty() {
-                params.push(("q", query));
-            }
-
-            if self.config.include_spam_trash {
-                params.push(("includeSpamTrash", "true".to_string()));
-            }
+        loop {
+            let mut param_refs: Vec<(&str, &str)> =
+                params.iter().map(|(k, v)| (*k, v.as_str())).collect();
 
             // Add page token if we have one
             if let Some(ref token) = page_token {
-                params.push(("pageToken", token.clone()));
+                param_refs.push(("pageToken", token.as_str()));
             }
 
-            let param_refs: Vec<(&str, &str)> =
-                params.iter().map(|(k, v)| (*k, v.as_str())).collect();
-
             // List messages
             let response: MessagesListResponse = self
                 .client
@@ -332,33 +339,18 @@ impl GoogleGmailStream {
         let mut latest_history_id = None;
         let mut page_token: Option<String> = None;
 
-        loop {
-            // Build query parameters
-            let mut params = vec![("maxResults", self.config.max_messages_per_sync.to_string())];
-
-            // Add label filters
-            for label in &self.config.label_ids {
-                params.push(("labelIds", label.clone()));
-            }
+        // Resolve the query window once so every page lists the same range
+        let params = self.full_sync_params();
 
-            // Add query
-            let query = self.config.build_query();
-            if !query.is_empty() {
-                params.push(("q", query));
-            }
-
-            if self.config.include_spam_trash {
-                params.push(("includeSpamTrash", "true".to_string()));
-            }
+        loop {
+            let mut param_refs: Vec<(&str, &str)> =
+                params.iter().map(|(k, v)| (*k, v.as_str())).collect();
 
             // Add page token if we have one
             if let Some(ref token) = page_token {
-                params.push(("pageToken", token.clone()));
+                param_refs.push(("pageToken", token.as_str()));
             }
 
-            let param_refs: Vec<(&str, &str)> =
-                params.iter().map(|(k, v)| (*k, v.as_str())).collect();
-
             // List threads
             let response: ThreadsListResponse = self
                 .client
@@ -457,6 +449,9 @@ impl GoogleGmailStream {
         thread_position: Option<i32>,
         thread_message_count: Option<i32>,
     ) -> Result<bool> {
+        // One clock read per message, shared by the date fallback and synced_at
+        let now = Utc::now();
+
         // Extract headers into a map
         let mut headers_map = HashMap::new();
         if let Some(ref payload) = message.payload {
@@ -484,9 +479,9 @@ impl GoogleGmailStream {
 
         // Parse date
         let date = if let Some(date_str) = date_str {
-            self.parse_email_date(&date_str).unwrap_or_else(Utc::now)
+            self.parse_email_date(&date_str).unwrap_or(now)
         } else {
-            Utc::now()
+            now
         };
 
         // Parse internal date (milliseconds since epoch)
@@ -558,7 +553,7 @@ impl GoogleGmailStream {
             "internal_date": internal_date,
             "raw_message": message,
             "headers": headers_map,
-            "synced_at": Utc::now(),
+            "synced_at": now,
         });
 
         // Write to S3/object storage via StreamWriter
@@ -267,7 +267,7 @@ impl OntologyTransform for GmailEmailTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -306,7 +306,7 @@ impl OntologyTransform for GmailEmailTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
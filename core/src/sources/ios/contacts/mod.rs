@@ -65,7 +65,7 @@ impl PushStream for IosContactsStream {
             result.records_written += 1;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} Contacts records from device {}",
             result.records_written,
             payload.device_id
@@ -99,7 +99,7 @@ impl PushStream for IosEventKitStream {
             }
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} EventKit records from device {}",
             result.records_written,
             payload.device_id
@@ -62,7 +62,7 @@ impl PushStream for IosFinanceKitStream {
             result.records_written += 1;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} FinanceKit records from device {}",
             result.records_written,
             payload.device_id
@@ -13,6 +13,21 @@ use crate::sources::base::{OntologyTransform, TransformRegistration, TransformRe
 /// Batch size for bulk inserts
 const BATCH_SIZE: usize = 500;
 
+/// Columns refreshed when an account is seen again
+const ACCOUNT_UPSERT_SET: &str = "account_name = EXCLUDED.account_name, \
+     current_balance = EXCLUDED.current_balance, \
+     metadata = EXCLUDED.metadata, \
+     updated_at = datetime('now')";
+
+/// Columns refreshed when a transaction is seen again
+const TRANSACTION_UPSERT_SET: &str = "amount = EXCLUDED.amount, \
+     merchant_name = EXCLUDED.merchant_name, \
+     category = EXCLUDED.category, \
+     description = EXCLUDED.description, \
+     is_pending = EXCLUDED.is_pending, \
+     metadata = EXCLUDED.metadata, \
+     updated_at = datetime('now')";
+
 /// Transform FinanceKit account data to financial_account ontology
 pub struct IosFinanceAccountTransform;
 
@@ -239,20 +254,23 @@ async fn execute_account_batch_insert(
         return Ok(0);
     }
 
-    let query_str = format!(
-        "INSERT INTO data_financial_account (
-            id, account_name, account_type, institution_name, current_balance, currency, source_stream_id, source_table, source_provider, metadata
-        ) VALUES {}
-        ON CONFLICT (id) DO UPDATE SET
-            account_name = EXCLUDED.account_name,
-            current_balance = EXCLUDED.current_balance,
-            metadata = EXCLUDED.metadata,
-            updated_at = datetime('now')",
-        (0..records.len())
-            .map(|i| format!("(${}, ${}, ${}, ${}, ${}, ${}, ${}, 'stream_ios_financekit', 'apple_finance', ${})", 
-                i * 8 + 1, i * 8 + 2, i * 8 + 3, i * 8 + 4, i * 8 + 5, i * 8 + 6, i * 8 + 7, i * 8 + 8))
-            .collect::<Vec<_>>()
-            .join(", ")
+    let query_str = Database::build_batch_upsert_query(
+        "data_financial_account",
+        &[
+            "id",
+            "account_name",
+            "account_type",
+            "institution_name",
+            "current_balance",
+            "currency",
+            "source_stream_id",
+            "source_table",
+            "source_provider",
+            "metadata",
+        ],
+        "id",
+        ACCOUNT_UPSERT_SET,
+        records.len(),
     );
 
     let mut query = sqlx::query(&query_str);
@@ -266,6 +284,8 @@ async fn execute_account_batch_insert(
             .bind(balance)
             .bind(currency)
             .bind(stream_id)
+            .bind("stream_ios_financekit")
+            .bind("apple_finance")
             .bind(meta);
     }
 
@@ -281,23 +301,26 @@ async fn execute_transaction_batch_insert(
         return Ok(0);
     }
 
-    let query_str = format!(
-        "INSERT INTO data_financial_transaction (
-            id, account_id, transaction_id, amount, merchant_name, category, description, is_pending, timestamp, source_stream_id, source_table, source_provider, metadata
-        ) VALUES {}
-        ON CONFLICT (id) DO UPDATE SET
-            amount = EXCLUDED.amount,
-            merchant_name = EXCLUDED.merchant_name,
-            category = EXCLUDED.category,
-            description = EXCLUDED.description,
-            is_pending = EXCLUDED.is_pending,
-            metadata = EXCLUDED.metadata,
-            updated_at = datetime('now')",
-        (0..records.len())
-            .map(|i| format!("(${}, ${}, ${}, ${}, ${}, ${}, ${}, ${}, ${}, ${}, 'stream_ios_financekit', 'apple_finance', ${})",
-                i * 11 + 1, i * 11 + 2, i * 11 + 3, i * 11 + 4, i * 11 + 5, i * 11 + 6, i * 11 + 7, i * 11 + 8, i * 11 + 9, i * 11 + 10, i * 11 + 11))
-            .collect::<Vec<_>>()
-            .join(", ")
+    let query_str = Database::build_batch_upsert_query(
+        "data_financial_transaction",
+        &[
+            "id",
+            "account_id",
+            "transaction_id",
+            "amount",
+            "merchant_name",
+            "category",
+            "description",
+            "is_pending",
+            "timestamp",
+            "source_stream_id",
+            "source_table",
+            "source_provider",
+            "metadata",
+        ],
+        "id",
+        TRANSACTION_UPSERT_SET,
+        records.len(),
     );
 
     let mut query = sqlx::query(&query_str);
@@ -314,6 +337,8 @@ async fn execute_transaction_batch_insert(
             .bind(pending)
             .bind(ts)
             .bind(stream_id)
+            .bind("stream_ios_financekit")
+            .bind("apple_finance")
             .bind(meta);
     }
 
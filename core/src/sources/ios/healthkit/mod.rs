@@ -54,7 +54,9 @@ impl PushStream for IosHealthKitStream {
 
         // source_id is passed from handler - single source of truth, no duplicate DB query
 
-        // Process each record
+        // Validate the whole batch and parse its timestamps up front, then hand
+        // the records to the StreamWriter in one locked call
+        let mut timestamps = Vec::with_capacity(payload.records.len());
         for record in &payload.records {
             // Parse timestamp
             let timestamp = record
@@ -93,16 +95,17 @@ impl PushStream for IosHealthKitStream {
                 validate_percentage("Body fat percentage", bf)?;
             }
 
-            // Write to object storage via StreamWriter
-            {
-                let mut writer = self.stream_writer.lock().await;
-                writer.write_record(source_id, "healthkit", record.clone(), Some(timestamp_dt))?;
-            }
+            timestamps.push(Some(timestamp_dt));
+        }
 
-            result.records_written += 1;
+        // Write to object storage via StreamWriter
+        result.records_written = timestamps.len();
+        {
+            let mut writer = self.stream_writer.lock().await;
+            writer.write_records(source_id, "healthkit", payload.records.into_iter().zip(timestamps))?;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} HealthKit records from device {}",
             result.records_written,
             payload.device_id
@@ -143,7 +143,7 @@ impl OntologyTransform for HealthKitHeartRateTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -182,7 +182,7 @@ impl OntologyTransform for HealthKitHeartRateTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -351,7 +351,7 @@ impl OntologyTransform for HealthKitHRVTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -390,7 +390,7 @@ impl OntologyTransform for HealthKitHRVTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -544,7 +544,7 @@ impl OntologyTransform for HealthKitStepsTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -583,7 +583,7 @@ impl OntologyTransform for HealthKitStepsTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -781,7 +781,7 @@ impl OntologyTransform for HealthKitSleepTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -820,7 +820,7 @@ impl OntologyTransform for HealthKitSleepTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -1026,7 +1026,7 @@ impl OntologyTransform for HealthKitWorkoutTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -1065,7 +1065,7 @@ impl OntologyTransform for HealthKitWorkoutTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
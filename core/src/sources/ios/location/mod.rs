@@ -48,7 +48,9 @@ impl PushStream for IosLocationStream {
 
         // source_id is passed from handler - single source of truth, no duplicate DB query
 
-        // Process each record
+        // Validate the whole batch and parse its timestamps up front, then hand
+        // the records to the StreamWriter in one locked call
+        let mut timestamps = Vec::with_capacity(payload.records.len());
         for record in &payload.records {
             // Extract required fields
             let timestamp = record
@@ -76,16 +78,17 @@ impl PushStream for IosLocationStream {
                 .with_timezone(&Utc);
             validate_timestamp_reasonable(timestamp_dt)?;
 
-            // Write to object storage via StreamWriter
-            {
-                let mut writer = self.stream_writer.lock().await;
-                writer.write_record(source_id, "location", record.clone(), Some(timestamp_dt))?;
-            }
+            timestamps.push(Some(timestamp_dt));
+        }
 
-            result.records_written += 1;
+        // Write to object storage via StreamWriter
+        result.records_written = timestamps.len();
+        {
+            let mut writer = self.stream_writer.lock().await;
+            writer.write_records(source_id, "location", payload.records.into_iter().zip(timestamps))?;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} location records from device {}",
             result.records_written,
             payload.device_id
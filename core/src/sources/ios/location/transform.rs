@@ -90,6 +90,11 @@ impl OntologyTransform for IosLocationTransform {
         for batch in batches {
             tracing::debug!(batch_record_count = batch.records.len(), "Processing batch");
 
+            // Bulk-load each chunk inside a single transaction. Initial device
+            // uploads carry months of history, and committing every 500-row
+            // INSERT separately makes WAL commits dominate the load time.
+            let mut tx = db.pool().begin().await?;
+
             for record in &batch.records {
                 records_read += 1;
 
@@ -138,15 +143,29 @@ impl OntologyTransform for IosLocationTransform {
                     .map(|v| v as i32);
                 let raw_data = record.get("raw_data").cloned();
 
-                // Build metadata with iOS-specific fields
-                let metadata = serde_json::json!({
-                    "speed": speed,
-                    "course": course,
-                    "activity_type": activity_type,
-                    "activity_confidence": activity_confidence,
-                    "floor_level": floor_level,
-                    "ios_raw": raw_data,
-                });
+                // Build metadata with iOS-specific fields. Absent values are
+                // omitted rather than stored as nulls: json_extract reads them
+                // the same, and most points only carry a few of these fields.
+                let mut metadata = serde_json::Map::new();
+                if let Some(speed) = speed {
+                    metadata.insert("speed".into(), speed.into());
+                }
+                if let Some(course) = course {
+                    metadata.insert("course".into(), course.into());
+                }
+                if let Some(activity_type) = activity_type {
+                    metadata.insert("activity_type".into(), activity_type.into());
+                }
+                if let Some(activity_confidence) = activity_confidence {
+                    metadata.insert("activity_confidence".into(), activity_confidence.into());
+                }
+                if let Some(floor_level) = floor_level {
+                    metadata.insert("floor_level".into(), floor_level.into());
+                }
+                if let Some(raw_data) = raw_data {
+                    metadata.insert("ios_raw".into(), raw_data);
+                }
+                let metadata = serde_json::Value::Object(metadata);
 
                 // Generate UUID for this record
                 let record_id = Uuid::new_v4().to_string();
@@ -169,12 +188,13 @@ impl OntologyTransform for IosLocationTransform {
                 // Execute batch insert when we reach batch size
                 if pending_records.len() >= BATCH_SIZE {
                     let insert_start = std::time::Instant::now();
-                    let batch_result = execute_location_batch_insert(db, &pending_records).await;
+                    let batch_result =
+                        execute_location_batch_insert(&mut tx, &pending_records).await;
                     let insert_duration = insert_start.elapsed();
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -197,6 +217,40 @@ impl OntologyTransform for IosLocationTransform {
                 }
             }
 
+            // Insert any remaining records for this chunk
+            if !pending_records.is_empty() {
+                let insert_start = std::time::Instant::now();
+                let batch_result = execute_location_batch_insert(&mut tx, &pending_records).await;
+                let insert_duration = insert_start.elapsed();
+                batch_insert_total_ms += insert_duration.as_millis();
+                batch_insert_count += 1;
+
+                tracing::debug!(
+                    batch_size = pending_records.len(),
+                    insert_duration_ms = insert_duration.as_millis(),
+                    "Executed final batch insert"
+                );
+
+                match batch_result {
+                    Ok(written) => {
+                        records_written += written;
+                    }
+                    Err(e) => {
+                        tracing::warn!(
+                            error = %e,
+                            batch_size = pending_records.len(),
+                            "Final batch insert failed"
+                        );
+                        records_failed += pending_records.len();
+                    }
+                }
+                pending_records.clear();
+            }
+
+            // Commit before touching the checkpoint so the checkpoint write
+            // doesn't wait on this chunk's write lock
+            tx.commit().await?;
+
             // Update checkpoint after processing batch
             if let Some(max_ts) = batch.max_timestamp {
                 data_source
@@ -205,35 +259,6 @@ impl OntologyTransform for IosLocationTransform {
             }
         }
 
-        // Insert any remaining records
-        if !pending_records.is_empty() {
-            let insert_start = std::time::Instant::now();
-            let batch_result = execute_location_batch_insert(db, &pending_records).await;
-            let insert_duration = insert_start.elapsed();
-            batch_insert_total_ms += insert_duration.as_millis();
-            batch_insert_count += 1;
-
-            tracing::info!(
-                batch_size = pending_records.len(),
-                insert_duration_ms = insert_duration.as_millis(),
-                "Executed final batch insert"
-            );
-
-            match batch_result {
-                Ok(written) => {
-                    records_written += written;
-                }
-                Err(e) => {
-                    tracing::warn!(
-                        error = %e,
-                        batch_size = pending_records.len(),
-                        "Final batch insert failed"
-                    );
-                    records_failed += pending_records.len();
-                }
-            }
-        }
-
         let processing_duration = processing_start.elapsed();
         let total_duration = transform_start.elapsed();
 
@@ -265,8 +290,9 @@ impl OntologyTransform for IosLocationTransform {
 /// Execute batch insert for location records
 ///
 /// Builds and executes a multi-row INSERT statement for efficient bulk insertion.
+/// Runs on the caller's connection so several batches can share one transaction.
 async fn execute_location_batch_insert(
-    db: &Database,
+    conn: &mut sqlx::SqliteConnection,
     records: &[(
         String,      // id (UUID)
         f64,         // latitude
@@ -319,7 +345,7 @@ async fn execute_location_batch_insert(
             .bind(metadata);
     }
 
-    let result = query.execute(db.pool()).await?;
+    let result = query.execute(&mut *conn).await?;
     Ok(result.rows_affected() as usize)
 }
 
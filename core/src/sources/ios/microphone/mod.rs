@@ -6,6 +6,7 @@ pub mod transform;
 
 use async_trait::async_trait;
 use chrono::Utc;
+use futures::stream::{self, StreamExt};
 use sqlx::SqlitePool;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -20,6 +21,9 @@ use crate::{
     storage::{stream_writer::StreamWriter, Storage},
 };
 
+/// Maximum number of audio uploads in flight for a single push
+const MAX_CONCURRENT_UPLOADS: usize = 8;
+
 /// iOS Microphone stream implementing PushStream trait
 ///
 /// Receives microphone/audio data pushed from iOS devices via /ingest endpoint.
@@ -42,6 +46,39 @@ impl IosMicrophoneStream {
             stream_writer,
         }
     }
+
+    /// Decode and upload a record's audio file, returning its storage key and size
+    async fn upload_audio(
+        &self,
+        device_id: &str,
+        record: &serde_json::Value,
+    ) -> Option<(String, i32)> {
+        use base64::Engine;
+
+        let audio_data_b64 = record.get("audio_data").and_then(|v| v.as_str())?;
+        let audio_format = record.get("audio_format").and_then(|v| v.as_str());
+
+        // Decoding ~1 MB of base64 is CPU-bound; keep it off the runtime so
+        // the other uploads in flight keep making progress
+        let audio_data_b64 = audio_data_b64.to_owned();
+        let audio_bytes = tokio::task::spawn_blocking(move || {
+            base64::engine::general_purpose::STANDARD.decode(audio_data_b64)
+        })
+        .await
+        .ok()?
+        .ok()?;
+        let audio_file_size = audio_bytes.len() as i32;
+
+        let key = format!(
+            "ios/microphone/{}/{}.{}",
+            device_id,
+            Uuid::new_v4(),
+            audio_format.unwrap_or("m4a")
+        );
+
+        self.storage.upload(&key, audio_bytes).await.ok()?;
+        Some((key, audio_file_size))
+    }
 }
 
 #[async_trait]
@@ -54,7 +91,8 @@ impl PushStream for IosMicrophoneStream {
 
         // source_id is passed from handler - single source of truth, no duplicate DB query
 
-        // Process each record
+        // Validate the whole batch and parse its timestamps up front
+        let mut timestamps = Vec::with_capacity(payload.records.len());
         for record in &payload.records {
             // iOS sends timestamp_start and timestamp_end for microphone chunks
             let timestamp = record
@@ -68,60 +106,42 @@ impl PushStream for IosMicrophoneStream {
                 .with_timezone(&Utc);
             validate_timestamp_reasonable(timestamp_dt)?;
 
-            // Handle audio file upload if present
-            let mut audio_file_key: Option<String> = None;
-            let mut audio_file_size: Option<i32> = None;
-            let audio_format = record.get("audio_format").and_then(|v| v.as_str());
-
-            if let Some(audio_data_b64) = record.get("audio_data").and_then(|v| v.as_str()) {
-                use base64::Engine;
-                if let Ok(audio_bytes) =
-                    base64::engine::general_purpose::STANDARD.decode(audio_data_b64)
-                {
-                    let key = format!(
-                        "ios/microphone/{}/{}.{}",
-                        payload.device_id,
-                        Uuid::new_v4(),
-                        audio_format.unwrap_or("m4a")
-                    );
-
-                    if self.storage.upload(&key, audio_bytes.clone()).await.is_ok() {
-                        audio_file_key = Some(key.clone());
-                        audio_file_size = Some(audio_bytes.len() as i32);
-                    }
-                }
-            }
-
-            // Build complete record including audio file metadata
-            let mut record_with_audio = record.clone();
-            if let Some(ref key) = audio_file_key {
-                if let Some(obj) = record_with_audio.as_object_mut() {
-                    obj.insert(
-                        "uploaded_audio_file_key".to_string(),
-                        serde_json::json!(key),
-                    );
-                    obj.insert(
-                        "uploaded_audio_file_size".to_string(),
-                        serde_json::json!(audio_file_size),
-                    );
-                }
-            }
+            timestamps.push(Some(timestamp_dt));
+        }
 
-            // Write to object storage via StreamWriter
-            {
-                let mut writer = self.stream_writer.lock().await;
-                writer.write_record(
-                    source_id,
-                    "microphone",
-                    record_with_audio,
-                    Some(timestamp_dt),
-                )?;
+        // Upload audio files with a bounded number in flight rather than one at a time
+        let uploads: Vec<Option<(String, i32)>> = stream::iter(&payload.records)
+            .map(|record| self.upload_audio(&payload.device_id, record))
+            .buffered(MAX_CONCURRENT_UPLOADS)
+            .collect()
+            .await;
+
+        // Attach audio file metadata to the owned records in place. Once the audio
+        // lives in storage the inline base64 copy is dropped from the record;
+        // if the upload failed it is kept so nothing is lost.
+        let mut records = payload.records;
+        for (record, upload) in records.iter_mut().zip(uploads) {
+            if let (Some((key, size)), Some(obj)) = (upload, record.as_object_mut()) {
+                obj.remove("audio_data");
+                obj.insert(
+                    "uploaded_audio_file_key".to_string(),
+                    serde_json::json!(key),
+                );
+                obj.insert(
+                    "uploaded_audio_file_size".to_string(),
+                    serde_json::json!(size),
+                );
             }
+        }
 
-            result.records_written += 1;
+        // Write to object storage via StreamWriter
+        result.records_written = records.len();
+        {
+            let mut writer = self.stream_writer.lock().await;
+            writer.write_records(source_id, "microphone", records.into_iter().zip(timestamps))?;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} microphone records from device {}",
             result.records_written,
             payload.device_id
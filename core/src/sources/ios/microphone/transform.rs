@@ -7,6 +7,7 @@
 use async_trait::async_trait;
 use base64::Engine;
 use chrono::{DateTime, Utc};
+use futures::stream::{self, StreamExt};
 use serde::Deserialize;
 use uuid::Uuid;
 
@@ -36,6 +37,55 @@ Rules:
 - Silence/noise: Return {"title":"Silence","summary":"No speech detected","text":"","language":"en","confidence":0.0,"speaker_count":0,"tags":[],"entities":{"people":[],"places":[],"organizations":[]}}
 "#;
 
+/// Audio downloads kept in flight ahead of transcription
+const MAX_CONCURRENT_DOWNLOADS: usize = 4;
+
+/// Rows per multi-row INSERT (17 binds each, well under SQLite's limit)
+const INSERT_BATCH_SIZE: usize = 500;
+
+/// Columns written to data_communication_transcription, in bind order
+const TRANSCRIPTION_COLUMNS: &[&str] = &[
+    "id",
+    "audio_url",
+    "text",
+    "title",
+    "summary",
+    "language",
+    "duration_seconds",
+    "start_time",
+    "end_time",
+    "speaker_count",
+    "confidence",
+    "tags",
+    "entities",
+    "source_stream_id",
+    "source_table",
+    "source_provider",
+    "metadata",
+];
+
+/// A microphone record with its audio fetched from storage
+struct AudioChunk {
+    audio_key: String,
+    start_time: DateTime<Utc>,
+    end_time: Option<DateTime<Utc>>,
+    duration_seconds: Option<f64>,
+    audio: Result<Vec<u8>>,
+}
+
+/// A transcribed chunk waiting to be written
+struct TranscriptionRow {
+    id: String,
+    audio_key: String,
+    transcription: TranscriptionResponse,
+    duration_seconds: Option<f64>,
+    start_time: DateTime<Utc>,
+    end_time: Option<DateTime<Utc>>,
+    tags_json: String,
+    entities_json: String,
+    stream_id: String,
+}
+
 /// Parsed response from Gemini transcription
 #[derive(Debug, Deserialize)]
 struct TranscriptionResponse {
@@ -73,7 +123,7 @@ impl IosMicrophoneTransform {
         tollbooth::validate_secret(&tollbooth_secret)?;
 
         // Use streaming client (300s timeout) since Gemini audio processing can take 30-90s
-        let http_client = http_client::tollbooth_streaming_client();
+        let http_client = http_client::shared_streaming_client();
 
         Ok(Self {
             tollbooth_url,
@@ -227,50 +277,84 @@ impl OntologyTransform for IosMicrophoneTransform {
             .read_with_checkpoint(&source_id, "microphone", checkpoint_key)
             .await?;
 
+        let mut pending_rows: Vec<TranscriptionRow> = Vec::new();
+
         for batch in batches {
-            for record in &batch.records {
+            // Fetch audio a few records ahead so downloads overlap with the
+            // (much slower) transcription calls; results stay in record order
+            let storage = &context.storage;
+            let mut downloads = stream::iter(&batch.records)
+                .map(|record| async move {
+                    let stream_id = record
+                        .get("id")
+                        .and_then(|v| v.as_str())
+                        .map(|s| s.to_string())
+                        .unwrap_or_else(|| Uuid::new_v4().to_string());
+
+                    // Records without uploaded audio have nothing to fetch
+                    let audio_key = match record
+                        .get("uploaded_audio_file_key")
+                        .and_then(|v| v.as_str())
+                    {
+                        Some(key) => key.to_string(),
+                        None => return (stream_id, None),
+                    };
+
+                    // Extract timestamps from source record
+                    let start_time = record
+                        .get("timestamp_start")
+                        .or_else(|| record.get("timestamp"))
+                        .and_then(|v| v.as_str())
+                        .and_then(|s| s.parse::<DateTime<Utc>>().ok())
+                        .unwrap_or_else(Utc::now);
+
+                    let end_time = record
+                        .get("timestamp_end")
+                        .and_then(|v| v.as_str())
+                        .and_then(|s| s.parse::<DateTime<Utc>>().ok());
+
+                    let duration_seconds =
+                        record.get("duration_seconds").and_then(|v| v.as_f64());
+
+                    let audio = storage.download(&audio_key).await;
+
+                    (
+                        stream_id,
+                        Some(AudioChunk {
+                            audio_key,
+                            start_time,
+                            end_time,
+                            duration_seconds,
+                            audio,
+                        }),
+                    )
+                })
+                .buffered(MAX_CONCURRENT_DOWNLOADS);
+
+            while let Some((stream_id, chunk)) = downloads.next().await {
                 records_read += 1;
 
-                let stream_id = record
-                    .get("id")
-                    .and_then(|v| v.as_str())
-                    .map(|s| s.to_string())
-                    .unwrap_or_else(|| Uuid::new_v4().to_string());
-
                 last_processed_id = Some(stream_id.clone());
 
                 // Skip records without uploaded audio
-                let audio_key = match record
-                    .get("uploaded_audio_file_key")
-                    .and_then(|v| v.as_str())
-                {
-                    Some(key) => key.to_string(),
+                let AudioChunk {
+                    audio_key,
+                    start_time,
+                    end_time,
+                    duration_seconds,
+                    audio,
+                } = match chunk {
+                    Some(chunk) => chunk,
                     None => {
                         tracing::debug!(stream_id = %stream_id, "No audio file key, skipping");
                         continue;
                     }
                 };
 
-                // Extract timestamps from source record
-                let start_time = record
-                    .get("timestamp_start")
-                    .or_else(|| record.get("timestamp"))
-                    .and_then(|v| v.as_str())
-                    .and_then(|s| s.parse::<DateTime<Utc>>().ok())
-                    .unwrap_or_else(Utc::now);
-
-                let end_time = record
-                    .get("timestamp_end")
-                    .and_then(|v| v.as_str())
-                    .and_then(|s| s.parse::<DateTime<Utc>>().ok());
-
-                let duration_seconds = record.get("duration_seconds").and_then(|v| v.as_f64());
-
                 // Extract audio format from the storage key extension (e.g. "ios/microphone/.../uuid.m4a")
                 let audio_format = audio_key.rsplit('.').next().unwrap_or("m4a");
 
-                // Download audio from MinIO
-                let audio_bytes = match context.storage.download(&audio_key).await {
+                let audio_bytes = match audio {
                     Ok(bytes) => bytes,
                     Err(e) => {
                         tracing::warn!(stream_id = %stream_id, error = %e, "Failed to download audio, skipping");
@@ -287,6 +371,9 @@ impl OntologyTransform for IosMicrophoneTransform {
                     Ok(t) => t,
                     Err(Error::ExternalApi(msg)) if msg.contains("429") => {
                         tracing::warn!("Rate limited, stopping transform early to retry later");
+                        let (written, failed) = flush_transcriptions(db, &mut pending_rows).await;
+                        records_written += written;
+                        records_failed += failed;
                         return Ok(TransformResult {
                             records_read,
                             records_written,
@@ -302,69 +389,36 @@ impl OntologyTransform for IosMicrophoneTransform {
                     }
                 };
 
-                // Insert into ontology table
+                // Queue for the batch insert below
                 let id = Uuid::new_v4().to_string();
                 let tags_json = transcription
                     .tags
-                    .map(|t| serde_json::to_string(&t).unwrap_or_else(|_| "[]".to_string()))
+                    .as_ref()
+                    .map(|t| serde_json::to_string(t).unwrap_or_else(|_| "[]".to_string()))
                     .unwrap_or_else(|| "[]".to_string());
                 let entities_json = transcription
                     .entities
-                    .map(|e| serde_json::to_string(&e).unwrap_or_else(|_| "{}".to_string()))
+                    .as_ref()
+                    .map(|e| serde_json::to_string(e).unwrap_or_else(|_| "{}".to_string()))
                     .unwrap_or_else(|| "{}".to_string());
 
-                let result = sqlx::query(
-                    r#"INSERT INTO data_communication_transcription (
-                        id, audio_url, text, title, summary, language,
-                        duration_seconds, start_time, end_time,
-                        speaker_count, confidence, tags, entities,
-                        source_stream_id, source_table, source_provider, metadata
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6,
-                        $7, $8, $9,
-                        $10, $11, $12, $13,
-                        $14, $15, $16, $17
-                    ) ON CONFLICT (source_stream_id) DO NOTHING"#,
-                )
-                .bind(&id)
-                .bind(&audio_key)
-                .bind(&transcription.text)
-                .bind(&transcription.title)
-                .bind(&transcription.summary)
-                .bind(&transcription.language)
-                .bind(duration_seconds)
-                .bind(start_time.to_rfc3339())
-                .bind(end_time.map(|t| t.to_rfc3339()))
-                .bind(transcription.speaker_count)
-                .bind(transcription.confidence)
-                .bind(&tags_json)
-                .bind(&entities_json)
-                .bind(&stream_id)
-                .bind("stream_ios_microphone")
-                .bind("ios")
-                .bind("{}")
-                .execute(db.pool())
-                .await;
-
-                match result {
-                    Ok(r) => {
-                        if r.rows_affected() > 0 {
-                            records_written += 1;
-                            tracing::debug!(
-                                stream_id = %stream_id,
-                                title = ?transcription.title,
-                                confidence = ?transcription.confidence,
-                                "Transcription saved"
-                            );
-                        }
-                    }
-                    Err(e) => {
-                        tracing::warn!(stream_id = %stream_id, error = %e, "Failed to insert transcription");
-                        records_failed += 1;
-                    }
-                }
+                pending_rows.push(TranscriptionRow {
+                    id,
+                    audio_key,
+                    transcription,
+                    duration_seconds,
+                    start_time,
+                    end_time,
+                    tags_json,
+                    entities_json,
+                    stream_id,
+                });
             }
 
+            let (written, failed) = flush_transcriptions(db, &mut pending_rows).await;
+            records_written += written;
+            records_failed += failed;
+
             // Update checkpoint after each batch
             if let Some(max_ts) = batch.max_timestamp {
                 data_source
@@ -390,6 +444,87 @@ impl OntologyTransform for IosMicrophoneTransform {
     }
 }
 
+/// Write queued transcriptions with multi-row INSERTs, returning (written, failed)
+///
+/// A chunk whose INSERT fails is replayed row by row, so one bad row only
+/// loses itself before the checkpoint moves past the batch. Transcriptions
+/// already on disk are skipped by the source_stream_id conflict target.
+async fn flush_transcriptions(db: &Database, rows: &mut Vec<TranscriptionRow>) -> (usize, usize) {
+    let mut written = 0;
+    let mut failed = 0;
+
+    for chunk in rows.chunks(INSERT_BATCH_SIZE) {
+        match insert_transcription_batch(db, chunk).await {
+            Ok(rows_affected) => {
+                written += rows_affected as usize;
+                tracing::debug!(
+                    batch_size = chunk.len(),
+                    rows_affected,
+                    "Transcriptions saved"
+                );
+                continue;
+            }
+            Err(e) => {
+                tracing::warn!(
+                    error = %e,
+                    batch_size = chunk.len(),
+                    "Failed to insert transcription batch, falling back to individual inserts"
+                );
+            }
+        }
+
+        for row in chunk {
+            match insert_transcription_batch(db, std::slice::from_ref(row)).await {
+                Ok(rows_affected) => written += rows_affected as usize,
+                Err(e) => {
+                    tracing::warn!(stream_id = %row.stream_id, error = %e, "Failed to insert transcription");
+                    failed += 1;
+                }
+            }
+        }
+    }
+
+    rows.clear();
+    (written, failed)
+}
+
+/// Insert transcriptions with a single multi-row INSERT, returning rows affected
+async fn insert_transcription_batch(
+    db: &Database,
+    rows: &[TranscriptionRow],
+) -> std::result::Result<u64, sqlx::Error> {
+    let query_str = Database::build_batch_insert_query(
+        "data_communication_transcription",
+        TRANSCRIPTION_COLUMNS,
+        "source_stream_id",
+        rows.len(),
+    );
+
+    let mut query = sqlx::query(&query_str);
+    for row in rows {
+        query = query
+            .bind(&row.id)
+            .bind(&row.audio_key)
+            .bind(&row.transcription.text)
+            .bind(&row.transcription.title)
+            .bind(&row.transcription.summary)
+            .bind(&row.transcription.language)
+            .bind(row.duration_seconds)
+            .bind(row.start_time.to_rfc3339())
+            .bind(row.end_time.map(|t| t.to_rfc3339()))
+            .bind(row.transcription.speaker_count)
+            .bind(row.transcription.confidence)
+            .bind(&row.tags_json)
+            .bind(&row.entities_json)
+            .bind(&row.stream_id)
+            .bind("stream_ios_microphone")
+            .bind("ios")
+            .bind("{}");
+    }
+
+    Ok(query.execute(db.pool()).await?.rows_affected())
+}
+
 // Self-registration via inventory
 struct IosMicrophoneTransformRegistration;
 impl crate::sources::base::TransformRegistration for IosMicrophoneTransformRegistration {
@@ -44,7 +44,9 @@ impl PushStream for MacAppsStream {
 
         // source_id is passed from handler - single source of truth, no duplicate DB query
 
-        // Process each record
+        // Validate the whole batch and parse its timestamps up front, then hand
+        // the records to the StreamWriter in one locked call
+        let mut timestamps = Vec::with_capacity(payload.records.len());
         for record in &payload.records {
             // Extract timestamp
             let timestamp = record
@@ -58,16 +60,17 @@ impl PushStream for MacAppsStream {
 
             validate_timestamp_reasonable(timestamp_dt)?;
 
-            // Write to object storage via StreamWriter
-            {
-                let mut writer = self.stream_writer.lock().await;
-                writer.write_record(source_id, "apps", record.clone(), Some(timestamp_dt))?;
-            }
+            timestamps.push(Some(timestamp_dt));
+        }
 
-            result.records_written += 1;
+        // Write to object storage via StreamWriter
+        result.records_written = timestamps.len();
+        {
+            let mut writer = self.stream_writer.lock().await;
+            writer.write_records(source_id, "apps", payload.records.into_iter().zip(timestamps))?;
         }
 
-        tracing::info!(
+        tracing::debug!(
             "Processed {} app records from device {}",
             result.records_written,
             payload.device_id
@@ -66,7 +66,7 @@ impl OntologyTransform for MacAppsTransform {
             .await?;
         let read_duration = read_start.elapsed();
 
-        tracing::info!(
+        tracing::debug!(
             batch_count = batches.len(),
             read_duration_ms = read_duration.as_millis(),
             source_type = ?data_source.source_type(),
@@ -128,7 +128,7 @@ impl OntologyTransform for MacAppsTransform {
         // Sort events by timestamp for sequential processing
         all_events.sort_by_key(|e| e.timestamp);
 
-        tracing::info!(
+        tracing::debug!(
             total_events = all_events.len(),
             "Aggregating app events into usage sessions"
         );
@@ -136,7 +136,7 @@ impl OntologyTransform for MacAppsTransform {
         // Aggregate events into usage sessions
         let sessions = aggregate_app_events_to_sessions(all_events);
 
-        tracing::info!(
+        tracing::debug!(
             session_count = sessions.len(),
             "Created usage sessions from app events"
         );
@@ -154,13 +154,17 @@ impl OntologyTransform for MacAppsTransform {
         let mut batch_insert_count = 0;
         let processing_start = std::time::Instant::now();
 
+        // Load all sessions in one transaction; app focus events are frequent
+        // enough that per-batch commits dominate the insert time
+        let mut tx = db.pool().begin().await?;
+
         for session in sessions {
             last_processed_id = Some(session.stream_id.clone());
 
             pending_records.push((
                 Uuid::new_v4().to_string(),
-                session.app_name.clone(),
-                session.bundle_id.clone(),
+                session.app_name,
+                session.bundle_id,
                 session.start_time,
                 session.end_time,
                 session.stream_id,
@@ -169,12 +173,12 @@ impl OntologyTransform for MacAppsTransform {
             // Execute batch insert when we reach batch size
             if pending_records.len() >= BATCH_SIZE {
                 let insert_start = std::time::Instant::now();
-                let batch_result = execute_app_usage_batch_insert(db, &pending_records).await;
+                let batch_result = execute_app_usage_batch_insert(&mut tx, &pending_records).await;
                 let insert_duration = insert_start.elapsed();
                 batch_insert_total_ms += insert_duration.as_millis();
                 batch_insert_count += 1;
 
-                tracing::info!(
+                tracing::debug!(
                     batch_size = pending_records.len(),
                     insert_duration_ms = insert_duration.as_millis(),
                     "Executed batch insert"
@@ -200,12 +204,12 @@ impl OntologyTransform for MacAppsTransform {
         // Insert any remaining records
         if !pending_records.is_empty() {
             let insert_start = std::time::Instant::now();
-            let batch_result = execute_app_usage_batch_insert(db, &pending_records).await;
+            let batch_result = execute_app_usage_batch_insert(&mut tx, &pending_records).await;
             let insert_duration = insert_start.elapsed();
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -226,6 +230,9 @@ impl OntologyTransform for MacAppsTransform {
             }
         }
 
+        // Commit before touching the checkpoint so it doesn't wait on our write lock
+        tx.commit().await?;
+
         // Update checkpoint after processing all batches
         if let Some(max_ts) = max_batch_timestamp {
             data_source
@@ -340,7 +347,7 @@ fn aggregate_app_events_to_sessions(events: Vec<AppEvent>) -> Vec<AppSession> {
         sessions.push(session);
     }
 
-    tracing::info!(
+    tracing::debug!(
         events_count = events_count,
         sessions_count = sessions.len(),
         "Aggregated app events into sessions"
@@ -351,7 +358,7 @@ fn aggregate_app_events_to_sessions(events: Vec<AppEvent>) -> Vec<AppSession> {
 
 /// Execute batch insert for app usage records
 async fn execute_app_usage_batch_insert(
-    db: &Database,
+    conn: &mut sqlx::SqliteConnection,
     records: &[(String, String, Option<String>, DateTime<Utc>, DateTime<Utc>, String)],
 ) -> Result<usize> {
     if records.is_empty() {
@@ -389,7 +396,7 @@ async fn execute_app_usage_batch_insert(
             .bind("mac");
     }
 
-    let result = query.execute(db.pool()).await?;
+    let result = query.execute(&mut *conn).await?;
     Ok(result.rows_affected() as usize)
 }
 
@@ -544,7 +551,7 @@ impl OntologyTransform for MacBrowserTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -583,7 +590,7 @@ impl OntologyTransform for MacBrowserTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -909,7 +916,7 @@ impl OntologyTransform for MacIMessageTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -948,7 +955,7 @@ impl OntologyTransform for MacIMessageTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
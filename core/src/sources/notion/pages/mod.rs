@@ -3,7 +3,7 @@
 pub mod transform;
 
 use async_trait::async_trait;
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use serde_json::json;
 use sqlx::SqlitePool;
 use std::sync::Arc;
@@ -91,7 +91,7 @@ impl NotionPagesStream {
 
             // Write pages to stream_notion_pages table
             for page in &response.results {
-                match self.upsert_page(page).await {
+                match self.upsert_page(page, started_at).await {
                     Ok(_) => {
                         all_pages.push(page.clone());
                     }
@@ -362,7 +362,7 @@ impl NotionPagesStream {
     }
 
     /// Upsert a page into the database
-    async fn upsert_page(&self, page: &Page) -> Result<()> {
+    async fn upsert_page(&self, page: &Page, synced_at: DateTime<Utc>) -> Result<()> {
         // Extract parent information
         let (parent_type, parent_id) = match &page.parent {
             Parent::Database { database_id } => ("database", Some(database_id.clone())),
@@ -414,7 +414,7 @@ impl NotionPagesStream {
             "content_markdown": content_markdown,
             "content_blocks": content_blocks_json,
             "raw_page": page,
-            "synced_at": Utc::now(),
+            "synced_at": synced_at,
         });
 
         // Write to S3/object storage via StreamWriter
@@ -139,8 +139,7 @@ impl OntologyTransform for NotionPageTransform {
 
                 let properties = record
                     .get("properties")
-                    .cloned()
-                    .unwrap_or(serde_json::Value::Null);
+                    .unwrap_or(&serde_json::Value::Null);
 
                 let content_markdown = record
                     .get("content_markdown")
@@ -148,7 +147,7 @@ impl OntologyTransform for NotionPageTransform {
                     .map(String::from);
 
                 // Extract title from properties (check common title property names)
-                let title = extract_title_from_properties(&properties)
+                let title = extract_title_from_properties(properties)
                     .or_else(|| {
                         // Fallback: extract first heading from content
                         content_markdown
@@ -165,13 +164,14 @@ impl OntologyTransform for NotionPageTransform {
                     _ => "notion_page",
                 };
 
-                // Build metadata with Notion-specific fields
+                // Build metadata with Notion-specific fields. The raw `properties`
+                // blob stays in the lake (reachable via source_stream_id) so the
+                // hot document row only carries narrow lookup fields.
                 let metadata = serde_json::json!({
                     "notion_page_id": page_id,
                     "notion_url": url,
                     "parent_type": parent_type,
                     "parent_id": parent_id,
-                    "properties": properties,
                 });
 
                 // Get source_connection_id for deterministic ID generation
@@ -207,7 +207,7 @@ impl OntologyTransform for NotionPageTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -246,7 +246,7 @@ impl OntologyTransform for NotionPageTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -5,7 +5,7 @@
 pub mod transform;
 
 use async_trait::async_trait;
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use sqlx::SqlitePool;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -75,7 +75,7 @@ impl PlaidAccountsStream {
     /// Load configuration from database
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Load stream config
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'accounts'",
         )
         .bind(source_id)
@@ -83,7 +83,7 @@ impl PlaidAccountsStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = PlaidAccountsConfig::from_json(&config_json) {
+            if let Ok(config) = PlaidAccountsConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -97,7 +97,7 @@ impl PlaidAccountsStream {
         .await?;
 
         if let Some((Some(encrypted_token),)) = token_result {
-            let encryptor = TokenEncryptor::from_env()?;
+            let encryptor = TokenEncryptor::shared()?;
             self.access_token = Some(encryptor.decrypt(&encrypted_token)?);
         }
 
@@ -137,7 +137,7 @@ impl PlaidAccountsStream {
             records_fetched += 1;
 
             match self
-                .write_account(account, &institution_id, &institution_name)
+                .write_account(account, &institution_id, &institution_name, started_at)
                 .await
             {
                 Ok(true) => records_written += 1,
@@ -223,8 +223,8 @@ impl PlaidAccountsStream {
         account: &super::client::Account,
         institution_id: &Option<String>,
         institution_name: &Option<String>,
+        timestamp: DateTime<Utc>,
     ) -> Result<bool> {
-        let timestamp = Utc::now();
 
         // Build the record
         let record = serde_json::json!({
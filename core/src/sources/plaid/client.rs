@@ -11,7 +11,7 @@
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use std::env;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::time::Duration;
 use tokio::sync::Semaphore;
 
@@ -41,7 +41,13 @@ impl PlaidEnvironment {
     }
 }
 
+/// Maximum number of Plaid requests in flight across the whole process
+const MAX_CONCURRENT_REQUESTS: usize = 100;
+
 /// Rate limiter for Plaid API calls
+///
+/// Every limiter shares one process-wide semaphore, so the concurrency cap
+/// holds across all Plaid clients (each stream and API handler builds its own).
 pub struct PlaidRateLimiter {
     global_semaphore: Arc<Semaphore>,
     min_request_interval: Duration,
@@ -49,8 +55,12 @@ pub struct PlaidRateLimiter {
 
 impl PlaidRateLimiter {
     pub fn new() -> Self {
+        static GLOBAL_SEMAPHORE: OnceLock<Arc<Semaphore>> = OnceLock::new();
+
         Self {
-            global_semaphore: Arc::new(Semaphore::new(100)),
+            global_semaphore: GLOBAL_SEMAPHORE
+                .get_or_init(|| Arc::new(Semaphore::new(MAX_CONCURRENT_REQUESTS)))
+                .clone(),
             min_request_interval: Duration::from_millis(50),
         }
     }
@@ -73,6 +83,26 @@ impl Default for PlaidRateLimiter {
     }
 }
 
+/// HTTP client shared by every `PlaidClient`
+///
+/// Clients are built per stream and per API call, so each one used to start
+/// with its own empty connection pool. Cloning the shared client keeps
+/// Tollbooth connections alive across them. A failed build isn't cached.
+fn shared_http_client() -> Result<Client> {
+    static HTTP: OnceLock<Client> = OnceLock::new();
+
+    if let Some(client) = HTTP.get() {
+        return Ok(client.clone());
+    }
+
+    let client = Client::builder()
+        .timeout(Duration::from_secs(120))
+        .build()
+        .map_err(|e| Error::Other(format!("Failed to create HTTP client: {e}")))?;
+
+    Ok(HTTP.get_or_init(|| client).clone())
+}
+
 /// Plaid API client that proxies through Tollbooth
 pub struct PlaidClient {
     http: Client,
@@ -103,13 +133,8 @@ impl PlaidClient {
 
         let environment = PlaidEnvironment::from_env();
 
-        let http = Client::builder()
-            .timeout(Duration::from_secs(120))
-            .build()
-            .map_err(|e| Error::Other(format!("Failed to create HTTP client: {e}")))?;
-
         Ok(Self {
-            http,
+            http: shared_http_client()?,
             environment,
             rate_limiter: PlaidRateLimiter::new(),
             tollbooth_url,
@@ -5,7 +5,7 @@
 pub mod transform;
 
 use async_trait::async_trait;
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use sqlx::SqlitePool;
 use std::collections::HashMap;
 use std::sync::Arc;
@@ -76,7 +76,7 @@ impl PlaidInvestmentsStream {
     /// Load configuration from database
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Load stream config
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'investments'",
         )
         .bind(source_id)
@@ -84,7 +84,7 @@ impl PlaidInvestmentsStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = PlaidInvestmentsConfig::from_json(&config_json) {
+            if let Ok(config) = PlaidInvestmentsConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -98,7 +98,7 @@ impl PlaidInvestmentsStream {
         .await?;
 
         if let Some((Some(encrypted_token),)) = token_result {
-            let encryptor = TokenEncryptor::from_env()?;
+            let encryptor = TokenEncryptor::shared()?;
             self.access_token = Some(encryptor.decrypt(&encrypted_token)?);
         }
 
@@ -142,7 +142,7 @@ impl PlaidInvestmentsStream {
             // Look up the security details
             let security = securities_map.get(&holding.security_id);
 
-            match self.write_holding(holding, security).await {
+            match self.write_holding(holding, security, started_at).await {
                 Ok(true) => records_written += 1,
                 Ok(false) => records_failed += 1,
                 Err(e) => {
@@ -203,8 +203,8 @@ impl PlaidInvestmentsStream {
         &self,
         holding: &super::client::Holding,
         security: Option<&&super::client::Security>,
+        timestamp: DateTime<Utc>,
     ) -> Result<bool> {
-        let timestamp = Utc::now();
 
         // Build the record combining holding and security data
         let record = serde_json::json!({
@@ -5,7 +5,7 @@
 pub mod transform;
 
 use async_trait::async_trait;
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use sqlx::SqlitePool;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -75,7 +75,7 @@ impl PlaidLiabilitiesStream {
     /// Load configuration from database
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Load stream config
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'liabilities'",
         )
         .bind(source_id)
@@ -83,7 +83,7 @@ impl PlaidLiabilitiesStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = PlaidLiabilitiesConfig::from_json(&config_json) {
+            if let Ok(config) = PlaidLiabilitiesConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -97,7 +97,7 @@ impl PlaidLiabilitiesStream {
         .await?;
 
         if let Some((Some(encrypted_token),)) = token_result {
-            let encryptor = TokenEncryptor::from_env()?;
+            let encryptor = TokenEncryptor::shared()?;
             self.access_token = Some(encryptor.decrypt(&encrypted_token)?);
         }
 
@@ -131,7 +131,7 @@ impl PlaidLiabilitiesStream {
         if let Some(credit_cards) = &response.liabilities.credit {
             for credit in credit_cards {
                 records_fetched += 1;
-                match self.write_credit_liability(credit).await {
+                match self.write_credit_liability(credit, started_at).await {
                     Ok(true) => records_written += 1,
                     Ok(false) => records_failed += 1,
                     Err(e) => {
@@ -150,7 +150,7 @@ impl PlaidLiabilitiesStream {
         if let Some(mortgages) = &response.liabilities.mortgage {
             for mortgage in mortgages {
                 records_fetched += 1;
-                match self.write_mortgage_liability(mortgage).await {
+                match self.write_mortgage_liability(mortgage, started_at).await {
                     Ok(true) => records_written += 1,
                     Ok(false) => records_failed += 1,
                     Err(e) => {
@@ -169,7 +169,7 @@ impl PlaidLiabilitiesStream {
         if let Some(student_loans) = &response.liabilities.student {
             for student in student_loans {
                 records_fetched += 1;
-                match self.write_student_loan_liability(student).await {
+                match self.write_student_loan_liability(student, started_at).await {
                     Ok(true) => records_written += 1,
                     Ok(false) => records_failed += 1,
                     Err(e) => {
@@ -228,8 +228,8 @@ impl PlaidLiabilitiesStream {
     async fn write_credit_liability(
         &self,
         credit: &super::client::CreditLiability,
+        timestamp: DateTime<Utc>,
     ) -> Result<bool> {
-        let timestamp = Utc::now();
 
         // Get primary APR if available
         let primary_apr = credit.aprs.first();
@@ -262,8 +262,8 @@ impl PlaidLiabilitiesStream {
     async fn write_mortgage_liability(
         &self,
         mortgage: &super::client::MortgageLiability,
+        timestamp: DateTime<Utc>,
     ) -> Result<bool> {
-        let timestamp = Utc::now();
 
         let record = serde_json::json!({
             "account_id": mortgage.account_id,
@@ -308,8 +308,8 @@ impl PlaidLiabilitiesStream {
     async fn write_student_loan_liability(
         &self,
         student: &super::client::StudentLoanLiability,
+        timestamp: DateTime<Utc>,
     ) -> Result<bool> {
-        let timestamp = Utc::now();
 
         let record = serde_json::json!({
             "account_id": student.account_id,
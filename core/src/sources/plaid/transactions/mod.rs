@@ -6,7 +6,7 @@
 pub mod transform;
 
 use async_trait::async_trait;
-use chrono::Utc;
+use chrono::{DateTime, Utc};
 use sqlx::SqlitePool;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -75,7 +75,7 @@ impl PlaidTransactionsStream {
     /// Load configuration from database
     async fn load_config_internal(&mut self, db: &SqlitePool, source_id: &str) -> Result<()> {
         // Load stream config
-        let result = sqlx::query_as::<_, (serde_json::Value,)>(
+        let result = sqlx::query_as::<_, (String,)>(
             "SELECT config FROM elt_stream_connections WHERE source_connection_id = $1 AND stream_name = 'transactions'",
         )
         .bind(source_id)
@@ -83,7 +83,7 @@ impl PlaidTransactionsStream {
         .await?;
 
         if let Some((config_json,)) = result {
-            if let Ok(config) = PlaidTransactionsConfig::from_json(&config_json) {
+            if let Ok(config) = PlaidTransactionsConfig::from_json_str(&config_json) {
                 self.config = config;
             }
         }
@@ -98,7 +98,7 @@ impl PlaidTransactionsStream {
 
         if let Some((Some(encrypted_token),)) = token_result {
             // Decrypt the access token
-            let encryptor = TokenEncryptor::from_env()?;
+            let encryptor = TokenEncryptor::shared()?;
             self.access_token = Some(encryptor.decrypt(&encrypted_token)?);
         }
 
@@ -127,9 +127,6 @@ impl PlaidTransactionsStream {
         #[allow(unused_assignments)]
         let mut next_cursor = None;
 
-        // Start database transaction
-        let mut tx = self.db.begin().await?;
-
         // Get last sync cursor from database
         let cursor = match sync_mode {
             SyncMode::FullRefresh => {
@@ -150,6 +147,8 @@ impl PlaidTransactionsStream {
 
         // Loop until has_more is false
         let mut current_cursor = cursor.clone();
+        // Soft-deletes are applied together with the cursor once every page is fetched
+        let mut removed_ontology_ids = Vec::new();
 
         loop {
             tracing::debug!(cursor = ?current_cursor, "Fetching transactions batch");
@@ -167,7 +166,7 @@ impl PlaidTransactionsStream {
             for transaction in &response.added {
                 records_fetched += 1;
 
-                match self.write_transaction(transaction, &mut tx).await {
+                match self.write_transaction(transaction, started_at).await {
                     Ok(true) => records_written += 1,
                     Ok(false) => records_failed += 1,
                     Err(e) => {
@@ -185,7 +184,7 @@ impl PlaidTransactionsStream {
             for transaction in &response.modified {
                 records_fetched += 1;
 
-                match self.write_transaction(transaction, &mut tx).await {
+                match self.write_transaction(transaction, started_at).await {
                     Ok(true) => records_written += 1,
                     Ok(false) => records_failed += 1,
                     Err(e) => {
@@ -205,14 +204,7 @@ impl PlaidTransactionsStream {
                 
                 // Soft-delete in ontology table (data_financial_transaction)
                 // Use the same deterministic ID generation as the transform
-                let ontology_id = crate::ids::generate_id(crate::ids::MONEY_TRANSACTION_PREFIX, &[&self.source_id, &removed.transaction_id]);
-                sqlx::query(
-                    "UPDATE data_financial_transaction SET deleted_at_source = datetime('now'), updated_at = datetime('now') WHERE id = $1"
-                )
-                .bind(&ontology_id)
-                .execute(&mut *tx)
-                .await
-                .ok(); // Ignore errors if record doesn't exist
+                removed_ontology_ids.push(crate::ids::generate_id(crate::ids::MONEY_TRANSACTION_PREFIX, &[&self.source_id, &removed.transaction_id]));
             }
 
             // Check if there's more data
@@ -231,14 +223,25 @@ impl PlaidTransactionsStream {
                     total_written = records_written,
                     "Sync complete, saving cursor"
                 );
-                self.save_cursor_with_tx(&response.next_cursor, &mut tx)
-                    .await?;
                 next_cursor = Some(response.next_cursor);
                 break;
             }
         }
 
-        // Commit transaction
+        // Transaction scoped tightly to avoid holding a connection during network I/O
+        let mut tx = self.db.begin().await?;
+        for ontology_id in &removed_ontology_ids {
+            sqlx::query(
+                "UPDATE data_financial_transaction SET deleted_at_source = datetime('now'), updated_at = datetime('now') WHERE id = $1"
+            )
+            .bind(ontology_id)
+            .execute(&mut *tx)
+            .await
+            .ok(); // Ignore errors if record doesn't exist
+        }
+        if let Some(ref cursor) = next_cursor {
+            self.save_cursor_with_tx(cursor, &mut tx).await?;
+        }
         tx.commit().await?;
 
         let completed_at = Utc::now();
@@ -278,14 +281,14 @@ impl PlaidTransactionsStream {
     async fn write_transaction(
         &self,
         transaction: &super::client::Transaction,
-        _tx: &mut sqlx::Transaction<'_, sqlx::Sqlite>,
+        synced_at: DateTime<Utc>,
     ) -> Result<bool> {
         // Parse transaction date (it's a string in YYYY-MM-DD format)
         let timestamp = chrono::NaiveDate::parse_from_str(&transaction.date, "%Y-%m-%d")
             .ok()
             .and_then(|d| d.and_hms_opt(12, 0, 0))
             .map(|dt| dt.and_utc())
-            .unwrap_or_else(Utc::now);
+            .unwrap_or(synced_at);
 
         // Build the record
         let record = serde_json::json!({
@@ -314,7 +317,7 @@ impl PlaidTransactionsStream {
             "payment_meta": transaction.payment_meta,
             "category": transaction.category,
             "category_id": transaction.category_id,
-            "synced_at": Utc::now(),
+            "synced_at": synced_at,
         });
 
         // Write to StreamWriter
@@ -5,6 +5,7 @@
 
 use async_trait::async_trait;
 use chrono::{DateTime, NaiveDate, Utc};
+use std::collections::HashSet;
 use uuid::Uuid;
 
 use crate::database::Database;
@@ -312,6 +313,10 @@ struct TransactionRecord {
 }
 
 /// Execute batch insert for transaction records with fallback to individual inserts
+///
+/// A batch that trips the account foreign key (transactions synced ahead of
+/// their accounts) gets its stub accounts created in one grouped insert and is
+/// retried as a whole; only a batch that still fails is replayed row by row.
 async fn execute_transaction_batch_insert(
     db: &Database,
     records: &[TransactionRecord],
@@ -320,6 +325,53 @@ async fn execute_transaction_batch_insert(
         return Ok(0);
     }
 
+    let batch_err = match insert_transaction_batch(db, records).await {
+        Ok(written) => return Ok(written),
+        Err(e) => e,
+    };
+
+    let error_str = batch_err.to_string();
+    if error_str.contains("FOREIGN KEY constraint failed") || error_str.contains("787") {
+        tracing::info!(
+            batch_size = records.len(),
+            "Batch references missing accounts, creating stubs for lazy hydration"
+        );
+
+        match create_stub_accounts(db, records).await {
+            Ok(_) => match insert_transaction_batch(db, records).await {
+                Ok(written) => return Ok(written),
+                Err(retry_err) => {
+                    tracing::warn!(
+                        batch_size = records.len(),
+                        error = %retry_err,
+                        "Batch insert failed after stub account creation, falling back to individual inserts"
+                    );
+                }
+            },
+            Err(stub_err) => {
+                tracing::warn!(
+                    batch_size = records.len(),
+                    error = %stub_err,
+                    "Failed to create stub accounts, falling back to individual inserts"
+                );
+            }
+        }
+    } else {
+        tracing::warn!(
+            batch_size = records.len(),
+            error = %batch_err,
+            "Batch insert failed, falling back to individual inserts"
+        );
+    }
+
+    execute_transaction_individual_inserts(db, records).await
+}
+
+/// Insert all transaction records with a single multi-row INSERT
+async fn insert_transaction_batch(
+    db: &Database,
+    records: &[TransactionRecord],
+) -> std::result::Result<usize, sqlx::Error> {
     let query_str = Database::build_batch_insert_query(
         "data_financial_transaction",
         &[
@@ -367,18 +419,8 @@ async fn execute_transaction_batch_insert(
             .bind("plaid");
     }
 
-    match query.execute(db.pool()).await {
-        Ok(result) => Ok(result.rows_affected() as usize),
-        Err(batch_err) => {
-            // Batch failed - fall back to individual inserts
-            tracing::warn!(
-                batch_size = records.len(),
-                error = %batch_err,
-                "Batch insert failed, falling back to individual inserts"
-            );
-            execute_transaction_individual_inserts(db, records).await
-        }
-    }
+    let result = query.execute(db.pool()).await?;
+    Ok(result.rows_affected() as usize)
 }
 
 /// Fallback: insert records one by one when batch fails
@@ -496,13 +538,27 @@ async fn insert_single_transaction(
     Ok(())
 }
 
-/// Create a stub account for lazy hydration
-/// This creates a minimal account record that will be "hydrated" with full details
-/// when the accounts sync runs.
-async fn create_stub_account(
-    db: &Database,
-    transaction: &TransactionRecord,
-) -> std::result::Result<(), sqlx::Error> {
+/// Columns of a stub account row, in bind order
+const STUB_ACCOUNT_COLUMNS: &[&str] = &[
+    "id",
+    "account_name",
+    "account_type",
+    "currency",
+    "source_stream_id",
+    "source_connection_id",
+    "metadata",
+    "source_table",
+    "source_provider",
+];
+
+type SqliteQuery<'q> = sqlx::query::Query<'q, sqlx::Sqlite, sqlx::sqlite::SqliteArguments<'q>>;
+
+/// Bind one stub account row for the account a transaction references
+fn bind_stub_account<'q>(
+    query: SqliteQuery<'q>,
+    transaction: &'q TransactionRecord,
+    stub_created_at: &str,
+) -> SqliteQuery<'q> {
     // Extract the Plaid account ID from metadata for the stub name
     let plaid_account_id = transaction.metadata
         .get("plaid_account_id")
@@ -511,31 +567,76 @@ async fn create_stub_account(
 
     let stub_metadata = serde_json::json!({
         "is_stub": true,
-        "stub_created_at": chrono::Utc::now().to_rfc3339(),
+        "stub_created_at": stub_created_at,
         "plaid_account_id": plaid_account_id,
         "stub_reason": "Created during transaction sync (lazy hydration)"
     });
 
-    sqlx::query(
-        r#"
-        INSERT INTO data_financial_account (
-            id, account_name, account_type, currency, source_stream_id,
-            source_connection_id, metadata, source_table, source_provider
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-        ON CONFLICT (id) DO NOTHING
-        "#,
-    )
-    .bind(&transaction.account_id)
-    .bind(format!("Pending Account ({})", &plaid_account_id[..plaid_account_id.len().min(8)]))
-    .bind("unknown")
-    .bind(&transaction.currency_code)
-    .bind(transaction.stream_id)
-    .bind(&transaction.source_connection_id)
-    .bind(stub_metadata)
-    .bind("stub")
-    .bind("plaid")
-    .execute(db.pool())
-    .await?;
+    query
+        .bind(&transaction.account_id)
+        .bind(format!("Pending Account ({})", &plaid_account_id[..plaid_account_id.len().min(8)]))
+        .bind("unknown")
+        .bind(&transaction.currency_code)
+        .bind(transaction.stream_id)
+        .bind(&transaction.source_connection_id)
+        .bind(stub_metadata)
+        .bind("stub")
+        .bind("plaid")
+}
+
+/// Create stub accounts for every distinct account referenced by a batch
+///
+/// Uses one multi-row `INSERT ... ON CONFLICT DO NOTHING`, so accounts that
+/// already exist (stub or hydrated) are left untouched.
+async fn create_stub_accounts(
+    db: &Database,
+    transactions: &[TransactionRecord],
+) -> std::result::Result<usize, sqlx::Error> {
+    let mut seen = HashSet::new();
+    let stubs: Vec<&TransactionRecord> = transactions
+        .iter()
+        .filter(|t| seen.insert(t.account_id.as_str()))
+        .collect();
+
+    let query_str = Database::build_batch_insert_query(
+        "data_financial_account",
+        STUB_ACCOUNT_COLUMNS,
+        "id",
+        stubs.len(),
+    );
+
+    let stub_created_at = chrono::Utc::now().to_rfc3339();
+    let mut query = sqlx::query(&query_str);
+
+    for transaction in &stubs {
+        query = bind_stub_account(query, transaction, &stub_created_at);
+    }
+
+    let result = query.execute(db.pool()).await?;
+
+    tracing::info!(
+        stub_accounts = result.rows_affected(),
+        referenced_accounts = stubs.len(),
+        "Created stub accounts for lazy hydration"
+    );
+
+    Ok(result.rows_affected() as usize)
+}
+
+/// Create a stub account for lazy hydration
+/// This creates a minimal account record that will be "hydrated" with full details
+/// when the accounts sync runs.
+async fn create_stub_account(
+    db: &Database,
+    transaction: &TransactionRecord,
+) -> std::result::Result<(), sqlx::Error> {
+    let query_str =
+        Database::build_batch_insert_query("data_financial_account", STUB_ACCOUNT_COLUMNS, "id", 1);
+
+    let stub_created_at = chrono::Utc::now().to_rfc3339();
+    bind_stub_account(sqlx::query(&query_str), transaction, &stub_created_at)
+        .execute(db.pool())
+        .await?;
 
     tracing::info!(
         account_id = %transaction.account_id,
@@ -160,7 +160,7 @@ impl StravaActivitiesStream {
                     "suffer_score": activity.suffer_score,
                     "gear_id": activity.gear_id,
                     "map": activity.map,
-                    "synced_at": Utc::now(),
+                    "synced_at": started_at,
                 });
 
                 let event_ts = activity.start_date.parse::<DateTime<Utc>>().ok();
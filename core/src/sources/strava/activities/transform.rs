@@ -5,6 +5,7 @@
 
 use async_trait::async_trait;
 use chrono::{DateTime, Duration, Utc};
+use serde::Deserialize;
 use uuid::Uuid;
 
 use crate::database::Database;
@@ -15,6 +16,40 @@ use crate::sources::base::{OntologyTransform, TransformRegistration, TransformRe
 /// Batch size for bulk inserts
 const BATCH_SIZE: usize = 500;
 
+/// Fields of a stream_strava_activities record read by the transform
+///
+/// Deserialized once per record (borrowing strings from the stream record)
+/// instead of looking each key up in the JSON map separately.
+#[derive(Deserialize)]
+struct ActivityRecord<'a> {
+    activity_id: Option<i64>,
+    #[serde(borrow)]
+    id: Option<&'a str>,
+    #[serde(borrow)]
+    sport_type: Option<&'a str>,
+    #[serde(borrow)]
+    start_date: Option<&'a str>,
+    elapsed_time: Option<i64>,
+    kilojoules: Option<f64>,
+    distance: Option<f64>,
+    average_heartrate: Option<f64>,
+    max_heartrate: Option<f64>,
+    // Passed through to metadata unchanged
+    name: Option<serde_json::Value>,
+    activity_type: Option<serde_json::Value>,
+    total_elevation_gain: Option<serde_json::Value>,
+    average_speed: Option<serde_json::Value>,
+    max_speed: Option<serde_json::Value>,
+    suffer_score: Option<serde_json::Value>,
+    gear_id: Option<serde_json::Value>,
+    map: Option<ActivityMap>,
+}
+
+#[derive(Deserialize)]
+struct ActivityMap {
+    summary_polyline: Option<serde_json::Value>,
+}
+
 /// Transform Strava activities to health_workout ontology
 ///
 /// This transform is registered with the stream in the unified registry,
@@ -75,7 +110,7 @@ impl OntologyTransform for StravaWorkoutTransform {
         // Batch insert configuration
         let mut pending_records: Vec<(
             String,         // id (deterministic)
-            String,         // workout_type
+            &str,           // workout_type
             Option<i32>,    // duration_minutes
             Option<i32>,    // calories_burned
             Option<i32>,    // avg_heart_rate
@@ -92,43 +127,45 @@ impl OntologyTransform for StravaWorkoutTransform {
 
         let processing_start = std::time::Instant::now();
 
-        for batch in batches {
+        // Batches stay alive for the whole run so queued rows can borrow
+        // strings from their records
+        for batch in &batches {
             tracing::debug!(batch_record_count = batch.records.len(), "Processing batch");
 
             for record in &batch.records {
                 records_read += 1;
 
+                let activity = match ActivityRecord::deserialize(record) {
+                    Ok(activity) => activity,
+                    Err(e) => {
+                        tracing::warn!(error = %e, "Skipping malformed Strava activity record");
+                        records_failed += 1;
+                        continue;
+                    }
+                };
+
                 // Extract the Strava activity ID
-                let Some(activity_id) = record.get("activity_id").and_then(|v| v.as_i64()) else {
+                let Some(activity_id) = activity.activity_id else {
                     records_failed += 1;
                     continue;
                 };
 
-                let stream_id = record
-                    .get("id")
-                    .and_then(|v| v.as_str())
+                let stream_id = activity
+                    .id
                     .map(|s| s.to_string())
                     .unwrap_or_else(|| Uuid::new_v4().to_string());
 
                 // sport_type -> workout_type (direct string mapping)
-                let workout_type = record
-                    .get("sport_type")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("Unknown")
-                    .to_string();
+                let workout_type = activity.sport_type.unwrap_or("Unknown");
 
                 // start_date -> start_time (ISO 8601 parse)
-                let start_time = record
-                    .get("start_date")
-                    .and_then(|v| v.as_str())
+                let start_time = activity
+                    .start_date
                     .and_then(|s| s.parse::<DateTime<Utc>>().ok())
                     .unwrap_or_else(|| Utc::now());
 
                 // elapsed_time -> duration_minutes (seconds / 60)
-                let elapsed_time = record
-                    .get("elapsed_time")
-                    .and_then(|v| v.as_i64())
-                    .unwrap_or(0);
+                let elapsed_time = activity.elapsed_time.unwrap_or(0);
 
                 let duration_minutes = Some((elapsed_time as f64 / 60.0).round() as i32);
 
@@ -136,41 +173,30 @@ impl OntologyTransform for StravaWorkoutTransform {
                 let end_time = start_time + Duration::seconds(elapsed_time);
 
                 // kilojoules -> calories_burned (kJ * 0.239 = kcal)
-                let calories_burned = record
-                    .get("kilojoules")
-                    .and_then(|v| v.as_f64())
+                let calories_burned = activity
+                    .kilojoules
                     .map(|kj| (kj * 0.239).round() as i32);
 
                 // distance -> distance_km (meters / 1000)
-                let distance_km = record
-                    .get("distance")
-                    .and_then(|v| v.as_f64())
-                    .map(|m| m / 1000.0);
+                let distance_km = activity.distance.map(|m| m / 1000.0);
 
                 // average_heartrate -> avg_heart_rate (round to int)
-                let avg_heart_rate = record
-                    .get("average_heartrate")
-                    .and_then(|v| v.as_f64())
-                    .map(|hr| hr.round() as i32);
+                let avg_heart_rate = activity.average_heartrate.map(|hr| hr.round() as i32);
 
                 // max_heartrate -> max_heart_rate (round to int)
-                let max_heart_rate = record
-                    .get("max_heartrate")
-                    .and_then(|v| v.as_f64())
-                    .map(|hr| hr.round() as i32);
+                let max_heart_rate = activity.max_heartrate.map(|hr| hr.round() as i32);
 
                 // Build metadata with Strava-specific fields
                 let metadata = serde_json::json!({
                     "strava_activity_id": activity_id,
-                    "name": record.get("name"),
-                    "activity_type": record.get("activity_type"),
-                    "total_elevation_gain": record.get("total_elevation_gain"),
-                    "average_speed": record.get("average_speed"),
-                    "max_speed": record.get("max_speed"),
-                    "suffer_score": record.get("suffer_score"),
-                    "gear_id": record.get("gear_id"),
-                    "summary_polyline": record.get("map")
-                        .and_then(|m| m.get("summary_polyline")),
+                    "name": activity.name,
+                    "activity_type": activity.activity_type,
+                    "total_elevation_gain": activity.total_elevation_gain,
+                    "average_speed": activity.average_speed,
+                    "max_speed": activity.max_speed,
+                    "suffer_score": activity.suffer_score,
+                    "gear_id": activity.gear_id,
+                    "summary_polyline": activity.map.and_then(|m| m.summary_polyline),
                     "source_connection_id": source_id,
                 });
 
@@ -207,7 +233,7 @@ impl OntologyTransform for StravaWorkoutTransform {
                     batch_insert_total_ms += insert_duration.as_millis();
                     batch_insert_count += 1;
 
-                    tracing::info!(
+                    tracing::debug!(
                         batch_size = pending_records.len(),
                         insert_duration_ms = insert_duration.as_millis(),
                         "Executed batch insert"
@@ -247,7 +273,7 @@ impl OntologyTransform for StravaWorkoutTransform {
             batch_insert_total_ms += insert_duration.as_millis();
             batch_insert_count += 1;
 
-            tracing::info!(
+            tracing::debug!(
                 batch_size = pending_records.len(),
                 insert_duration_ms = insert_duration.as_millis(),
                 "Executed final batch insert"
@@ -303,7 +329,7 @@ async fn execute_workout_batch_insert(
     source_connection_id: &str,
     records: &[(
         String,         // id (deterministic)
-        String,         // workout_type
+        &str,           // workout_type
         Option<i32>,    // duration_minutes
         Option<i32>,    // calories_burned
         Option<i32>,    // avg_heart_rate
@@ -363,7 +389,7 @@ async fn execute_workout_batch_insert(
     {
         query = query
             .bind(id)
-            .bind(workout_type)
+            .bind(*workout_type)
             .bind(duration_minutes)
             .bind(calories_burned)
             .bind(avg_heart_rate)
@@ -9,6 +9,7 @@ use std::sync::Arc;
 
 use async_trait::async_trait;
 use serde::{Deserialize, Serialize};
+use tokio::io::{AsyncBufReadExt, AsyncRead, BufReader};
 
 pub use s3::{S3Config, S3Storage};
 
@@ -20,6 +21,8 @@ pub trait StorageBackend: Send + Sync {
     async fn initialize(&self) -> Result<()>;
     async fn upload(&self, key: &str, data: Vec<u8>) -> Result<()>;
     async fn download(&self, key: &str) -> Result<Vec<u8>>;
+    /// Open an object for incremental reads instead of buffering it whole
+    async fn download_reader(&self, key: &str) -> Result<Box<dyn AsyncRead + Send + Unpin>>;
     async fn delete(&self, key: &str) -> Result<()>;
     async fn list(&self, prefix: &str) -> Result<Vec<String>>;
     async fn list_with_pagination(
@@ -101,6 +104,14 @@ impl Storage {
         self.backend.download(key).await
     }
 
+    /// Open an object for incremental reads
+    ///
+    /// Prefer this over `download` for large objects that can be consumed
+    /// as they arrive, so the whole payload is never held in memory at once.
+    pub async fn download_reader(&self, key: &str) -> Result<Box<dyn AsyncRead + Send + Unpin>> {
+        self.backend.download_reader(key).await
+    }
+
     pub async fn delete(&self, key: &str) -> Result<()> {
         self.backend.delete(key).await
     }
@@ -140,34 +151,33 @@ impl Storage {
     }
 
     /// Upload JSONL (newline-delimited JSON) from a vector of objects
-    pub async fn upload_jsonl<T: Serialize>(&self, key: &str, records: &[T]) -> Result<()> {
+    ///
+    /// Returns the size of the uploaded object in bytes, so callers that
+    /// record object sizes don't have to serialize the records a second time.
+    pub async fn upload_jsonl<T: Serialize>(&self, key: &str, records: &[T]) -> Result<usize> {
         let mut jsonl = Vec::new();
         for record in records {
-            let json = serde_json::to_string(record)
+            serde_json::to_writer(&mut jsonl, record)
                 .map_err(|e| Error::Other(format!("Failed to serialize record: {}", e)))?;
-            jsonl.extend_from_slice(json.as_bytes());
             jsonl.push(b'\n');
         }
-        self.upload(key, jsonl).await
+        let size_bytes = jsonl.len();
+        self.upload(key, jsonl).await?;
+        Ok(size_bytes)
     }
 
     /// Download and parse JSONL (newline-delimited JSON) into a vector
+    ///
+    /// The object is streamed and parsed line by line as it arrives, so peak
+    /// memory is the parsed records plus one line rather than the raw payload
+    /// as well. serde_json validates UTF-8 as it parses each line.
     pub async fn download_jsonl<T: for<'de> Deserialize<'de>>(&self, key: &str) -> Result<Vec<T>> {
-        let bytes = self.download(key).await?;
-        let text = String::from_utf8(bytes)
-            .map_err(|e| Error::Other(format!("Invalid UTF-8 in JSONL: {}", e)))?;
+        let mut lines = JsonlLines::new(self.download_reader(key).await?);
 
         let mut records = Vec::new();
-        for (line_num, line) in text.lines().enumerate() {
-            if line.trim().is_empty() {
-                continue;
-            }
-            let record = serde_json::from_str(line).map_err(|e| {
-                Error::Other(format!(
-                    "Failed to parse JSONL line {}: {}",
-                    line_num + 1,
-                    e
-                ))
+        while let Some((line_num, line)) = lines.next_line().await? {
+            let record = serde_json::from_slice(line).map_err(|e| {
+                Error::Other(format!("Failed to parse JSONL line {}: {}", line_num, e))
             })?;
             records.push(record);
         }
@@ -175,6 +185,43 @@ impl Storage {
     }
 }
 
+/// Read buffer for streamed JSONL objects
+const JSONL_READ_BUFFER_SIZE: usize = 1024 * 1024;
+
+/// Incremental reader over the non-blank lines of a JSONL object
+///
+/// Reuses a single line buffer, so callers can parse each record as soon as
+/// its bytes arrive.
+pub struct JsonlLines {
+    reader: BufReader<Box<dyn AsyncRead + Send + Unpin>>,
+    line: Vec<u8>,
+    line_num: usize,
+}
+
+impl JsonlLines {
+    pub fn new(reader: Box<dyn AsyncRead + Send + Unpin>) -> Self {
+        Self {
+            reader: BufReader::with_capacity(JSONL_READ_BUFFER_SIZE, reader),
+            line: Vec::new(),
+            line_num: 0,
+        }
+    }
+
+    /// Next non-blank line with its 1-based line number, or None at EOF
+    pub async fn next_line(&mut self) -> Result<Option<(usize, &[u8])>> {
+        loop {
+            self.line.clear();
+            if self.reader.read_until(b'\n', &mut self.line).await? == 0 {
+                return Ok(None);
+            }
+            self.line_num += 1;
+            if !self.line.iter().all(u8::is_ascii_whitespace) {
+                return Ok(Some((self.line_num, &self.line)));
+            }
+        }
+    }
+}
+
 /// File storage backend
 struct FileStorage {
     base_path: PathBuf,
@@ -213,6 +260,11 @@ impl StorageBackend for FileStorage {
         Ok(tokio::fs::read(path).await?)
     }
 
+    async fn download_reader(&self, key: &str) -> Result<Box<dyn AsyncRead + Send + Unpin>> {
+        let path = self.base_path.join(key);
+        Ok(Box::new(tokio::fs::File::open(path).await?))
+    }
+
     async fn delete(&self, key: &str) -> Result<()> {
         let path = self.base_path.join(key);
         tokio::fs::remove_file(path).await?;
@@ -347,10 +399,11 @@ mod tests {
         ];
 
         // Upload JSONL
-        storage
+        let size_bytes = storage
             .upload_jsonl("records.jsonl", &records)
             .await
             .unwrap();
+        assert_eq!(size_bytes, storage.download("records.jsonl").await.unwrap().len());
 
         // Download JSONL
         let downloaded_records: Vec<TestRecord> =
@@ -360,6 +413,21 @@ mod tests {
         assert_eq!(records, downloaded_records);
     }
 
+    #[tokio::test]
+    async fn test_download_jsonl_skips_blank_lines() {
+        let temp_dir = TempDir::new().unwrap();
+        let storage = Storage::file(temp_dir.path().to_str().unwrap().to_string()).unwrap();
+
+        storage.initialize().await.unwrap();
+
+        // Blank lines, CRLF endings and no trailing newline
+        let data = b"{\"id\":1}\r\n\n  \n{\"id\":2}".to_vec();
+        storage.upload("sparse.jsonl", data).await.unwrap();
+
+        let records: Vec<serde_json::Value> = storage.download_jsonl("sparse.jsonl").await.unwrap();
+        assert_eq!(records, vec![serde_json::json!({"id": 1}), serde_json::json!({"id": 2})]);
+    }
+
     #[tokio::test]
     async fn test_nested_directories() {
         let temp_dir = TempDir::new().unwrap();
@@ -288,7 +288,12 @@ impl StorageBackend for S3Storage {
             .map_err(|e| Error::Storage(format!("Failed to read S3 response body: {}", e)))?
             .into_bytes();
 
-        Ok(bytes.to_vec())
+        // Reuses the buffer when uniquely owned instead of copying it
+        Ok(Vec::from(bytes))
+    }
+
+    async fn download_reader(&self, key: &str) -> Result<Box<dyn AsyncRead + Send + Unpin>> {
+        Ok(Box::new(S3Storage::download_reader(self, key).await?))
     }
 
     async fn delete(&self, key: &str) -> Result<()> {
@@ -81,6 +81,29 @@ impl StreamWriter {
         Ok(())
     }
 
+    /// Write a batch of records to in-memory buffer
+    ///
+    /// Equivalent to calling `write_record` for each record, but resolves the
+    /// stream buffer once for the whole batch.
+    pub fn write_records<I>(&mut self, source_id: &str, stream_name: &str, records: I) -> Result<()>
+    where
+        I: IntoIterator<Item = (Value, Option<DateTime<Utc>>)>,
+    {
+        let buffer_key = format!("{}:{}", source_id, stream_name);
+
+        let buffer = self
+            .buffers
+            .entry(buffer_key)
+            .or_insert_with(StreamBuffer::new);
+
+        let records = records.into_iter();
+        buffer.records.reserve(records.size_hint().0);
+        for (record, timestamp) in records {
+            buffer.add_record(record, timestamp);
+        }
+        Ok(())
+    }
+
     /// Collect all buffered records for a stream and clear the buffer
     ///
     /// Returns: (records, min_timestamp, max_timestamp)
@@ -146,6 +169,29 @@ mod tests {
         assert_eq!(writer.buffer_count(source_id, stream_name), 0);
     }
 
+    #[test]
+    fn test_write_records_batch() {
+        let mut writer = StreamWriter::new();
+        let source_id = "test-source";
+        let stream_name = "test_stream";
+
+        let ts1 = Utc::now();
+        let ts2 = ts1 + chrono::Duration::hours(1);
+
+        writer
+            .write_records(
+                source_id,
+                stream_name,
+                vec![(json!({"value": 1}), Some(ts2)), (json!({"value": 2}), Some(ts1))],
+            )
+            .unwrap();
+
+        let (records, min, max) = writer.collect_records(source_id, stream_name).unwrap();
+        assert_eq!(records.len(), 2);
+        assert_eq!(min, Some(ts1));
+        assert_eq!(max, Some(ts2));
+    }
+
     #[test]
     fn test_timestamp_tracking() {
         let mut writer = StreamWriter::new();
@@ -3,7 +3,7 @@
 //! Provides read-only SQL access to user's personal data tables.
 
 use serde::{Deserialize, Serialize};
-use sqlx::{Column, Row, SqlitePool, TypeInfo};
+use sqlx::{Column, Row, SqlitePool, TypeInfo, ValueRef};
 use std::collections::HashMap;
 use std::sync::Arc;
 
@@ -519,8 +519,12 @@ impl SqlQueryTool {
 }
 
 /// Convert SQLite rows to JSON array
+///
+/// Dispatches on each value's SQLite storage class (NULL, INTEGER, REAL,
+/// TEXT, BLOB) and decodes it once, instead of probing candidate Rust types
+/// with `try_get` until one succeeds.
 fn convert_rows_to_json(rows: &[sqlx::sqlite::SqliteRow]) -> Vec<serde_json::Value> {
-    let mut json_rows = Vec::new();
+    let mut json_rows = Vec::with_capacity(rows.len());
 
     for row in rows {
         let mut obj = serde_json::Map::new();
@@ -528,37 +532,26 @@ fn convert_rows_to_json(rows: &[sqlx::sqlite::SqliteRow]) -> Vec<serde_json::Val
         for (i, col) in row.columns().iter().enumerate() {
             let col_name = col.name();
 
-            let value: serde_json::Value = 
-                // Try NULL first
-                if let Ok(opt_val) = row.try_get::<Option<String>, _>(i) {
-                    match opt_val {
-                        Some(v) => serde_json::Value::String(v),
-                        None => serde_json::Value::Null,
-                    }
-                }
-                // Integer types
-                else if let Ok(v) = row.try_get::<i64, _>(i) {
-                    serde_json::Value::Number(v.into())
-                } else if let Ok(v) = row.try_get::<i32, _>(i) {
-                    serde_json::Value::Number(v.into())
-                }
-                // Float types
-                else if let Ok(v) = row.try_get::<f64, _>(i) {
-                    serde_json::json!(v)
-                }
-                // Boolean
-                else if let Ok(v) = row.try_get::<bool, _>(i) {
-                    serde_json::Value::Bool(v)
-                }
-                // JSON
-                else if let Ok(v) = row.try_get::<serde_json::Value, _>(i) {
-                    v
-                }
-                // Fallback
-                else {
-                    let type_info = col.type_info().name();
-                    serde_json::Value::String(format!("<{}>", type_info))
-                };
+            let value = match row.try_get_raw(i) {
+                Ok(raw) if raw.is_null() => serde_json::Value::Null,
+                Ok(raw) => match raw.type_info().name() {
+                    "INTEGER" => row
+                        .try_get::<i64, _>(i)
+                        .map(|v| serde_json::Value::Number(v.into()))
+                        .unwrap_or(serde_json::Value::Null),
+                    "REAL" => row
+                        .try_get::<f64, _>(i)
+                        .map(|v| serde_json::json!(v))
+                        .unwrap_or(serde_json::Value::Null),
+                    "TEXT" => row
+                        .try_get::<String, _>(i)
+                        .map(serde_json::Value::String)
+                        .unwrap_or(serde_json::Value::Null),
+                    // BLOBs aren't representable as JSON
+                    _ => serde_json::Value::String(format!("<{}>", col.type_info().name())),
+                },
+                Err(_) => serde_json::Value::String(format!("<{}>", col.type_info().name())),
+            };
 
             obj.insert(col_name.to_string(), value);
         }
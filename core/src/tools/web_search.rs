@@ -152,7 +152,7 @@ impl WebSearchTool {
         };
 
         // Execute request
-        let client = reqwest::Client::new();
+        let client = crate::http_client::shared_client();
         let response = tollbooth::with_system_auth(
             client.post(format!("{}/v1/services/exa/search", self.tollbooth_url)),
             &self.tollbooth_secret,